@@ -10,20 +10,29 @@ title = 'ME Analyzer v1.100.0'
 
 import os
 import re
+import io
 import sys
 import lzma
 import zlib
+import mmap
 import json
+import atexit
 import struct
+import bisect
 import ctypes
 import shutil
+import pickle
 import hashlib
 import inspect
-import crccheck
+import binascii
 import colorama
 import itertools
 import traceback
+import contextlib
 import prettytable
+import collections
+import multiprocessing
+import concurrent.futures
 
 # Initialize and setup Colorama
 colorama.init()
@@ -75,6 +84,14 @@ def mea_help() :
 	text += "-skip   : Skips welcome & options screen\n"
 	text += "-exit   : Skips Press enter to exit prompt\n"
 	text += "-mass   : Scans all files of a given directory\n"
+	text += "-mass D : Scans all files of directory D without prompts\n"
+	text += "-probe  : Skips -mass files without Engine firmware markers\n"
+	text += "-size R : Skips -mass files outside of byte range R (A:B, A: or :B)\n"
+	text += "-ext L  : Scans -mass files with extensions of list L only\n"
+	text += "-noext L: Skips -mass files with extensions of list L\n"
+	text += "-jobs N : Analyzes files at N parallel processes\n"
+	text += "-store D: Shares identical unpacked CSE modules via folder D\n"
+	text += "-cache D: Reuses results of unchanged files via folder D\n"
 	text += "-pdb    : Writes input file DB entry to text file\n"
 	text += "-dbname : Renames input file based on unique DB name\n"
 	text += "-dfpt   : Shows $FPT, BPDT and/or CSE Layout Table headers\n"
@@ -92,7 +109,7 @@ class MEA_Param :
 
 	def __init__(self, mea_os, source) :
 	
-		self.all = ['-?','-skip','-extr','-msg','-unp86','-ver86','-bug86','-html','-json','-pdb','-dbname','-mass','-dfpt','-exit','-ftbl']
+		self.all = ['-?','-skip','-extr','-msg','-unp86','-ver86','-bug86','-html','-json','-pdb','-dbname','-mass','-dfpt','-exit','-ftbl','-jobs','-store','-cache','-probe','-size','-ext','-noext']
 		self.win = ['-extr','-msg'] # Windows only
 		
 		if mea_os == 'win32' : self.val = self.all
@@ -113,6 +130,22 @@ class MEA_Param :
 		self.write_html = False
 		self.write_json = False
 		self.mfs_ftbl = False
+		self.jobs_count = 1
+		self.jobs_arg = None
+		self.store_arg = None
+		self.mod_store = None # Module Store folder of decompressed CSE Modules, shared across input files
+		self.cache_arg = None
+		self.res_cache = None # Result Cache folder of analyzed images, reused while MEA & DB are the same
+		self.mass_arg = None # -mass folder, scanned without prompts
+		self.mass_probe = False
+		self.size_arg = None
+		self.mass_size = [0, None] # -mass file size bounds (Minimum, Maximum)
+		self.ext_arg = None
+		self.mass_ext = [] # -mass file extensions to scan, all if empty
+		self.noext_arg = None
+		self.mass_noext = [] # -mass file extensions to skip
+		self.report_memory = False # Library only, Report Files are kept at MEA_Result.reports
+		self.library = False # Library only, no CLI side effects (__CHECK__ input copies, Colorama teardown)
 		
 		for i in source :
 			if i == '-?' : self.help_scr = True
@@ -123,11 +156,34 @@ class MEA_Param :
 			if i == '-pdb' : self.db_print_new = True
 			if i == '-dbname' : self.give_db_name = True
 			if i == '-mass' : self.mass_scan = True
+			if i == '-probe' : self.mass_probe = True
 			if i == '-dfpt' : self.fpt_disp = True
 			if i == '-exit' : self.skip_pause = True
 			if i == '-html' : self.write_html = True
 			if i == '-json' : self.write_json = True
 			if i == '-ftbl' : self.mfs_ftbl = True # Hidden
+			if i == '-jobs' and source.index(i) + 1 < len(source) and source[source.index(i) + 1].isdigit() :
+				self.jobs_arg = source[source.index(i) + 1] # Process count, not an input file
+				self.jobs_count = max(int(self.jobs_arg), 1)
+			if i == '-store' and source.index(i) + 1 < len(source) :
+				self.store_arg = source[source.index(i) + 1] # Module Store folder, not an input file
+				self.mod_store = os.path.abspath(self.store_arg)
+			if i == '-cache' and source.index(i) + 1 < len(source) :
+				self.cache_arg = source[source.index(i) + 1] # Result Cache folder, not an input file
+				self.res_cache = os.path.abspath(self.cache_arg)
+			if i == '-mass' and source.index(i) + 1 < len(source) and os.path.isdir(source[source.index(i) + 1]) :
+				self.mass_arg = source[source.index(i) + 1] # -mass folder, not an input file
+			if i == '-size' and source.index(i) + 1 < len(source) :
+				self.size_arg = source[source.index(i) + 1] # -mass file size bounds (A:B, A: or :B, A alone is the minimum), not an input file
+				size_min, size_max = (self.size_arg.split(':', 1) + [''])[:2]
+				try : self.mass_size = [int(size_min, 0) if size_min else 0, int(size_max, 0) if size_max else None]
+				except ValueError : self.mass_size = None # Reported before scanning
+			if i == '-ext' and source.index(i) + 1 < len(source) :
+				self.ext_arg = source[source.index(i) + 1] # -mass file extensions to scan (bin,rom), not an input file
+				self.mass_ext = [ext.strip('.').lower() for ext in self.ext_arg.split(',')]
+			if i == '-noext' and source.index(i) + 1 < len(source) :
+				self.noext_arg = source[source.index(i) + 1] # -mass file extensions to skip (txt,pdf), not an input file
+				self.mass_noext = [ext.strip('.').lower() for ext in self.noext_arg.split(',')]
 			
 			# Windows only options
 			if mea_os == 'win32' :
@@ -136,6 +192,207 @@ class MEA_Param :
 			
 		if self.extr_mea or self.print_msg or self.mass_scan or self.db_print_new : self.skip_intro = True
 		
+# MEA Database, parsed once & indexed
+class MEA_DB :
+	
+	def __init__(self, db_path, cache_path) :
+		
+		self.lines = [] # All DB lines, in file order
+		self.rev = '' # DB Revision (rXXX)
+		self.hash_idx = {} # SHA-256 Hash (RSA Key, RSA Signature) > DB lines which contain it
+		self.name_idx = {} # DB Name > DB lines which contain it
+		self.latest_idx = {} # Latest_<Variant>_<MajorMinor>_<SKU> Key > DB lines which contain it
+		self.latest_lines = [] # DB lines of Latest entries
+		self.find_cache = {} # Non-indexed search results
+		self.queries = None # Searched text > DB lines of the current image, when recorded for the Result Cache
+		
+		try :
+			db_key = self.db_key(db_path)
+		except :
+			return # DB is missing
+		
+		if self.cache_load(cache_path, db_key) : return # Parsed DB loaded from cache
+		
+		with open(db_path, 'r', encoding = 'utf-8') as fw_db : self.lines = [line.strip() for line in fw_db]
+		
+		self.db_parse()
+		
+		self.cache_save(cache_path, db_key)
+	
+	# Get DB cache key: MEA version, DB Revision, DB modification time & size
+	@staticmethod
+	def db_key(db_path) :
+		db_stat = os.stat(db_path)
+		
+		with open(db_path, 'r', encoding = 'utf-8') as fw_db : db_hdr = fw_db.read(0x100) # Revision is at the DB header
+		
+		db_hdr_rev = re.search(r'Revision (\S+)', db_hdr)
+		
+		return title, db_hdr_rev.group(1) if db_hdr_rev else '', db_stat.st_mtime_ns, db_stat.st_size
+	
+	# Load parsed DB from cache, if it matches the current DB
+	def cache_load(self, cache_path, db_key) :
+		try :
+			with open(cache_path, 'rb') as db_cache : cache_key, cache_data = pickle.load(db_cache)
+		except :
+			return False # Cache is missing or corrupted
+		
+		if cache_key != db_key : return False # Cache is stale
+		
+		self.lines, self.rev, self.hash_idx, self.name_idx, self.latest_idx, self.latest_lines = cache_data
+		
+		return True
+	
+	# Store parsed DB to cache, ignore failures (i.e. read-only location)
+	def cache_save(self, cache_path, db_key) :
+		cache_data = (self.lines, self.rev, self.hash_idx, self.name_idx, self.latest_idx, self.latest_lines)
+		cache_temp = cache_path + '.%d' % os.getpid()
+		
+		try :
+			with open(cache_temp, 'wb') as db_cache : pickle.dump((db_key, cache_data), db_cache, pickle.HIGHEST_PROTOCOL)
+			os.replace(cache_temp, cache_path) # Atomic, for concurrent MEA instances
+		except :
+			if os.path.isfile(cache_temp) : os.remove(cache_temp)
+	
+	# Parse & Index all DB lines
+	def db_parse(self) :
+		for line in self.lines :
+			if 'Revision' in line : self.rev = line.split()[2]
+			if 'Latest_' in line : self.latest_lines.append(line)
+			
+			# Any 0x20 Hash within a line (0x40 hex characters window, in case of longer hex runs)
+			for hash_run in re.findall(r'[0-9A-F]{64,}', line) :
+				for i in range(len(hash_run) - 63) :
+					hash_lines = self.hash_idx.setdefault(hash_run[i:i + 64], [])
+					if not hash_lines or hash_lines[-1] is not line : hash_lines.append(line)
+		
+		for line in self.lines :
+			hash_match = re.search(r'[0-9A-F]{64}', line)
+			if hash_match : self.name_idx[line.split()[0]] = [i for i in self.hash_idx[hash_match.group(0)] if line.split()[0] in i]
+		
+		for line in self.latest_lines :
+			latest_key = line.split('__')[0]
+			self.latest_idx[latest_key] = [i for i in self.latest_lines if latest_key in i]
+	
+	# Get all DB lines which contain text, in file order
+	def get_lines(self, text) :
+		db_lines = self.find_lines(text)
+		
+		if self.queries is not None : self.queries[text] = db_lines
+		
+		return db_lines
+	
+	# Find all DB lines which contain text, via the indexes when possible
+	def find_lines(self, text) :
+		if text in self.name_idx : return self.name_idx[text]
+		if text in self.latest_idx : return self.latest_idx[text]
+		if text in self.find_cache : return self.find_cache[text]
+		
+		hash_match = re.search(r'[0-9A-F]{64}', text)
+		
+		if hash_match : db_lines = [line for line in self.hash_idx.get(hash_match.group(0), []) if text in line] # Hash, RSA Key/Signature or DB Name
+		elif 'Latest_' in text : db_lines = [line for line in self.latest_lines if text in line] # Partial Latest Key
+		else : db_lines = [line for line in self.lines if text in line] # Anything else
+		
+		self.find_cache[text] = db_lines
+		
+		return db_lines
+	
+	# Get first DB line which contains text
+	def get_line(self, text) :
+		db_lines = self.get_lines(text)
+		
+		return db_lines[0] if db_lines else None
+
+# MEA Analysis Result of an Engine firmware image
+class MEA_Result :
+	
+	def __init__(self, name) :
+		
+		self.name = name # Input file/image name
+		self.variant = 'Unknown' # Firmware Family
+		self.version = '' # Firmware Version
+		self.name_db = '' # Firmware DB name
+		self.db_found = False # Firmware exists at the DB
+		self.info = {} # Firmware Info Field > Value
+		self.info_pmc = {} # Stitched PMC Firmware Info Field > Value
+		self.messages = [] # Error/Warning/Note Messages
+		self.output = '' # Printed output, without Colorama ANSI sequences
+		self.exit_code = None # Exit code, if analysis ended via mea_exit
+		self.reports = {} # Report File (txt/html/json) Path > Text, when kept in memory
+
+# PrettyTable Object, built when it is first shown or stored
+class Lazy_Table :
+	
+	def __init__(self, pt_func, *pt_args) :
+		
+		object.__setattr__(self, 'pt_func', pt_func) # Table or Structure Info method (ext_table, hdr_print, mfs_print etc)
+		object.__setattr__(self, 'pt_args', pt_args) # Table or Structure Info method arguments
+		object.__setattr__(self, 'pt_edits', []) # Attribute (title etc) & Row (None) changes until the table is built
+		object.__setattr__(self, 'pt', None) # Built PrettyTable Object
+	
+	# Build the PrettyTable Object and apply all the changes made so far
+	def pt_get(self) :
+		if self.pt is None :
+			pt = self.pt_func(*self.pt_args)
+			
+			for name,value in self.pt_edits :
+				if name is None : pt.add_row(value)
+				else : setattr(pt, name, value)
+			
+			object.__setattr__(self, 'pt', pt)
+		
+		return self.pt
+	
+	def add_row(self, row) :
+		if self.pt is None : self.pt_edits.append((None, row))
+		else : self.pt.add_row(row)
+	
+	def __setattr__(self, name, value) :
+		if self.pt is None : self.pt_edits.append((name, value))
+		else : setattr(self.pt, name, value)
+	
+	def __getattr__(self, name) :
+		if name.startswith('__') : raise AttributeError(name) # Copy/Pickle protocol lookups
+		
+		return getattr(self.pt_get(), name)
+	
+	def __str__(self) :
+		return str(self.pt_get())
+
+# Printed output, also kept for the Result Cache
+class Output_Tee(io.StringIO) :
+	
+	def __init__(self, stream) :
+		
+		super().__init__()
+		
+		self.stream = stream # Actual output (sys.stdout, Colorama or mea_analyze_output)
+		self.pieces = [] # Output before each title table
+		self.tables = [] # Title tables (Field Names, Header, Title, Rows)
+	
+	def write(self, text) :
+		self.stream.write(text)
+		
+		return super().write(text)
+	
+	# Write title table to the actual output only, its data is kept instead
+	def write_title(self, pt) :
+		self.stream.write('%s\n' % pt)
+		
+		self.pieces.append(self.getvalue())
+		self.tables.append([pt.field_names, pt.header, pt.title, pt._rows])
+		
+		self.seek(0)
+		self.truncate()
+	
+	# Get output pieces, title tables go between them
+	def get_pieces(self) :
+		return self.pieces + [self.getvalue()]
+	
+	def flush(self) :
+		self.stream.flush()
+
 # Engine Structures
 class FPT_Pre_Header(ctypes.LittleEndianStructure) : # (ROM_BYPASS)
 	_pack_ = 1
@@ -4554,22 +4811,18 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 			else :
 				print(col_r + '\nCSE Layout Table Checksum is INVALID\n' + col_e)
 		
-		with open(cse_lt_fname + '.bin', 'w+b') as cse_lt_file : cse_lt_file.write(reading[cse_lt_off:cse_lt_off + cse_lt_size])
-		with open(cse_lt_fname + '.txt', 'a', encoding = 'utf-8') as cse_lt_file : cse_lt_file.write(ansi_escape.sub('', '\n%s' % cse_lt_info))
-		if param.write_html :
-			with open(cse_lt_fname + '.html', 'a', encoding = 'utf-8') as cse_lt_file : cse_lt_file.write('\n<br/>\n%s' % pt_html(cse_lt_info))
-		if param.write_json :
-			with open(cse_lt_fname + '.json', 'a', encoding = 'utf-8') as cse_lt_file : cse_lt_file.write('\n%s' % pt_json(cse_lt_info))
+		with open(cse_lt_fname + '.bin', 'w+b') as cse_lt_file : cse_lt_file.write(memoryview(reading)[cse_lt_off:cse_lt_off + cse_lt_size])
+		report_write(cse_lt_fname + '.txt', ansi_escape.sub('', '\n%s' % cse_lt_info))
+		if param.write_html : report_write(cse_lt_fname + '.html', '\n<br/>\n%s' % pt_html(cse_lt_info))
+		if param.write_json : report_write(cse_lt_fname + '.json', '\n%s' % pt_json(cse_lt_info))
 		
 		pt_dcselt.title = col_y + 'Detected %d Partition(s) at CSE LT [0x%0.6X]' % (len(cse_lt_part_all), cse_lt_off) + col_e
 		print('%s\n' % pt_dcselt) # Local copy with different title for cse_unpack function
 		
 		cse_lt_hdr = ansi_escape.sub('', str(pt_dcselt))
-		with open(cse_lt_fname + '.txt', 'a', encoding = 'utf-8') as cse_lt_file : cse_lt_file.write('\n%s' % cse_lt_hdr)
-		if param.write_html :
-			with open(cse_lt_fname + '.html', 'a', encoding = 'utf-8') as cse_lt_file : cse_lt_file.write('\n<br/>\n%s' % pt_html(pt_dcselt))
-		if param.write_json :
-			with open(cse_lt_fname + '.json', 'a', encoding = 'utf-8') as cse_lt_file : cse_lt_file.write('\n%s' % pt_json(pt_dcselt))
+		report_write(cse_lt_fname + '.txt', '\n%s' % cse_lt_hdr)
+		if param.write_html : report_write(cse_lt_fname + '.html', '\n<br/>\n%s' % pt_html(pt_dcselt))
+		if param.write_json : report_write(cse_lt_fname + '.json', '\n%s' % pt_json(pt_dcselt))
 		
 		print(col_y + '--> Stored CSE Layout Table [0x%0.6X - 0x%0.6X]\n' % (cse_lt_off, cse_lt_off + cse_lt_size) + col_e)
 		
@@ -4584,7 +4837,7 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 				file_name = os.path.join(fw_name, 'CSE LT ' + part_name + ' [0x%0.6X].bin' % part_start) # Start offset covers any cases with duplicate name entries (CSE_Layout_Table_17)
 				mod_fname = os.path.join(mea_dir, file_name)
 				
-				with open(mod_fname, 'w+b') as part_file : part_file.write(reading[part_start:part_end])
+				with open(mod_fname, 'w+b') as part_file : part_file.write(memoryview(reading)[part_start:part_end])
 			
 				print(col_y + '--> Stored CSE LT Partition "%s" [0x%0.6X - 0x%0.6X]\n' % (part[0], part_start, part_end) + col_e)
 	
@@ -4627,7 +4880,7 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 		
 		# Store Flash Partition Table ($FPT) Data
 		if not cse_lt_exist : # Stored at CSE LT section too
-			with open(fpt_fname + '.bin', 'w+b') as fpt_file : fpt_file.write(reading[fpt_start:fpt_start + 0x1000]) # $FPT size is 4K
+			with open(fpt_fname + '.bin', 'w+b') as fpt_file : fpt_file.write(memoryview(reading)[fpt_start:fpt_start + 0x1000]) # $FPT size is 4K
 			
 			print(col_y + '\n--> Stored Flash Partition Table [0x%0.6X - 0x%0.6X]' % (fpt_start, fpt_start + 0x1000) + col_e)
 		
@@ -4635,19 +4888,15 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 		# Ignore Colorama ANSI Escape Character Sequences
 		if fpt_romb_exist :
 			fpt_hdr_romb = ansi_escape.sub('', str(fpt_hdr_0_print))
-			with open(fpt_fname + '.txt', 'a', encoding = 'utf-8') as fpt_file : fpt_file.write('\n%s' % fpt_hdr_romb)
-			if param.write_html :
-				with open(fpt_fname + '.html', 'a', encoding = 'utf-8') as fpt_file : fpt_file.write('\n<br/>\n%s' % pt_html(fpt_hdr_0_print))
-			if param.write_json :
-				with open(fpt_fname + '.json', 'a', encoding = 'utf-8') as fpt_file : fpt_file.write('\n%s' % pt_json(fpt_hdr_0_print))
+			report_write(fpt_fname + '.txt', '\n%s' % fpt_hdr_romb)
+			if param.write_html : report_write(fpt_fname + '.html', '\n<br/>\n%s' % pt_html(fpt_hdr_0_print))
+			if param.write_json : report_write(fpt_fname + '.json', '\n%s' % pt_json(fpt_hdr_0_print))
 		
 		fpt_hdr_main = ansi_escape.sub('', str(fpt_hdr_1_print))
 		fpt_hdr_part = ansi_escape.sub('', str(pt))
-		with open(fpt_fname + '.txt', 'a', encoding = 'utf-8') as fpt_file : fpt_file.write('\n%s\n%s' % (fpt_hdr_main, fpt_hdr_part))
-		if param.write_html :
-			with open(fpt_fname + '.html', 'a', encoding = 'utf-8') as fpt_file : fpt_file.write('\n<br/>\n%s\n<br/>\n%s' % (pt_html(fpt_hdr_1_print), pt_html(pt)))
-		if param.write_json :
-			with open(fpt_fname + '.json', 'a', encoding = 'utf-8') as fpt_file : fpt_file.write('\n%s\n%s' % (pt_json(fpt_hdr_1_print), pt_json(pt)))
+		report_write(fpt_fname + '.txt', '\n%s\n%s' % (fpt_hdr_main, fpt_hdr_part))
+		if param.write_html : report_write(fpt_fname + '.html', '\n<br/>\n%s\n<br/>\n%s' % (pt_html(fpt_hdr_1_print), pt_html(pt)))
+		if param.write_json : report_write(fpt_fname + '.json', '\n%s\n%s' % (pt_json(fpt_hdr_1_print), pt_json(pt)))
 		
 		# Place MFS first to validate FTPR > FTPR.man > 0x00 > Intel Configuration Hash
 		# and get MFS FTBL ID & Record Size for FTPR/FITC Partition intl.cfg/fitc.cfg
@@ -4670,7 +4919,7 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 				
 				mod_f_path = os.path.join(mea_dir, fw_name, part_name + ' [0x%0.6X].bin' % part_start) # Start offset covers any cases with duplicate name entries (Joule_C0-X64-Release)
 				
-				with open(mod_f_path, 'w+b') as part_file : part_file.write(reading[part_start:part_end])
+				with open(mod_f_path, 'w+b') as part_file : part_file.write(memoryview(reading)[part_start:part_end])
 			
 				print(col_y + '\n--> Stored $FPT %s Partition "%s" [0x%0.6X - 0x%0.6X]' % (part_type, part_name, part_start, part_end) + col_e)
 				
@@ -4683,11 +4932,9 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 							if param.me11_mod_ext : print() # Print Manifest/Metadata/Key Extension Info
 							for ext in ext_print[index + 1] :
 								ext_str = ansi_escape.sub('', str(ext))
-								with open(mod_f_path + '.txt', 'a', encoding = 'utf-8') as text_file : text_file.write('\n%s' % ext_str)
-								if param.write_html :
-									with open(mod_f_path + '.html', 'a', encoding = 'utf-8') as text_file : text_file.write('\n<br/>\n%s' % pt_html(ext))
-								if param.write_json :
-									with open(mod_f_path + '.json', 'a', encoding = 'utf-8') as text_file : text_file.write('\n%s' % pt_json(ext))
+								report_write(mod_f_path + '.txt', '\n%s' % ext_str)
+								if param.write_html : report_write(mod_f_path + '.html', '\n<br/>\n%s' % pt_html(ext))
+								if param.write_json : report_write(mod_f_path + '.json', '\n%s' % pt_json(ext))
 								if param.me11_mod_ext : print(ext) # Print Manifest/Metadata/Key Extension Info
 							break
 							
@@ -4720,6 +4967,10 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 							except : rbe_pm_data_d = rbe_pm_data
 					
 					rbe_pm_met_hashes = get_rbe_pm_met(rbe_pm_data_d, rbe_pm_met_hashes)
+				
+				report_flush() # Store the Partition Report Files
+	
+	report_flush() # Store the CSE LT & $FPT Report Files
 	
 	# Parse all Boot Partition Description Table (BPDT/IFWI) entries
 	if len_bpdt_part_all :
@@ -4737,21 +4988,18 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 		else : bpdt_fname = os.path.join(mea_dir, fw_name, 'BPDT [%d]' % len(bpdt_hdr_all))
 		
 		# Store Boot Partition Description Table (BPDT/IFWI) Info in TXT
-		with open(bpdt_fname + '.txt', 'a', encoding = 'utf-8') as bpdt_file :
-			for hdr in bpdt_hdr_all : bpdt_file.write('\n%s' % ansi_escape.sub('', str(hdr)))
-			bpdt_file.write('\n%s' % ansi_escape.sub('', str(pt)))
+		for hdr in bpdt_hdr_all : report_write(bpdt_fname + '.txt', '\n%s' % ansi_escape.sub('', str(hdr)))
+		report_write(bpdt_fname + '.txt', '\n%s' % ansi_escape.sub('', str(pt)))
 			
 		# Store Boot Partition Description Table (BPDT/IFWI) Info in HTML
 		if param.write_html :
-			with open(bpdt_fname + '.html', 'a', encoding = 'utf-8') as bpdt_file :
-				for hdr in bpdt_hdr_all : bpdt_file.write('\n<br/>\n%s' % pt_html(hdr))
-				bpdt_file.write('\n<br/>\n%s' % pt_html(pt))
+			for hdr in bpdt_hdr_all : report_write(bpdt_fname + '.html', '\n<br/>\n%s' % pt_html(hdr))
+			report_write(bpdt_fname + '.html', '\n<br/>\n%s' % pt_html(pt))
 				
 		# Store Boot Partition Description Table (BPDT/IFWI) Info in JSON
 		if param.write_json :
-			with open(bpdt_fname + '.json', 'a', encoding = 'utf-8') as bpdt_file :
-				for hdr in bpdt_hdr_all : bpdt_file.write('\n%s' % pt_json(hdr))
-				bpdt_file.write('\n%s' % pt_json(pt))
+			for hdr in bpdt_hdr_all : report_write(bpdt_fname + '.json', '\n%s' % pt_json(hdr))
+			report_write(bpdt_fname + '.json', '\n%s' % pt_json(pt))
 		
 		# Store Boot Partition Descriptor Table (BPDT/IFWI) Data
 		if not cse_lt_exist : # Stored at CSE LT section too
@@ -4780,7 +5028,7 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 				
 				mod_f_path = os.path.join(mea_dir, fw_name, part_name + ' [0x%0.6X].bin' % part_start) # Start offset covers any cases with duplicate name entries ("Unknown" etc)
 				
-				with open(mod_f_path, 'w+b') as part_file : part_file.write(reading[part_start:part_end])
+				with open(mod_f_path, 'w+b') as part_file : part_file.write(memoryview(reading)[part_start:part_end])
 				
 				print(col_y + '\n--> Stored BPDT %s Partition "%s" [0x%0.6X - 0x%0.6X]' % (part_order, part_name, part_start, part_end) + col_e)
 				
@@ -4793,11 +5041,9 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 							if param.me11_mod_ext : print() # Print Manifest/Metadata/Key Extension Info
 							for ext in ext_print[index + 1] :
 								ext_str = ansi_escape.sub('', str(ext))
-								with open(mod_f_path + '.txt', 'a', encoding = 'utf-8') as text_file : text_file.write('\n%s' % ext_str)
-								if param.write_html :
-									with open(mod_f_path + '.html', 'a', encoding = 'utf-8') as text_file : text_file.write('\n<br/>\n%s' % pt_html(ext))
-								if param.write_json :
-									with open(mod_f_path + '.json', 'a', encoding = 'utf-8') as text_file : text_file.write('\n%s' % pt_json(ext))
+								report_write(mod_f_path + '.txt', '\n%s' % ext_str)
+								if param.write_html : report_write(mod_f_path + '.html', '\n<br/>\n%s' % pt_html(ext))
+								if param.write_json : report_write(mod_f_path + '.json', '\n%s' % pt_json(ext))
 								if param.me11_mod_ext : print(ext) # Print Manifest/Metadata/Key Extension Info
 							break
 							
@@ -4830,11 +5076,14 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 							except : rbe_pm_data_d = rbe_pm_data
 					
 					rbe_pm_met_hashes = get_rbe_pm_met(rbe_pm_data_d, rbe_pm_met_hashes)
+				
+				report_flush() # Store the Partition Report Files
+	
+	report_flush() # Store the BPDT Report Files
 	
 	# Parse all Code Partition Directory ($CPD) entries
 	# Better to separate $CPD from $FPT/BPDT to avoid duplicate FTUP/NFTP ($FPT) issue
-	cpd_pat = re.compile(br'\x24\x43\x50\x44.\x00\x00\x00[\x01\x02]\x01[\x10\x14]', re.DOTALL) # $CPD detection
-	cpd_match_store = list(cpd_pat.finditer(reading))
+	cpd_match_store = image_marker_all('$CPD') # $CPD detection
 	
 	# Store all Code Partition Directory ranges
 	if len(cpd_match_store) :
@@ -4850,14 +5099,43 @@ def cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start, fpt_ch
 		rbe_pm_met_valid = mod_anl(cpd_offset_e, cpd_mod_attr_e, cpd_ext_attr_e, fw_name, ext_print, ext_phval, ext_dnx_val, ext_iunit_val,
 						   rbe_pm_met_hashes, rbe_pm_met_valid, ext12_info, vol_ftbl_id, config_rec_size)
 		
+		report_flush() # Store the Partition Report Files
+	
 	# Store all RBEP > rbe and FTPR > pm "Metadata" leftover Hashes for Huffman symbol reversing
 	# The leftover Hashes for Huffman symbol reversing should be n+* if NFTP > pavp and/or PCOD > PCOD are encrypted
 	rbe_pm_met_leftovers = [l_hash for l_hash in rbe_pm_met_hashes if l_hash not in rbe_pm_met_valid] # Debug/Research
 	#for l_hash in rbe_pm_met_leftovers : print(l_hash)
 	
+# Analyze CSE Extensions, once per whole image $CPD/$MN2 & mode
+def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man_name, mfs_idx_cfg) :
+	# Partition slices & Module buffers are analyzed directly, as their objects are not unique per image
+	if buffer is not reading : return ext_anl_run(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man_name, mfs_idx_cfg)
+	
+	# Special _Stage1 mode only uses the Variant, any version must match (get_variant, $FPT false positive removal)
+	ver_key = ftpr_var_ver[0] if input_type.endswith('_Stage1') else tuple(ftpr_var_ver)
+	
+	# MFS & $FPT/BPDT Partition state is checked at Stages 4 & 5, so it is part of the key as well
+	cache_key = (input_type, input_offset, file_end, ver_key, single_man_name, repr(mfs_idx_cfg), mfs_found, len(fpt_part_all), len(bpdt_part_all))
+	
+	if cache_key not in ext_anl_cache :
+		err_len,shown_len = len(err_stor),len(cse_anl_shown)
+		ext_result = ext_anl_run(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man_name, mfs_idx_cfg)
+		ext_anl_cache[cache_key] = (ext_result, err_stor[err_len:], cse_anl_shown[shown_len:])
+		
+		ext_result_cache = ext_result
+	else :
+		ext_result_cache,ext_err_all,ext_err_shown = ext_anl_cache[cache_key]
+		
+		# Repeat the Errors/Warnings of the first analysis, as they would have been reported again
+		err_stor.extend([list(err) for err in ext_err_all])
+		for ext_err_msg,copy_file in ext_err_shown : cse_anl_err_show(ext_err_msg, copy_file)
+	
+	# Callers may edit the returned lists (i.e. mod_anl > ext_print), so each one gets its own copies
+	return tuple(list(info) if isinstance(info, list) else info for info in ext_result_cache)
+
 # Analyze CSE Extensions
 # noinspection PyUnusedLocal
-def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man_name, mfs_idx_cfg) :
+def ext_anl_run(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man_name, mfs_idx_cfg) :
 	vcn = -1
 	in_id = 0
 	cpd_num = 0
@@ -4897,6 +5175,7 @@ def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man
 	cpd_mod_attr = []
 	cpd_ext_attr = []
 	cpd_mn2_info = []
+	cpd_entries = []
 	cpd_mod_names = []
 	cpd_ext_names = []
 	mn2_hdr_print = []
@@ -4945,7 +5224,7 @@ def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man
 			mn2_offset = start_man_match - 0x1B # $MN2 Manifest Offset
 			mn2_size = mn2_hdr.Size * 4 # $MN2 Manifest Size
 			mn2_date = '%0.4X-%0.2X-%0.2X' % (mn2_hdr.Year,mn2_hdr.Month,mn2_hdr.Day)
-			mn2_hdr_print = mn2_hdr.hdr_print_cse()
+			mn2_hdr_print = Lazy_Table(mn2_hdr.hdr_print_cse)
 			
 			mn2_rsa_block_off = end_man_match + 0x60 # RSA Block Offset
 			mn2_rsa_key_len = mn2_hdr.PublicKeySize * 4 # RSA Key/Signature Length
@@ -4984,13 +5263,12 @@ def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man
 				cse_anl_err(col_r + 'Error: Wrong $CPD "%s" Checksum 0x%0.2X, expected 0x%0.2X' % (cpd_name, cpd_chk_fw, cpd_chk_exp) + col_e, None)
 		
 		# Stage 1: Store $CPD Entry names to detect Partition attributes for MEA
+		cpd_entries = get_cpd_entries(buffer, cpd_offset, cpd_hdr_size, cpd_num) # Also used at Stage 2
 		for entry in range(0, cpd_num) :
-			cpd_entry_hdr = get_struct(buffer, cpd_offset + cpd_hdr_size + entry * 0x18, CPD_Entry)
-			cpd_entry_name = cpd_entry_hdr.Name.decode('utf-8')
+			if entry >= len(cpd_entries) : get_struct(buffer, cpd_offset + cpd_hdr_size + entry * 0x18, CPD_Entry) # Out of bounds $CPD Entry
+			cpd_entry_name,cpd_entry_offset,cpd_entry_huff,cpd_entry_res1,cpd_entry_size,cpd_entry_res0 = cpd_entries[entry] # Size is Uncompressed only
+			cpd_entry_name = cpd_entry_name.decode('utf-8')
 			cpd_mod_names.append(cpd_entry_name) # Store each $CPD Module name
-			cpd_entry_size = cpd_entry_hdr.Size # Uncompressed only
-			cpd_entry_res0 = cpd_entry_hdr.Reserved
-			cpd_entry_offset,cpd_entry_huff,cpd_entry_res1 = cpd_entry_hdr.get_flags()
 			
 			# Detect if FTPR Partition is FWUpdate-customized to skip potential $FPT false positive at fptemp module
 			if cpd_entry_name == 'fptemp' and (cpd_entry_offset,cpd_entry_size) != (0,0) and not (cpd_offset + cpd_entry_offset >= file_end
@@ -5021,7 +5299,7 @@ def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man
 			
 			# Detect Recovery Image Partition (RCIP)
 			if cpd_name == 'RCIP' :
-				dnx_entry_off, x1, x2 = cpd_entry_hdr.get_flags()
+				dnx_entry_off = cpd_entry_offset
 				
 				# Get DNX R1/R2 version
 				if cpd_entry_name == 'version' : dnx_version = int.from_bytes(buffer[cpd_offset + dnx_entry_off:cpd_offset + dnx_entry_off + 0x4], 'little')
@@ -5049,12 +5327,9 @@ def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man
 	for entry in range(0, 1 if single_man_name else cpd_num) :
 		# Variable Initialization based on Single Manifest existence
 		if not single_man_name :
-			cpd_entry_hdr = get_struct(buffer, cpd_offset + cpd_hdr_size + entry * 0x18, CPD_Entry)
-			cpd_mod_off,cpd_mod_huff,cpd_mod_res = cpd_entry_hdr.get_flags()
+			cpd_entry_name,cpd_mod_off,cpd_mod_huff,cpd_mod_res,cpd_entry_size,x0 = cpd_entries[entry] # Size is Uncompressed only
 			
 			cpd_entry_offset = cpd_offset + cpd_mod_off
-			cpd_entry_size = cpd_entry_hdr.Size # Uncompressed only
-			cpd_entry_name = cpd_entry_hdr.Name
 		else :
 			cpd_offset = 0
 			cpd_name = single_man_name
@@ -5633,12 +5908,11 @@ def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man
 				break # To hopefully avoid some 03/0F/16 MetadataHash mismatch, assuming 1st has correct MetadataHash
 	
 	# Stage 5: Analyze Modules, Keys, Microcodes & Data (must be after all Manifest & Metadata Extension analysis)
+	cpd_entries = get_cpd_entries(buffer, cpd_offset, cpd_hdr_size, cpd_num) # Single $MN2 w/o $CPD resets its offset at Stage 2
 	for entry in range(0, cpd_num) :
-		cpd_entry_hdr = get_struct(buffer, cpd_offset + cpd_hdr_size + entry * 0x18, CPD_Entry)
-		cpd_mod_off,cpd_mod_huff,cpd_mod_res = cpd_entry_hdr.get_flags()
+		if entry >= len(cpd_entries) : get_struct(buffer, cpd_offset + cpd_hdr_size + entry * 0x18, CPD_Entry) # Out of bounds $CPD Entry
+		cpd_entry_name,cpd_mod_off,cpd_mod_huff,cpd_mod_res,cpd_entry_size,x0 = cpd_entries[entry] # Size is Uncompressed only
 		
-		cpd_entry_name = cpd_entry_hdr.Name
-		cpd_entry_size = cpd_entry_hdr.Size # Uncompressed only
 		cpd_entry_offset = cpd_offset + cpd_mod_off
 		mod_size = cpd_entry_size # Uncompressed initially, to replace with Compressed for Modules
 		mod_empty = 0 # Assume that Module is not empty initially
@@ -5758,6 +6032,130 @@ def ext_anl(buffer, input_type, input_offset, file_end, ftpr_var_ver, single_man
 	
 	return cpd_offset,cpd_mod_attr,cpd_ext_attr,vcn,ext12_info,ext_print,ext_pname,ext32_info,ext_phval,ext_dnx_val,oem_config,oem_signed,cpd_mn2_info,ext_iunit_val,arb_svn
 
+# Decompress & Hash CSE LZMA Module, run at worker threads as lzma & hashlib release the GIL
+# The Uncompressed Hash is only needed when the Compressed one is not valid (most LZMA Modules)
+def mod_lzma_anl(mod_data, mod_data_r, mod_size_uncomp, hash_size, valid_hashes, store_path) :
+	mea_hash_c = None
+	mea_hash_u = None
+	
+	mod_data_d = mod_store_load(store_path) # Decompressed already, at a previous input file
+	
+	# noinspection PyArgumentList
+	if mod_data_d is None : mod_data_d = lzma.LZMADecompressor().decompress(mod_data)
+	
+	# Add missing EOF Padding when needed (usually at NFTP.ptt Module)
+	data_size_uncomp = len(mod_data_d)
+	if data_size_uncomp != mod_size_uncomp :
+		mod_last_byte = struct.pack('B', mod_data_d[data_size_uncomp - 1]) # Determine padding type (0xFF or 0x00)
+		mod_miss_padd = mod_size_uncomp - data_size_uncomp # Determine missing padding size
+		mod_data_d += mod_last_byte * mod_miss_padd # Fill module with missing padding
+	
+	if hash_size :
+		mea_hash_c = get_hash(mod_data_r, hash_size) # Compressed, Header zeros included (most LZMA Modules)
+		if mea_hash_c not in valid_hashes : mea_hash_u = get_hash(mod_data_d, hash_size) # Uncompressed (few LZMA Modules)
+	
+	return mod_data_d, mea_hash_c, mea_hash_u, store_path
+
+# Get CSE LZMA Module data & expected Hashes for mod_lzma_anl
+def mod_lzma_args(mod, rbe_pm_met_hashes) :
+	mod_data_r = reading[mod[3]:mod[3] + mod[4]] # Raw LZMA Module contents before zeros removal, for hashing
+	mod_data = mod_data_r
+	
+	# Remove zeros from LZMA header for decompression (inspired from Igor Skochinsky's me_unpack)
+	if mod_data.startswith(b'\x36\x00\x40\x00\x00') and mod_data[0xE:0x11] == b'\x00\x00\x00' :
+		mod_data = mod_data[:0xE] + mod_data[0x11:] # Visually, mod_size_comp += -3 for compressed module
+	
+	store_path = mod_store_path(mod_data, mod[1], mod[5])
+	
+	if mod[7] != 0 : return mod_data, mod_data_r, mod[5], len(mod[7]) // 2, [mod[7]], store_path # Metadata Module Hash
+	elif rbe_pm_met_hashes : return mod_data, mod_data_r, mod[5], len(rbe_pm_met_hashes[0]) // 2, rbe_pm_met_hashes, store_path # RBEP > rbe & FTPR > pm Hashes
+	else : return mod_data, mod_data_r, mod[5], 0, [], store_path # No Hash validation
+
+# Get Module Store key path of a decompressed CSE Module, keyed by its stored contents, Compression & Uncompressed Size
+# Huffman Modules are also keyed by their dictionary: CSE Variant & Major, Huffman.dat size & modification time
+# Each key file holds the SHA-256 of its decompressed Module, which is stored once as a read-only object named after it
+def mod_store_path(mod_data, mod_comp, mod_size_uncomp) :
+	if not param.mod_store or param.me11_mod_bug : return None # Debug mode decompresses all Modules
+	
+	mod_key = '%s_%d_%0.8X' % (hashlib.sha256(mod_data).hexdigest().upper(), mod_comp, mod_size_uncomp)
+	
+	if mod_comp == 1 :
+		try : dict_stat = os.stat(os.path.join(mea_dir, 'Huffman.dat'))
+		except OSError : return None # Huffman dictionary file is missing
+		
+		mod_key += '_%s%d_%X_%X' % (variant, major, dict_stat.st_size, dict_stat.st_mtime_ns)
+	
+	return os.path.join(param.mod_store, 'keys', mod_key[:2], mod_key)
+
+# Get Module Store object path of decompressed CSE Module contents, by their SHA-256
+def mod_store_object(data_hash) :
+	return os.path.join(param.mod_store, 'objects', data_hash[:2], data_hash)
+
+# Read Module Store object, if its contents still match its SHA-256
+def mod_store_read(data_hash) :
+	try :
+		with open(mod_store_object(data_hash), 'rb') as store_file : mod_data_d = store_file.read()
+	except OSError :
+		return None # Object is missing
+	
+	return mod_data_d if sha_256(mod_data_d) == data_hash else None
+
+# Get decompressed CSE Module SHA-256 of Module Store key
+def mod_store_key(store_path) :
+	try :
+		with open(store_path, 'r') as key_file : return key_file.read().strip()
+	except OSError :
+		return None # Module is not stored yet
+
+# Load decompressed CSE Module from the Module Store, if stored at a previous input file
+def mod_store_load(store_path) :
+	data_hash = mod_store_key(store_path) if store_path else None
+	
+	return mod_store_read(data_hash) if data_hash else None
+
+# Write Module Store file atomically, for concurrent MEA instances
+def mod_store_file(file_path, file_data, file_mode) :
+	file_temp = file_path + '.%d' % os.getpid()
+	
+	try :
+		os.makedirs(os.path.dirname(file_path), exist_ok=True)
+		with open(file_temp, 'wb') as store_file : store_file.write(file_data)
+		os.chmod(file_temp, file_mode)
+		os.replace(file_temp, file_path)
+	finally :
+		if os.path.isfile(file_temp) : mod_store_unlink(file_temp)
+
+# Remove file, which may be a read-only Module Store object hardlink
+def mod_store_unlink(file_path) :
+	try :
+		os.remove(file_path)
+	except PermissionError :
+		os.chmod(file_path, 0o644) # Windows does not remove read-only files
+		os.remove(file_path)
+
+# Write decompressed CSE Module, as a hardlink to its Module Store object when -store is used
+# An existing Module file is replaced, never written to, as it may be a hardlink to another Module Store object
+def mod_store_write(mod_fname, mod_data_d, store_path) :
+	if store_path :
+		data_hash = sha_256(mod_data_d)
+		link_temp = mod_fname + '.%d' % os.getpid()
+		
+		try :
+			if mod_store_read(data_hash) is None : mod_store_file(mod_store_object(data_hash), mod_data_d, 0o444) # Missing or damaged
+			
+			if mod_store_key(store_path) != data_hash : mod_store_file(store_path, data_hash.encode(), 0o644)
+			
+			os.link(mod_store_object(data_hash), link_temp)
+			os.replace(link_temp, mod_fname)
+			
+			return
+		except OSError :
+			if os.path.lexists(link_temp) : mod_store_unlink(link_temp) # Store is read-only or at another drive, write a copy instead
+	
+	if os.path.lexists(mod_fname) : mod_store_unlink(mod_fname)
+	
+	with open(mod_fname, 'wb') as mod_file : mod_file.write(mod_data_d)
+
 # Analyze & Store CSE Modules
 def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phval, ext_dnx_val, ext_iunit_val, rbe_pm_met_hashes, rbe_pm_met_valid, ext12_info, vol_ftbl_id, config_rec_size) :
 	# noinspection PyUnusedLocal
@@ -5805,22 +6203,30 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 		os.mkdir(folder_name)
 		
 		# Store Partition $CPD Header & Entry details in TXT
-		with open(info_fname, 'a', encoding = 'utf-8') as info_file :
-			info_file.write('\n%s\n%s' % (ansi_escape.sub('', str(cpd_phdr.hdr_print())), ansi_escape.sub('', str(pt))))
+		report_write(info_fname, '\n%s\n%s' % (ansi_escape.sub('', str(cpd_phdr.hdr_print())), ansi_escape.sub('', str(pt))))
 		
 		# Store Partition $CPD Header & Entry details in HTML
-		if param.write_html :
-			with open(info_fname[:-4] + '.html', 'a', encoding = 'utf-8') as info_file :
-				info_file.write('\n<br/>\n%s\n<br/>\n%s' % (pt_html(cpd_phdr.hdr_print()), pt_html(pt)))
+		if param.write_html : report_write(info_fname[:-4] + '.html', '\n<br/>\n%s\n<br/>\n%s' % (pt_html(cpd_phdr.hdr_print()), pt_html(pt)))
 		
 		# Store Partition $CPD Header & Entry details in JSON
-		if param.write_json :
-			with open(info_fname[:-4] + '.json', 'a', encoding = 'utf-8') as info_file :
-				info_file.write('\n%s\n%s' % (pt_json(cpd_phdr.hdr_print()), pt_json(pt)))
+		if param.write_json : report_write(info_fname[:-4] + '.json', '\n%s\n%s' % (pt_json(cpd_phdr.hdr_print()), pt_json(pt)))
 		
 		# Load Huffman Dictionaries for Decompression
 		huff_shape, huff_sym, huff_unk = cse_huffman_dictionary_load(variant, major, 'error')
 		
+		# Decompress & Hash all LZMA Modules at worker threads, their results are used in Module order below
+		# Huffman Modules are decompressed in order, large ones spread their chunks across a process pool
+		mod_lzma_jobs = {}
+		mod_lzma_all = [mod for mod in cpd_all_attr if (mod[1],mod[2],mod[6]) == (2,0,0)] # LZMA, not Encrypted, not Empty
+		mod_lzma_pool = concurrent.futures.ThreadPoolExecutor(os.cpu_count()) if len(mod_lzma_all) > 1 and (os.cpu_count() or 1) > 1 else None
+		
+		for mod in mod_lzma_all if mod_lzma_pool else [] :
+			mod_lzma_key = (mod[3], mod[4], mod[5], mod[7]) # Same Module data, size & expected Hash, same results
+			if mod_lzma_key not in mod_lzma_jobs : mod_lzma_jobs[mod_lzma_key] = mod_lzma_pool.submit(mod_lzma_anl, *mod_lzma_args(mod, rbe_pm_met_hashes))
+		
+		# Large Huffman Modules fork a process pool, which must not happen while LZMA worker threads are running
+		if mod_lzma_pool : mod_lzma_pool.shutdown(wait=any(mod[1] == 1 for mod in cpd_all_attr))
+		
 		# Parse all Modules based on their Metadata
 		for mod in cpd_all_attr :
 			mod_name = mod[0] # Name
@@ -6020,11 +6426,15 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 			elif mod_comp == 1 :
 				
 				try :
+					store_path = mod_store_path(mod_data, mod_comp, mod_size_uncomp)
+					mod_data_d = mod_store_load(store_path) # Decompressed already, at a previous input file
+					
 					if param.me11_mod_bug :
 						mod_data_d, huff_error = cse_huffman_decompress(mod_data, mod_size_comp, mod_size_uncomp, huff_shape, huff_sym, huff_unk, 'error') # Debug
 						if (huff_error,mod_hash) == (True,0) : input() # Decompression incomplete, pause when no Module Metadata exist 
-					else :
+					elif mod_data_d is None :
 						mod_data_d, huff_error = cse_huffman_decompress(mod_data, mod_size_comp, mod_size_uncomp, huff_shape, huff_sym, huff_unk, 'none')
+						if huff_error or not huff_shape : store_path = None # Keep incomplete Modules out of the Module Store
 						
 					print(col_c + '\n    Decompressed %s %s "%s"' % (comp[mod_comp], mod_type, mod_name) + col_e)
 					
@@ -6038,14 +6448,14 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 							
 						if mod_hash == mea_hash :
 							print(col_g + '\n    Hash of %s %s "%s" is VALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
-							with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, valid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, valid data
 						else :
 							if param.me11_mod_bug and (mod_hash,mea_hash) not in cse_known_bad_hashes :
 								input(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e) # Debug
 							else :
 								print(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
 							
-							with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, invalid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, invalid data
 					
 					# Open decompressed Huffman module for Hash validation, when Metadata info is not available
 					# When the firmware lacks Module Metadata, check RBEP > rbe and FTPR > pm Modules instead
@@ -6059,17 +6469,17 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 						if mea_hash in rbe_pm_met_hashes :
 							print(col_g + '\n    Hash of %s %s "%s" is VALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
 							rbe_pm_met_valid.append(mea_hash) # Store valid RBEP > rbe or FTPR > pm Hash to single out leftovers
-							with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, valid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, valid data
 						else :
 							if param.me11_mod_bug and (mod_hash,mea_hash) not in cse_known_bad_hashes :
 								input(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e) # Debug
 							else :
 								print(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
 							
-							with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, invalid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, invalid data
 						
 					else :
-						with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, cannot validate
+						mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, cannot validate
 				
 				except :
 					if param.me11_mod_bug :
@@ -6089,26 +6499,20 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 					mod_data = mod_data[:0xE] + mod_data[0x11:] # Visually, mod_size_comp += -3 for compressed module
 				
 				try :
-					# noinspection PyArgumentList
-					mod_data_d = lzma.LZMADecompressor().decompress(mod_data)
-					
-					# Add missing EOF Padding when needed (usually at NFTP.ptt Module)
-					data_size_uncomp = len(mod_data_d)
-					if data_size_uncomp != mod_size_uncomp :
-						mod_last_byte = struct.pack('B', mod_data_d[data_size_uncomp - 1]) # Determine padding type (0xFF or 0x00)
-						mod_miss_padd = mod_size_uncomp - data_size_uncomp # Determine missing padding size
-						mod_data_d += mod_last_byte * mod_miss_padd # Fill module with missing padding
+					mod_lzma_key = (mod_start, mod_size_comp, mod_size_uncomp, mod_hash)
+					if mod_lzma_key in mod_lzma_jobs : mod_data_d, lzma_hash_c, lzma_hash_u, store_path = mod_lzma_jobs[mod_lzma_key].result()
+					else : mod_data_d, lzma_hash_c, lzma_hash_u, store_path = mod_lzma_anl(*mod_lzma_args(mod, rbe_pm_met_hashes))
 					
 					print(col_c + '\n    Decompressed %s %s "%s"' % (comp[mod_comp], mod_type, mod_name) + col_e)
 					
 					# Open decompressed LZMA module for Hash validation, when Metadata info is available
 					if mod_hash != 0 :
 						# Calculate LZMA Module Hash
-						mea_hash_c = get_hash(mod_data_r, len(mod_hash) // 2) # Compressed, Header zeros included (most LZMA Modules)
+						mea_hash_c = lzma_hash_c # Compressed, Header zeros included (most LZMA Modules)
 						
 						mod_hash_c_ok = mod_hash == mea_hash_c # Check Compressed LZMA validity
 						if not mod_hash_c_ok : # Skip Uncompressed LZMA hash if not needed
-							mea_hash_u = get_hash(mod_data_d, len(mod_hash) // 2) # Uncompressed (few LZMA Modules)
+							mea_hash_u = lzma_hash_u # Uncompressed (few LZMA Modules)
 							mod_hash_u_ok = mod_hash == mea_hash_u # Check Uncompressed LZMA validity
 						
 						if param.me11_mod_bug : # Debug
@@ -6125,23 +6529,23 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 						
 						if mod_hash_c_ok or mod_hash_u_ok :
 							print(col_g + '\n    Hash of %s %s "%s" is VALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
-							with open(mod_fname, 'wb') as mod_file : mod_file.write(mod_data_d) # Decompression complete, valid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, valid data
 						else :
 							if param.me11_mod_bug and (mod_hash,mea_hash_c) not in cse_known_bad_hashes :
 								input(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e) # Debug
 							else :
 								print(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
 								
-							with open(mod_fname, 'wb') as mod_file : mod_file.write(mod_data_d) # Decompression complete, invalid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, invalid data
 							
 					# Open decompressed LZMA module for Hash validation, when Metadata info is not available
 					# When the firmware lacks Module Metadata, check RBEP > rbe and FTPR > pm Modules instead
 					elif rbe_pm_met_hashes :
-						mea_hash_c = get_hash(mod_data_r, len(rbe_pm_met_hashes[0]) // 2) # Compressed, Header zeros included (most LZMA Modules)
+						mea_hash_c = lzma_hash_c # Compressed, Header zeros included (most LZMA Modules)
 						
 						mod_hash_c_ok = mea_hash_c in rbe_pm_met_hashes # Check Compressed LZMA validity
 						if not mod_hash_c_ok : # Skip Uncompressed LZMA hash if not needed
-							mea_hash_u = get_hash(mod_data_d, len(rbe_pm_met_hashes[0]) // 2) # Uncompressed (few LZMA Modules)
+							mea_hash_u = lzma_hash_u # Uncompressed (few LZMA Modules)
 							mod_hash_u_ok = mea_hash_u in rbe_pm_met_hashes # Check Uncompressed LZMA validity
 						
 						if param.me11_mod_bug : # Debug
@@ -6157,18 +6561,18 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 						if mod_hash_c_ok :
 							print(col_g + '\n    Hash of %s %s "%s" is VALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
 							rbe_pm_met_valid.append(mea_hash_c) # Store valid RBEP > rbe or FTPR > pm Hash to single out leftovers
-							with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, valid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, valid data
 						elif mod_hash_u_ok :
 							print(col_g + '\n    Hash of %s %s "%s" is VALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
 							rbe_pm_met_valid.append(mea_hash_u) # Store valid RBEP > rbe or FTPR > pm Hash to single out leftovers
-							with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, valid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, valid data
 						else :
 							if param.me11_mod_bug and (mod_hash,mea_hash_c) not in cse_known_bad_hashes :
 								input(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e) # Debug
 							else :
 								print(col_r + '\n    Hash of %s %s "%s" is INVALID' % (comp[mod_comp], mod_type, mod_name) + col_e)
 							
-							with open(mod_fname, 'wb') as mod_file: mod_file.write(mod_data_d) # Decompression complete, invalid data
+							mod_store_write(mod_fname, mod_data_d, store_path) # Decompression complete, invalid data
 				
 				except :
 					if param.me11_mod_bug :
@@ -6186,13 +6590,13 @@ def mod_anl(cpd_offset, cpd_mod_attr, cpd_ext_attr, fw_name, ext_print, ext_phva
 						if param.me11_mod_ext : print() # Print Manifest/Metadata/Key Extension Info
 						for ext in ext_print[index + 1] :
 							ext_str = ansi_escape.sub('', str(ext)) # Ignore Colorama ANSI Escape Character Sequences
-							with open(mod_fname + '.txt', 'a', encoding = 'utf-8') as text_file : text_file.write('\n%s' % ext_str)
-							if param.write_html :
-								with open(mod_fname + '.html', 'a', encoding = 'utf-8') as text_file : text_file.write('\n<br/>\n%s' % pt_html(ext))
-							if param.write_json :
-								with open(mod_fname + '.json', 'a', encoding = 'utf-8') as text_file : text_file.write('\n%s' % pt_json(ext))
+							report_write(mod_fname + '.txt', '\n%s' % ext_str)
+							if param.write_html : report_write(mod_fname + '.html', '\n<br/>\n%s' % pt_html(ext))
+							if param.write_json : report_write(mod_fname + '.json', '\n%s' % pt_json(ext))
 							if param.me11_mod_ext : print(ext) # Print Manifest/Metadata/Key Extension Info
 						break
+		
+		if mod_lzma_pool : mod_lzma_pool.shutdown() # No LZMA worker threads remain for the next forks
 						
 	return rbe_pm_met_valid
 	
@@ -6204,8 +6608,13 @@ def cse_anl_err(ext_err_msg, checked_hashes) :
 	err_stor.append([ext_err_msg, copy_file])
 	
 	if param.me11_mod_extr :
-		if copy_file and param.me11_mod_bug : input('\n%s' % ext_err_msg)
-		else : print('\n%s' % ext_err_msg)
+		cse_anl_shown.append(err_stor[-1])
+		cse_anl_err_show(ext_err_msg, copy_file)
+
+# Show CSE Extension Analysis Error/Warning at Unpacking mode
+def cse_anl_err_show(ext_err_msg, copy_file) :
+	if copy_file and param.me11_mod_bug : input('\n%s' % ext_err_msg)
+	else : print('\n%s' % ext_err_msg)
 
 # Get CSE File System Attributes & Configuration State
 def get_mfs_anl(mfs_state, mfs_parsed_idx, intel_cfg_hash_mfs, mfs_info, pch_init_final) :
@@ -6249,12 +6658,14 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 		else : mfs_tmp_page = mfs_anl_msg(col_g + 'MFS Backup Header CRC-32 is VALID' + col_e, '', False, False, [])
 		
 		data_start = 0 # Starting Offset of each MFS Backup Chunk
-		mfs_buffer_init = b'' # Actual MFS Buffer from converted MFS Backup state
+		mfsb_parts = [] # Actual MFS Buffer parts from converted MFS Backup state
 		for pattern in mfsb_patterns : # Iterate over all 0x01030204 chunk endings
 			padding = int.from_bytes(mfsb_buffer[pattern.end():pattern.end() + 0x4], 'big') # The 4 bytes after 0x01030204 are Padding (0xFF) Size in BE
-			mfs_buffer_init += (mfsb_buffer[data_start:pattern.start()] + b'\xFF' * padding) # Append Chunk Data to Actual MFS Buffer
+			mfsb_parts.append(mfsb_buffer[data_start:pattern.start()]) # Append Chunk Data to Actual MFS Buffer
+			mfsb_parts.append(b'\xFF' * padding) # Append Chunk Padding to Actual MFS Buffer
 			data_start = pattern.end() + 0x4 # Adjust Starting Offset to 0x01030204 + Padding Size
-		mfs_buffer_init += mfsb_buffer[data_start:mfsb_end] # Append Last MFS Backup Chunk Contents as has no 0x01030204 ending
+		mfsb_parts.append(mfsb_buffer[data_start:mfsb_end]) # Append Last MFS Backup Chunk Contents as has no 0x01030204 ending
+		mfs_buffer_init = b''.join(mfsb_parts) # Actual MFS Buffer from converted MFS Backup state
 		mfs_buffer_init += b'\xFF' * (- len(mfs_buffer_init) % 0x2000) # Append EOF Alignment Padding based on MFS Page Size of 0x2000
 	
 	mfs_size = len(mfs_buffer_init) # MFS Total Length
@@ -6271,9 +6682,8 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 	mfs_page_init = [] # MFS Total Unsorted Pages Contents
 	sys_page_sorted = [] # MFS Total Sorted System Pages Contents
 	dat_page_sorted = [] # MFS Total Sorted Data Pages Contents
-	mfs_buffer_sorted = b'' # MFS Total Sorted Pages Contents Buffer
 	chunks_count_sys = 0xFFFF # MFS Actual System Chunks Count
-	all_chunks_dict = {} # MFS Total Chunk Index & Data Dictionary
+	all_chunks = [None] * (0x10000 + (page_size - page_hdr_size) // (index_size_dat + chunk_size)) # MFS Total Chunk Data by Index (16-bit Page First Chunk + Page Chunks)
 	mfs_parsed_idx = [] # Store all parsed MFS Low Level Files
 	intel_cfg_hash_mfs = None # Store MFS Low Level File 6 Hash
 	pch_init_info = [] # Store PCH Initialization Table Info
@@ -6305,9 +6715,8 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 		sys_page_sorted = [i[1] for i in sorted(sys_page_sorted, key=lambda sys: sys[0])] # Store System Pages after Page Number sorting
 		dat_page_sorted = [i[1] for i in sorted(dat_page_sorted, key=lambda dat: dat[0])] # Store Data Pages after Page First Chunk Index sorting
 		mfs_sorted = sys_page_sorted + dat_page_sorted # Store total MFS sorted System & Data Pages
-		for data in mfs_sorted : mfs_buffer_sorted += data # Store MFS sorted Pages Contents Buffer
 	
-	mfs_pages_pt = ext_table([col_y + 'Type' + col_e, col_y + 'Signature' + col_e, col_y + 'Number' + col_e, col_y + 'Erase Count' + col_e,
+	mfs_pages_pt = Lazy_Table(ext_table, [col_y + 'Type' + col_e, col_y + 'Signature' + col_e, col_y + 'Number' + col_e, col_y + 'Erase Count' + col_e,
 				   col_y + 'Next Erase' + col_e, col_y + 'First Chunk' + col_e, col_y + 'CRC-8' + col_e, col_y + 'Reserved' + col_e], True, 1)
 	mfs_pages_pt.title = col_y + 'MFS Page Records' + col_e
 	
@@ -6326,11 +6735,11 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 		
 		# MEA CRC-8 of System/Data/Scratch Page Header (0x12) with initial value of 1
 		if page_tag == 0xAA557887 :
-			page_hdr_crc8_mea = crccheck.crc.Crc8.calc(page_hdr_data[:-2] + bytes(page_hdr_data[-1]), initvalue = 1)
+			page_hdr_crc8_mea = mfs_page_crc8(page_hdr_data, False)
 		else :
 			page_type = 'Scratch' # Only one Scratch Page initially exists at the MFS
 			if not page_number : page_hdr_crc8_mea = 0 # Workaround only for Alpha CSME 11.0.0.1100 firmware (completely empty MFS Page Header)
-			else : page_hdr_crc8_mea = crccheck.crc.Crc8.calc(b'\x87\x78\x55\xAA' + page_hdr_data[4:-2] + bytes(page_hdr_data[-1]), initvalue = 1) # Add MFS Signature
+			else : page_hdr_crc8_mea = mfs_page_crc8(page_hdr_data, True) # Add MFS Signature
 		
 		mfs_pages_pt.add_row([page_type, '%0.8X' % page_tag, page_number, page_erase_count, page_erase_next, page_chunk_first, '0x%0.2X' % page_hdr_crc8_int, '0x%X' % page_reserved])
 		
@@ -6352,31 +6761,20 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 			chunk_start = page_hdr_size + index_size # System Page First Chunk Offset
 			
 			# Calculate actual System Page Chunk Indexes
-			chunk_index = 0 # Unobfuscated System Page Chunk Index
-			chunk_indexes = [] # Unobfuscated System Page Chunk Indexes
-			for i in range(len(index_values_obf)) :
-				# Obfuscated Index Bit 0 = 0 (0x8000) for Next Usable Entry, Obfuscated Index Bit 1 = 0 (0x4000) for Used Entry
-				if index_values_obf[i] & 0xC000 : break # Skip all the Unused System Page Chunks when Bits 0-1 = 1 (0xC000) = Unused Entry
-				chunk_index = Crc16_14(chunk_index) ^ index_values_obf[i] # Unobfuscated System Page Chunk Index via reverse CRC-16 14-bit (no 0 and 1)
-				chunk_indexes.append(chunk_index) # Store all Unobfuscated System Page Chunk Indexes (subset of index_values_obf when Unused Entries exist)
+			chunk_indexes = mfs_sys_indexes(index_values_obf) # Unobfuscated System Page Chunk Indexes
 			
 			# Parse all Used System Page Chunks
-			chunk_healthy = 0 # System Page Healthy Chunks Count
 			chunk_used_count = len(chunk_indexes) # System Page Total Used Chunks Count
 			for i in range(chunk_used_count) :
 				chunk_index = chunk_indexes[i] # Index of used System Page Chunk from total MFS Chunks (MFS start)
-				chunk_all = mfs_page[chunk_start + chunk_size * i:chunk_start + chunk_size * i + chunk_size] # System Page Chunk with CRC-16 (0x42)
-				chunk_raw = chunk_all[:-2] # System Page Chunk without CRC-16 (0x40)
-				all_chunks_dict[chunk_index] = chunk_raw # Store System Page Chunk Index & Contents
-				
-				chunk_crc16_int = int.from_bytes(chunk_all[0x40:0x42], 'little') # Intel CRC-16 of Chunk (0x40) with initial value of 0xFFFF
-				chunk_crc16_mea = crccheck.crc.Crc16.calc(chunk_raw + struct.pack('<H', chunk_index), initvalue = 0xFFFF) # MEA CRC-16 of Chunk (0x40) with initial value of 0xFFFF
-				
-				if chunk_crc16_mea != chunk_crc16_int :
-					mfs_tmp_page = mfs_anl_msg(col_r + 'Error: MFS %s Page %d > Chunk %d CRC-16 0x%0.4X is INVALID, expected 0x%0.4X!' 
-								   % (page_type, page_number, chunk_index, chunk_crc16_int, chunk_crc16_mea) + col_e, 'error', True, True, mfs_tmp_page)
-				else :
-					chunk_healthy += 1 #mfs_tmp_page = mfs_anl_msg(col_g + 'MFS %s Page %d > Chunk %d CRC-16 is VALID' % (page_type, page_number, chunk_index) + col_e, '', True, True, mfs_tmp_page)
+				all_chunks[chunk_index] = mfs_page[chunk_start + chunk_size * i:chunk_start + chunk_size * i + chunk_size - 2] # Store System Page Chunk Index & Contents (0x40)
+			
+			# Verify all Used System Page Chunks CRC-16
+			chunk_errors = mfs_page_crc16(mfs_page, chunk_start, chunk_size, enumerate(chunk_indexes))
+			for chunk_index, chunk_crc16_int, chunk_crc16_mea in chunk_errors :
+				mfs_tmp_page = mfs_anl_msg(col_r + 'Error: MFS %s Page %d > Chunk %d CRC-16 0x%0.4X is INVALID, expected 0x%0.4X!' 
+							   % (page_type, page_number, chunk_index, chunk_crc16_int, chunk_crc16_mea) + col_e, 'error', True, True, mfs_tmp_page)
+			chunk_healthy = chunk_used_count - len(chunk_errors) # System Page Healthy Chunks Count
 			
 			if chunk_used_count and chunk_used_count == chunk_healthy :
 				mfs_tmp_page = mfs_anl_msg(col_g + 'All MFS %s Page %d Chunks (%d) CRC-16 are VALID' % (page_type, page_number, chunk_used_count) + col_e, '', True, True, mfs_tmp_page)
@@ -6390,23 +6788,20 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 			chunk_start = page_hdr_size + index_size # Data Page First Chunk Offset
 			
 			# Parse all Used Data Page Chunks
-			chunk_healthy = 0 # Data Page Healthy Chunks Count
-			chunk_used_count = 0 # Data Page Total Used Chunks Count
+			chunk_slots = [] # Data Page Used Chunk Slots & Indexes
 			for i in range(len(index_values)) :
 				if index_values[i] == 0 : # Used Data Page Chunk Index = 0x00, Unused = 0xFF
-					chunk_used_count += 1 # Add Used Data Page Chunk to Total Used Count
 					chunk_index = page_chunk_first + i # Index of used Data Page Chunk from total MFS Chunks (MFS start)
-					chunk_all = mfs_page[chunk_start + chunk_size * i:chunk_start + chunk_size * i + chunk_size] # Data Page Chunk with CRC-16 (0x42)
-					chunk_raw = chunk_all[:-2] # Data Page Chunk without CRC-16 (0x40)
-					all_chunks_dict[chunk_index] = chunk_raw # Store Data Page Chunk Index & Contents
-					chunk_crc16_int = int.from_bytes(chunk_all[0x40:0x42], 'little') # Intel CRC-16 of Chunk (0x40) with initial value of 0xFFFF
-					chunk_crc16_mea = crccheck.crc.Crc16.calc(chunk_raw + struct.pack('<H', chunk_index), initvalue = 0xFFFF) # MEA CRC-16 of Chunk (0x40) with initial value of 0xFFFF
-					
-					if chunk_crc16_mea != chunk_crc16_int :
-						mfs_tmp_page = mfs_anl_msg(col_r + 'Error: MFS %s Page %d > Chunk %d CRC-16 0x%0.4X is INVALID, expected 0x%0.4X!' 
-									   % (page_type, page_number, chunk_index, chunk_crc16_int, chunk_crc16_mea) + col_e, 'error', True, True, mfs_tmp_page)
-					else :
-						chunk_healthy += 1 #mfs_tmp_page = mfs_anl_msg(col_g + 'MFS %s Page %d > Chunk %d CRC-16 is VALID' % (page_type, page_number, chunk_index) + col_e, '', True, True, mfs_tmp_page)
+					all_chunks[chunk_index] = mfs_page[chunk_start + chunk_size * i:chunk_start + chunk_size * i + chunk_size - 2] # Store Data Page Chunk Index & Contents (0x40)
+					chunk_slots.append((i, chunk_index))
+			chunk_used_count = len(chunk_slots) # Data Page Total Used Chunks Count
+			
+			# Verify all Used Data Page Chunks CRC-16
+			chunk_errors = mfs_page_crc16(mfs_page, chunk_start, chunk_size, chunk_slots)
+			for chunk_index, chunk_crc16_int, chunk_crc16_mea in chunk_errors :
+				mfs_tmp_page = mfs_anl_msg(col_r + 'Error: MFS %s Page %d > Chunk %d CRC-16 0x%0.4X is INVALID, expected 0x%0.4X!' 
+							   % (page_type, page_number, chunk_index, chunk_crc16_int, chunk_crc16_mea) + col_e, 'error', True, True, mfs_tmp_page)
+			chunk_healthy = chunk_used_count - len(chunk_errors) # Data Page Healthy Chunks Count
 			
 			if chunk_used_count and chunk_used_count == chunk_healthy :
 				mfs_tmp_page = mfs_anl_msg(col_g + 'All MFS %s Page %d Chunks (%d) CRC-16 are VALID' % (page_type, page_number, chunk_used_count) + col_e, '', True, True, mfs_tmp_page)
@@ -6423,13 +6818,13 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 	all_mfs_sys = bytearray(chunks_count_sys * (chunk_size - 2)) # Empty System Area Buffer
 	for i in range(chunks_count_sys) :
 		# The final System Area Buffer must include all empty chunks for proper File Allocation Table parsing
-		if i in all_chunks_dict : all_mfs_sys[i * (chunk_size - 2):(i + 1) * (chunk_size - 2)] = bytearray(all_chunks_dict[i])
+		if all_chunks[i] is not None : all_mfs_sys[i * (chunk_size - 2):(i + 1) * (chunk_size - 2)] = all_chunks[i]
 	
 	# Parse MFS System Volume Structure
-	if not all_chunks_dict :
+	if all_chunks[0] is None :
 		mfs_anl_msg(col_r + 'Error: MFS final System Area Buffer is empty!' + col_e, 'error', False, False, [])
 		return mfs_parsed_idx, intel_cfg_hash_mfs, mfs_info, pch_init_final, -0x1, config_rec_size # The final System Area Buffer must not be empty
-	vol_hdr = get_struct(all_chunks_dict[0], 0, MFS_Volume_Header) # System Volume is at the LAST Index 0 Chunk (the dictionary does that automatically)
+	vol_hdr = get_struct(all_chunks[0], 0, MFS_Volume_Header) # System Volume is at the LAST Index 0 Chunk (later Chunks replace earlier ones)
 	if param.me11_mod_extr :
 		print('\n%s' % vol_hdr.mfs_print()) # Print System Volume Structure Info during CSE Unpacking
 		mfs_info.append(vol_hdr.mfs_print()) # Store System Volume Structure Info during CSE Unpacking
@@ -6449,7 +6844,7 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 		if fat_values[index] in (0x0000,0xFFFE,0xFFFF) : # 0x0000 = Unused, 0xFFFE = Erased, 0xFFFF = Used but Empty
 			mfs_files.append([index, None]) # Store MFS Low Level File Index & Contents
 		else :
-			file_chunks = b'' # Initial MFS Low Level File Contents Buffer
+			file_chunks = [] # Initial MFS Low Level File Contents Chunks
 			fat_value = fat_values[index] # Initial Used File FAT Value
 			
 			# Parse Data/Chunk FAT Values for each Used Low Level File
@@ -6461,21 +6856,21 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 				
 				# Data Page Chunks start after System Page Chunks and their Volume FAT Values
 				file_chunk_index = chunks_count_sys + fat_value - vol_file_rec # Determine File Chunk Index for MFS Chunk Index & Data Dictionary use
-				if file_chunk_index not in all_chunks_dict : # The File Chunk index/key must exist at the MFS Chunk Index & Data Dictionary
+				if file_chunk_index < 0 or file_chunk_index >= len(all_chunks) or all_chunks[file_chunk_index] is None : # The File Chunk index must exist at the MFS Total Chunk Data
 					mfs_tmp_page = mfs_anl_msg(col_r + 'Error: Detected MFS File %d > Chunk %d not in Total Chunk Index/Data Area!' % (index,file_chunk_index) + col_e, 'error', False, False, [])
 					break # Critical error while parsing Used File FAT Value
 				
-				file_chunk = all_chunks_dict[file_chunk_index] # Get File Chunk contents from the MFS Chunk Index & Data Dictionary
+				file_chunk = all_chunks[file_chunk_index] # Get File Chunk contents from the MFS Total Chunk Data
 				fat_value = fat_values[fat_value] # Get Next Chunk FAT Value by using the current value as List index (starts from 0)
 				
 				# Small FAT Values (1 - 64) are markers for both EOF and Size of last Chunk
 				if 1 <= fat_value <= (chunk_size - 2) :
-					file_chunks += file_chunk[:fat_value] # Append the last File Chunk with its size adjusted based on the EOF FAT Value marker
+					file_chunks.append(file_chunk[:fat_value]) # Append the last File Chunk with its size adjusted based on the EOF FAT Value marker
 					break # File ends when the Next FAT Value is between 1 and 64 (EOF marker)
 				
-				file_chunks += file_chunk # Append File Chunk Contents to the MFS Low Level File Contents Buffer
+				file_chunks.append(file_chunk) # Append File Chunk Contents to the MFS Low Level File Contents Chunks
 			
-			mfs_files.append([index, file_chunks]) # Store MFS Low Level File Index & Contents
+			mfs_files.append([index, b''.join(file_chunks)]) # Store MFS Low Level File Index & Contents
 	
 	if all_mfs_sys[vol_hdr_size + fat_count * 2:] != b'\x00' * fat_trail : # MFS FAT End Trail Contents should be all zeros
 		mfs_tmp_page = mfs_anl_msg(col_r + 'Error: Detected additional MFS System Buffer contents after FAT ending!' + col_e, 'error', False, False, [])
@@ -6581,7 +6976,7 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 			init_folder = os.path.join(mea_dir, mfs_folder, '008 Home Directory', '') # MFS Home Directory Parent folder for printing
 			
 			# Detect MFS Home Directory Record Size
-			home_rec_patt = list(re.compile(br'\x2E[\x00\xAA]{10}').finditer(mfs_file[1][:])) # Find the first Current (.) & Parent (..) directory markers
+			home_rec_patt = list(re.compile(br'\x2E[\x00\xAA]{10}').finditer(mfs_file[1])) # Find the first Current (.) & Parent (..) directory markers
 			if len(home_rec_patt) < 2 : mfs_tmp_page = mfs_anl_msg(col_r + 'Error: Detected unknown Home Directory Record Structure!' + col_e, 'error', False, False, [])
 			home_rec_size = home_rec_patt[1].start() - home_rec_patt[0].start() - 1 # Determine MFS Home Directory Record Size via pattern offset difference
 			file_8_data = mfs_file[1][:-sec_hdr_size] # MFS Home Directory Root/Start (Low Level File 8) Contents
@@ -6593,13 +6988,13 @@ def mfs_anl(mfs_folder, mfs_start, mfs_end, variant) :
 			
 			# Generate MFS Home Directory Records Log
 			if sec_hdr_size == 0x34 :
-				mfs_pt = ext_table([col_y + 'Index' + col_e, col_y + 'Path' + col_e, col_y + 'Type' + col_e, col_y + 'Size' + col_e, col_y + 'Integrity' + col_e, col_y + 'IR Salt' + col_e,
+				mfs_pt = Lazy_Table(ext_table, [col_y + 'Index' + col_e, col_y + 'Path' + col_e, col_y + 'Type' + col_e, col_y + 'Size' + col_e, col_y + 'Integrity' + col_e, col_y + 'IR Salt' + col_e,
 				col_y + 'Encryption' + col_e, col_y + 'SVN' + col_e, col_y + 'Nonce' + col_e, col_y + 'AntiReplay' + col_e, col_y + 'AR Index' + col_e, col_y + 'AR Random' + col_e,
 				col_y + 'AR Counter' + col_e, col_y + 'Keys' + col_e, col_y + 'Rights' + col_e, col_y + 'User ID' + col_e, col_y + 'Group ID' + col_e, col_y + 'Unknown Access' + col_e,
 				col_y + 'Unknown Integrity 1' + col_e, col_y + 'HMAC SHA-256' + col_e, col_y + 'Unknown Integrity 2' + col_e], True, 1)
 				mfs_pt.title = col_y + 'MFS 008 Home Directory Records' + col_e
 			elif sec_hdr_size == 0x28 :
-				mfs_pt = ext_table([col_y + 'Index' + col_e, col_y + 'Path' + col_e, col_y + 'Type' + col_e, col_y + 'Size' + col_e, col_y + 'Integrity' + col_e, col_y + 'IR Salt' + col_e,
+				mfs_pt = Lazy_Table(ext_table, [col_y + 'Index' + col_e, col_y + 'Path' + col_e, col_y + 'Type' + col_e, col_y + 'Size' + col_e, col_y + 'Integrity' + col_e, col_y + 'IR Salt' + col_e,
 				col_y + 'Encryption' + col_e, col_y + 'SVN' + col_e, col_y + 'AntiReplay' + col_e, col_y + 'AR Index' + col_e, col_y + 'AR Random' + col_e, col_y + 'AR Counter' + col_e,
 				col_y + 'Keys' + col_e, col_y + 'Rights' + col_e, col_y + 'User ID' + col_e, col_y + 'Group ID' + col_e, col_y + 'Unknown Access' + col_e, col_y + 'Unknown Integrity 1' + col_e,
 				col_y + 'HMAC MD5' + col_e, col_y + 'Unknown Integrity 2' + col_e, col_y + 'Unknown Integrity 3' + col_e], True, 1)
@@ -6643,7 +7038,8 @@ def mfs_home_anl(mfs_files, file_buffer, file_records, root_folder, home_rec_siz
 		unk_salt = file_rec.UnknownSalt # MFS Home Directory Record Unknown Integrity Salt
 		file_index,integrity_salt,fs_id,unix_rights,integrity,encryption,anti_replay,acc_unk0,key_type,rec_type,acc_unk1 = file_rec.get_flags() # Get MFS Home Directory Record Flags
 		
-		file_data = mfs_files[file_index][1] if mfs_files[file_index][1] else b'' # MFS Home Directory Record Contents
+		file_all = mfs_files[file_index][1] or b'' # MFS Home Directory Record Contents & Integrity
+		file_data = file_all # MFS Home Directory Record Contents
 		
 		acc_unk_flags = '{0:01b}b'.format(acc_unk0) + ' {0:01b}b'.format(acc_unk1) # Store Unknown Record Access Flags
 		
@@ -6666,8 +7062,8 @@ def mfs_home_anl(mfs_files, file_buffer, file_records, root_folder, home_rec_siz
 		# Perform Integrity related actions
 		if integrity :
 			# Split MFS Home Directory Record Contents & Integrity, if Integrity Protection is present
-			file_data = mfs_files[file_index][1][:-sec_hdr_size] if mfs_files[file_index][1] else b'' # MFS Home Directory Record Contents without Integrity
-			file_sec = mfs_files[file_index][1][-sec_hdr_size:] if mfs_files[file_index][1] else b'' # MFS Home Directory Record Integrity without Contents
+			file_data = file_all[:-sec_hdr_size] # MFS Home Directory Record Contents without Integrity
+			file_sec = file_all[-sec_hdr_size:] # MFS Home Directory Record Integrity without Contents
 			
 			# Parse MFS Home Directory Record Integrity Info
 			if file_sec : 
@@ -6700,12 +7096,12 @@ def mfs_home_anl(mfs_files, file_buffer, file_records, root_folder, home_rec_siz
 			home_path = os.path.normpath(os.path.join(root_folder, '..', 'home')) # Set MFS Home Directory Root/Start Record Path
 			file_rec_8 = file_rec # Duplicate MFS Home Directory Root/Start Record for adjustments
 			file_rec_8.FileName = b'home' # Adjust MFS Home Directory Root/Start Record File Name from "." to "home" for printing
-			file_rec_p = file_rec_8.mfs_print() # Get MFS Home Directory Root/Start Record PrettyTable Object after adjustment
+			file_rec_p = Lazy_Table(file_rec_8.mfs_print) # Get MFS Home Directory Root/Start Record PrettyTable Object after adjustment
 			file_rec_p.add_row(['Path', 'home']) # Add MFS Home Directory Root/Start Record Local Path "home" for printing
 			mfs_txt(file_rec_p, home_path, home_path, 'w', False) # Store/Print MFS Home Directory Root/Start Record Info
 			sec_path = os.path.normpath(os.path.join(init_folder, 'home_integrity')) # Set MFS Home Directory Root/Start Record Integrity Path
 			mfs_write(os.path.normpath(os.path.join(init_folder)), sec_path, file_sec) # Store MFS Home Directory Root/Start Record Integrity Contents
-			mfs_txt(sec_hdr.mfs_print(), home_path, home_path + '_integrity', 'w', False) # Store/Print MFS Home Directory Root/Start Record Integrity Info
+			mfs_txt(Lazy_Table(sec_hdr.mfs_print), home_path, home_path + '_integrity', 'w', False) # Store/Print MFS Home Directory Root/Start Record Integrity Info
 			
 		# Set current Low Level File as Parsed, skip Folder Marker Records
 		if file_name not in ('.','..') : mfs_parsed_idx.append(file_index)
@@ -6742,14 +7138,14 @@ def mfs_home_anl(mfs_files, file_buffer, file_records, root_folder, home_rec_siz
 			file_path = os.path.normpath(os.path.join(root_folder, file_name)) # Set MFS Home Directory Record/File Path
 			rec_path = os.path.relpath(file_path, start=init_folder) if file_index >= 8 else mfs_type[fs_id] # Set actual Record Path for printing
 			mfs_write(os.path.normpath(os.path.join(root_folder)), file_path, file_data) # Store MFS Home Directory Record/File Contents
-			file_rec_p = file_rec.mfs_print() # Get MFS Home Directory Record/File PrettyTable Object for printing adjustments
+			file_rec_p = Lazy_Table(file_rec.mfs_print) # Get MFS Home Directory Record/File PrettyTable Object for printing adjustments
 			file_rec_p.add_row(['Path', rec_path]) # Add MFS Home Directory Record/File Local Path for printing
 			mfs_txt(file_rec_p, os.path.normpath(os.path.join(root_folder)), file_path, 'w', False) # Store/Print MFS Home Directory Record/File Info
 			
 			if integrity : # Store & Print MFS Home Directory Record/File Integrity
 				sec_path = os.path.normpath(os.path.join(root_folder, file_name + '_integrity')) # Set MFS Home Directory Record/File Integrity Path
 				mfs_write(os.path.normpath(os.path.join(root_folder)), sec_path, file_sec) # Store MFS Home Directory Record/File Integrity Contents
-				mfs_txt(sec_hdr.mfs_print(), os.path.normpath(os.path.join(root_folder)), sec_path, 'w', False) # Store/Print MFS Home Directory Record/File Integrity Info
+				mfs_txt(Lazy_Table(sec_hdr.mfs_print), os.path.normpath(os.path.join(root_folder)), sec_path, 'w', False) # Store/Print MFS Home Directory Record/File Integrity Info
 			
 			# Append MFS Home Directory Record/File Info to Log
 			if sec_hdr_size == 0x34 :
@@ -6764,14 +7160,14 @@ def mfs_home_anl(mfs_files, file_buffer, file_records, root_folder, home_rec_siz
 		else :
 			folder_path = os.path.normpath(os.path.join(root_folder, file_name, '')) # Set currently working MFS Home Directory Record/Folder Path
 			rec_path = os.path.relpath(folder_path, start=init_folder) if file_index >= 8 else mfs_type[fs_id] # Set actual Record Path for printing
-			file_rec_p = file_rec.mfs_print() # Get MFS Home Directory Record/Folder PrettyTable Object for printing adjustments
+			file_rec_p = Lazy_Table(file_rec.mfs_print) # Get MFS Home Directory Record/Folder PrettyTable Object for printing adjustments
 			file_rec_p.add_row(['Path', rec_path]) # Add MFS Home Directory Record/File Local Path for printing
 			mfs_txt(file_rec_p, folder_path, folder_path, 'w', False) # Store/Print MFS Home Directory Record/Folder Info
 			
 			if integrity : # Store & Print MFS Home Directory Record/Folder Integrity
 				sec_path = os.path.normpath(os.path.join(root_folder, file_name + '_integrity')) # Set MFS Home Directory Record/Folder Integrity Path
 				mfs_write(os.path.normpath(os.path.join(root_folder)), sec_path, file_sec) # Store MFS Home Directory Record/Folder Integrity Contents
-				mfs_txt(sec_hdr.mfs_print(), folder_path, folder_path + '_integrity', 'w', False) # Store/Print MFS Home Directory Record/Folder Integrity Info
+				mfs_txt(Lazy_Table(sec_hdr.mfs_print), folder_path, folder_path + '_integrity', 'w', False) # Store/Print MFS Home Directory Record/Folder Integrity Info
 			
 			# Append MFS Home Directory Record/Folder Info to Log
 			if sec_hdr_size == 0x34 :
@@ -6784,24 +7180,35 @@ def mfs_home_anl(mfs_files, file_buffer, file_records, root_folder, home_rec_siz
 			
 			mfs_home_anl(mfs_files, file_data, file_records, folder_path, home_rec_size, sec_hdr_size, mfs_parsed_idx, init_folder, mfs_pt) # Recursively parse all Folder Records
 	
+# Load MFS File Table Dictionary file once per process
+def mfs_ftbl_load(ftbl_json) :
+	if not mfs_ftbl :
+		with open(ftbl_json, 'r') as json_file : ftbl_dict = json.load(json_file)
+		
+		mfs_ftbl['Dictionaries'] = {int(ftbl_id, 16) for ftbl_id in ftbl_dict} # File Table Dictionary IDs
+		mfs_ftbl['Paths'] = {(int(ftbl_id, 16), int(file_id, 16)) : file_path for ftbl_id in ftbl_dict for file_id, file_path in ftbl_dict[ftbl_id].items()}
+	
+	return mfs_ftbl['Dictionaries'], mfs_ftbl['Paths']
+
 # Parse all MFS Configuration (Low Level Files 6 & 7) Records
 # noinspection PyUnusedLocal
 def mfs_cfg_anl(mfs_file, buffer, rec_folder, root_folder, config_rec_size, pch_init_info, vol_ftbl_id) :
 	mfs_pt = None
-	ftbl_dict = {}
+	ftbl_ids = set()
+	ftbl_paths = {}
 	ftbl_json = os.path.join(mea_dir, 'FileTable.dat')
 	
 	# Generate MFS Configuration Records Log
 	if config_rec_size == 0x1C :
-		mfs_pt = ext_table([col_y + 'Path' + col_e, col_y + 'Type' + col_e, col_y + 'Size' + col_e, col_y + 'Integrity' + col_e, col_y + 'Encryption' + col_e,
+		mfs_pt = Lazy_Table(ext_table, [col_y + 'Path' + col_e, col_y + 'Type' + col_e, col_y + 'Size' + col_e, col_y + 'Integrity' + col_e, col_y + 'Encryption' + col_e,
 				 col_y + 'AntiReplay' + col_e, col_y + 'Rights' + col_e, col_y + 'User ID' + col_e, col_y + 'Group ID' + col_e, col_y + 'FIT' + col_e,
 				 col_y + 'MCA' + col_e, col_y + 'Reserved' + col_e, col_y + 'Unknown Access' + col_e, col_y + 'Unknown Options' + col_e], True, 1)
 	elif config_rec_size == 0xC :
-		mfs_pt = ext_table([col_y + 'Path' + col_e, col_y + 'ID' + col_e, col_y + 'Size' + col_e, col_y + 'FIT' + col_e, col_y + 'Unknown Flags' + col_e], True, 1)
+		mfs_pt = Lazy_Table(ext_table, [col_y + 'Path' + col_e, col_y + 'ID' + col_e, col_y + 'Size' + col_e, col_y + 'FIT' + col_e, col_y + 'Unknown Flags' + col_e], True, 1)
 		
 		# Check if MFS File Table Dictionary file exists
 		if os.path.isfile(ftbl_json) :
-			with open(ftbl_json, 'r') as json_file : ftbl_dict = json.load(json_file)
+			ftbl_ids, ftbl_paths = mfs_ftbl_load(ftbl_json)
 		else :
 			mfs_tmp_page = mfs_anl_msg(col_r + 'Error: MFS File Table Dictionary file is missing!' + col_e, 'error', False, False, [])
 		
@@ -6809,8 +7216,8 @@ def mfs_cfg_anl(mfs_file, buffer, rec_folder, root_folder, config_rec_size, pch_
 	
 	rec_count = int.from_bytes(buffer[:4], 'little') # MFS Configuration Records Count
 	for rec in range(rec_count) : # Parse all MFS Configuration Records
-		rec_hdr = get_struct(buffer[4:], rec * config_rec_size, config_rec_struct[config_rec_size]) # MFS Configuration Record Structure
-		rec_hdr_pt = rec_hdr.mfs_print() # MFS Configuration Record PrettyTable Object
+		rec_hdr = get_struct(buffer, 4 + rec * config_rec_size, config_rec_struct[config_rec_size]) # MFS Configuration Record Structure, Records start after Count
+		rec_hdr_pt = Lazy_Table(rec_hdr.mfs_print) # MFS Configuration Record PrettyTable Object
 		
 		if config_rec_size == 0x1C :
 			rec_name = rec_hdr.FileName.decode('utf-8') # File or Folder Name
@@ -6852,18 +7259,18 @@ def mfs_cfg_anl(mfs_file, buffer, rec_folder, root_folder, config_rec_size, pch_
 			rec_size = rec_hdr.FileSize # File Size
 			fitc_cfg,flag_unk = rec_hdr.get_flags() # Get Record Flags
 			
-			if '%0.2X' % vol_ftbl_id not in ftbl_dict :
-				if ftbl_dict : mfs_tmp_page = mfs_anl_msg(col_r + 'Error: File Table Dictionary %0.2X does not exist!' % vol_ftbl_id + col_e, 'error', False, False, [])
+			if vol_ftbl_id not in ftbl_ids :
+				if ftbl_ids : mfs_tmp_page = mfs_anl_msg(col_r + 'Error: File Table Dictionary %0.2X does not exist!' % vol_ftbl_id + col_e, 'error', False, False, [])
 				rec_path = os.path.normpath(os.path.join('/Unknown', '%0.8X.bin' % rec_id)) # Set generic/unknown File local path when errors occur
 				rec_file = os.path.normpath(rec_folder + rec_path) # Set generic/unknown File actual path when errors occur
 				rec_parent = os.path.normpath(os.path.join(rec_folder, 'Unknown')) # Set generic/unknown parent Folder actual path when errors occur
-			elif '%0.8X' % rec_id not in ftbl_dict['%0.2X' % vol_ftbl_id] :
-				if ftbl_dict : mfs_tmp_page = mfs_anl_msg(col_r + 'Error: File Table Dictionary %0.2X does not contain ID %0.8X!' % (vol_ftbl_id,rec_id) + col_e, 'error', False, False, [])
+			elif (vol_ftbl_id,rec_id) not in ftbl_paths :
+				mfs_tmp_page = mfs_anl_msg(col_r + 'Error: File Table Dictionary %0.2X does not contain ID %0.8X!' % (vol_ftbl_id,rec_id) + col_e, 'error', False, False, [])
 				rec_path = os.path.normpath(os.path.join('/Unknown', '%0.8X.bin' % rec_id)) # Set generic/unknown File local path when errors occur
 				rec_file = os.path.normpath(rec_folder + rec_path) # Set generic/unknown File actual path when errors occur
 				rec_parent = os.path.normpath(os.path.join(rec_folder, 'Unknown')) # Set generic/unknown parent Folder actual path when errors occur
 			else :
-				rec_path = os.path.normpath(ftbl_dict['%0.2X' % vol_ftbl_id]['%0.8X' % rec_id]) # Get File local path from FTBL Dictionary
+				rec_path = os.path.normpath(ftbl_paths[(vol_ftbl_id,rec_id)]) # Get File local path from FTBL Dictionary
 				rec_file = os.path.normpath(rec_folder + rec_path) # Set File actual path from FTBL Dictionary
 				rec_parent = os.path.normpath(os.path.dirname(rec_file)) # Adjust parent Folder actual path from FTBL Dictionary
 			
@@ -6916,18 +7323,84 @@ def mphytbl(mfs_file, rec_data, pch_init_info) :
 	
 	return pch_init_info
 	
-# MFS 14-bit CRC-16 for System Page Chunk Indexes (from parseMFS by Dmitry Sklyarov)
-def Crc16_14(w, crc=0x3FFF) :
+# MFS CRC-16 Table for System Page Chunk Indexes, built once
+def Crc16_tab() :
 	CRC16tab = [0]*256
 	for i in range(256):
 		r = i << 8
 		for j in range(8): r = (r << 1) ^ (0x1021 if r & 0x8000 else 0)
 		CRC16tab[i] = r & 0xFFFF
 	
-	for b in bytearray(struct.pack('<H', w)): crc = (CRC16tab[b ^ (crc >> 8)] ^ (crc << 8)) & 0x3FFF
+	return CRC16tab
+
+CRC16tab = Crc16_tab()
+
+# MFS 14-bit CRC-16 for System Page Chunk Indexes (from parseMFS by Dmitry Sklyarov)
+def Crc16_14(w, crc=0x3FFF) :
+	for b in (w & 0xFF, w >> 8): crc = (CRC16tab[b ^ (crc >> 8)] ^ (crc << 8)) & 0x3FFF
+	
+	return crc
+	
+# MFS 14-bit CRC-16 of every possible System Page Chunk Index, built on first use
+CRC16_14tab = []
+
+# Unobfuscate MFS System Page Chunk Indexes, until the first Unused Entry
+def mfs_sys_indexes(index_values_obf) :
+	if not CRC16_14tab : CRC16_14tab.extend(Crc16_14(w) for w in range(0x4000)) # Unobfuscated Indexes are 14-bit
+	
+	chunk_index = 0 # Unobfuscated System Page Chunk Index
+	chunk_indexes = [] # Unobfuscated System Page Chunk Indexes
+	for index_obf in index_values_obf :
+		# Obfuscated Index Bit 0 = 0 (0x8000) for Next Usable Entry, Obfuscated Index Bit 1 = 0 (0x4000) for Used Entry
+		if index_obf & 0xC000 : break # Skip all the Unused System Page Chunks when Bits 0-1 = 1 (0xC000) = Unused Entry
+		chunk_index = CRC16_14tab[chunk_index] ^ index_obf # Unobfuscated System Page Chunk Index via reverse CRC-16 14-bit (no 0 and 1)
+		chunk_indexes.append(chunk_index) # Store all Unobfuscated System Page Chunk Indexes (subset of index_values_obf when Unused Entries exist)
+	
+	return chunk_indexes
+
+# MFS CRC-8 Table for Page Headers, built once
+def Crc8_tab() :
+	CRC8tab = [0]*256
+	for i in range(256):
+		r = i
+		for j in range(8): r = (r << 1) ^ (0x07 if r & 0x80 else 0)
+		CRC8tab[i] = r & 0xFF
+	
+	return CRC8tab
+
+CRC8tab = Crc8_tab()
+
+# MFS CRC-8 (0x07) of Page Header data, chained via crc
+def mfs_crc8(data, crc) :
+	for b in data : crc = CRC8tab[crc ^ b]
 	
 	return crc
+
+# MFS CRC-8 of Page Header (0x12) with initial value of 1
+def mfs_page_crc8(page_hdr_data, is_scratch) :
+	page_hdr_view = memoryview(page_hdr_data)
+	
+	if is_scratch : crc = mfs_crc8(page_hdr_view[4:-2], mfs_crc8(b'\x87\x78\x55\xAA', 1)) # Add MFS Signature
+	else : crc = mfs_crc8(page_hdr_view[:-2], 1)
+	
+	return mfs_crc8(bytes(page_hdr_data[-1]), crc)
+
+# Verify MFS Page Chunks CRC-16 (0x1021) with initial value of 0xFFFF, chunk_slots = [(Page Chunk Slot, Chunk Index)]
+# Returns the Chunk Index, Intel CRC-16 & MEA CRC-16 of each INVALID Chunk, in Page order
+def mfs_page_crc16(mfs_page, chunk_start, chunk_size, chunk_slots) :
+	page_view = memoryview(mfs_page)
+	crc_errors = []
+	
+	for chunk_slot, chunk_index in chunk_slots :
+		chunk_raw_start = chunk_start + chunk_size * chunk_slot # Page Chunk without CRC-16 (0x40) Offset
+		chunk_raw_end = chunk_raw_start + chunk_size - 2 # Page Chunk CRC-16 Offset
+		chunk_crc16_int = int.from_bytes(page_view[chunk_raw_end:chunk_raw_end + 2], 'little') # Intel CRC-16 of Chunk (0x40)
+		chunk_crc16_mea = binascii.crc_hqx(chunk_index.to_bytes(2, 'little'), binascii.crc_hqx(page_view[chunk_raw_start:chunk_raw_end], 0xFFFF)) # MEA CRC-16 of Chunk (0x40) + Index
+		
+		if chunk_crc16_mea != chunk_crc16_int : crc_errors.append((chunk_index, chunk_crc16_int, chunk_crc16_mea))
 	
+	return crc_errors
+
 # Write/Print MFS Structures Information
 def mfs_txt(struct_print, folder_path, file_path_wo_ext, mode, is_log) :
 	if param.me11_mod_extr : # Write Text File during CSE Unpacking
@@ -6937,17 +7410,17 @@ def mfs_txt(struct_print, folder_path, file_path_wo_ext, mode, is_log) :
 		
 		if param.me11_mod_ext and is_log : print('\n%s' % struct_txt) # Print Structure Info
 		
-		with open(file_path_wo_ext + '.txt', mode, encoding = 'utf-8') as txt : txt.write('\n%s' % struct_txt) # Store Structure Info Text File
-		if param.write_html :
-			with open(file_path_wo_ext + '.html', mode, encoding = 'utf-8') as html : html.write('\n<br/>\n%s' % pt_html(struct_print)) # Store Structure Info HTML File
-		if param.write_json :
-			with open(file_path_wo_ext + '.json', mode, encoding = 'utf-8') as html : html.write('\n%s' % pt_json(struct_print)) # Store Structure Info JSON File
+		report_write(file_path_wo_ext + '.txt', '\n%s' % struct_txt, mode) # Store Structure Info Text File
+		if param.write_html : report_write(file_path_wo_ext + '.html', '\n<br/>\n%s' % pt_html(struct_print), mode) # Store Structure Info HTML File
+		if param.write_json : report_write(file_path_wo_ext + '.json', '\n%s' % pt_json(struct_print), mode) # Store Structure Info JSON File
 	
 # Write MFS File Contents
 def mfs_write(folder_path, file_path, data) :
 	if param.me11_mod_extr or param.me11_mod_bug : # Write File during CSE Unpacking
 		os.makedirs(folder_path, exist_ok=True) # Create the File's parent Folder, if needed
 		
+		report_flush(file_path) # MFS File may share its path with a stored Report File
+		
 		with open(file_path, 'wb') as file : file.write(data)
 		
 # Store and show MFS Analysis Errors
@@ -7114,13 +7587,8 @@ def pmc_anl(mn2_info, cpd_mod_info) :
 		pmc_name_db = '%s_%s_%s_%s_%s_%s' % (pmc_platform, pmc_fw_ver, pmc_pch_rev[0], mn2_info[7], pmc_mn2_signed_db, mn2_info[6])
 	
 	# Search DB for PMC firmware
-	fw_db = db_open()
-	for line in fw_db :
-		if pmc_name_db in line :
-			break # Break loop at 1st hash match
-	else :
+	if mea_db.get_line(pmc_name_db) is None :
 		note_stor.append([col_g + 'Note: This PMC %s firmware was not found at the database, please report it!' % pmc_platform + col_e, True])
-	fw_db.close()
 	
 	return pmc_fw_ver, mn2_info[0], pmc_pch_sku, pmc_pch_rev, mn2_info[3], pmc_mn2_signed, pmc_mn2_signed_db, pmcp_upd_found, pmc_platform, \
 		   mn2_info[7], mn2_info[8], mn2_info[9]
@@ -7130,39 +7598,20 @@ def pmc_chk(pmc_mn2_signed, release, pmc_pch_gen, pmc_gen_list, pmc_pch_sku, sku
 	if pmc_mn2_signed != release or pmc_pch_gen not in pmc_gen_list or pmc_pch_sku != sku_result or (sku_stp != 'NaN' and pmc_pch_rev[0] not in sku_stp) :
 		warn_stor.append([col_m + 'Warning: Incompatible PMC %s firmware detected!' % pmc_platform + col_e, False])
 
-# CSE Huffman Dictionary Loader by IllegalArgument
-# Dictionaries by Dmitry Sklyarov & IllegalArgument
-# Message Verbosity: All | Error | None
-def cse_huffman_dictionary_load(cse_variant, cse_major, verbosity) :
-	HUFFMAN_SHAPE = []
-	HUFFMAN_SYMBOLS = {}
-	HUFFMAN_UNKNOWNS = {}
+# CSE Huffman Dictionary Parser by IllegalArgument
+# Parses all dictionary versions of Huffman.dat, dictionary messages are shown by the loader
+def cse_huffman_dictionary_parse(huffman_dict) :
 	mapping_types = {'code' : 0x20, 'data' : 0x60}
-	huffman_dict = os.path.join(mea_dir, 'Huffman.dat')
-	
-	# Check if Huffman dictionary version is supported
-	if (cse_variant, cse_major) in [('CSME', 11), ('CSSPS', 4)] : dict_version = 11
-	elif (cse_variant, cse_major) in [('CSME', 12), ('CSME', 13), ('CSME', 14), ('CSME', 15), ('CSSPS', 5)] : dict_version = 12
-	else :
-		# CSTXE & PMC firmware do not use Huffman compression, skip error message
-		if cse_variant != 'CSTXE' and not cse_variant.startswith('PMC') and verbosity in ['all','error'] :
-			if param.me11_mod_bug : input(col_r + '\nNo Huffman dictionary for {0} {1}'.format(cse_variant, cse_major) + col_e)
-			else : print(col_r + '\nNo Huffman dictionary for {0} {1}'.format(cse_variant, cse_major) + col_e)
-		
-		return HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS
-	
-	# Check if supported Huffman dictionary file exists
-	if not os.path.isfile(huffman_dict) :
-		if verbosity in ['all','error'] :
-			if param.me11_mod_bug : input(col_r + '\nHuffman dictionary file is missing!' + col_e)
-			else : print(col_r + '\nHuffman dictionary file is missing!' + col_e)
-		
-		return HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS
+	dict_parsed = {}
 	
 	with open(huffman_dict, 'r') as dict_file :
 		dict_json = json.load(dict_file)
-		
-		dict_mappings = dict_json[str(dict_version)]
+	
+	for dict_version_string, dict_mappings in dict_json.items() :
+		HUFFMAN_SHAPE = []
+		HUFFMAN_SYMBOLS = {}
+		HUFFMAN_UNKNOWNS = {}
+		dict_messages = []
 		mapping_codeword_ranges = {}
 		
 		for mapping_type_string, mapping in dict_mappings.items() :
@@ -7172,16 +7621,14 @@ def cse_huffman_dictionary_load(cse_variant, cse_major, verbosity) :
 			grouped_codewords = { codeword_len : [int(codeword, 2) for codeword in codewords] for codeword_len, codewords in grouped_codeword_strings}
 			mapping_codeword_ranges[mapping_type] = {codeword_len : (min(codewords), max(codewords)) for codeword_len, codewords in grouped_codewords.items()}
 		
-		if len(set([frozenset(x.items()) for x in mapping_codeword_ranges.values()])) > 1 and verbosity in ['all','error'] :
-			if param.me11_mod_bug : input(col_r + '\n    Mismatched mappings in the same dictionary' + col_e)
-			else : print(col_r + '\n    Mismatched mappings in the same dictionary' + col_e)
+		if len(set([frozenset(x.items()) for x in mapping_codeword_ranges.values()])) > 1 :
+			dict_messages.append('\n    Mismatched mappings in the same dictionary')
 		
 		codeword_ranges = list(mapping_codeword_ranges.values())[0]
 		
 		for i, j in zip(list(codeword_ranges.keys())[:-1], list(codeword_ranges.keys())[1:]) :
-			if 2 * codeword_ranges[i][0] - 1 != codeword_ranges[j][1] and verbosity in ['all','error'] :
-				if param.me11_mod_bug : input(col_r + '\n    Discontinuity between codeword lengths {0} and {1}'.format(i, j) + col_e)
-				else : print(col_r + '\n    Discontinuity between codeword lengths {0} and {1}'.format(i, j) + col_e)
+			if 2 * codeword_ranges[i][0] - 1 != codeword_ranges[j][1] :
+				dict_messages.append('\n    Discontinuity between codeword lengths {0} and {1}'.format(i, j))
 				
 		HUFFMAN_SHAPE = [(codeword_len, codeword_min << (32 - codeword_len), codeword_max) for codeword_len, (codeword_min, codeword_max) in codeword_ranges.items()]
 			
@@ -7199,93 +7646,324 @@ def cse_huffman_dictionary_load(cse_variant, cse_major, verbosity) :
 					symbol = mapping[codeword_binary].strip()
 					if symbol == '' :
 						HUFFMAN_UNKNOWNS[mapping_type][codeword_len].add(codeword)
-						return [0x7F]
+						return b'\x7F'
 					elif re.match('^(\?\?)+$', symbol) :
 						HUFFMAN_UNKNOWNS[mapping_type][codeword_len].add(codeword)
-						return list(itertools.repeat(0x7F, int(len(symbol) / 2)))
+						return b'\x7F' * int(len(symbol) / 2)
 					else :
-						return [x for x in bytes.fromhex(symbol)]
+						return bytes.fromhex(symbol)
 				
 				HUFFMAN_SYMBOLS[mapping_type][codeword_len] = [parse_symbol(codeword) for codeword in range(codeword_max, codeword_min - 1, -1)]
-			
-	return HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS
+		
+		dict_parsed[int(dict_version_string)] = (dict_messages, HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS)
 	
-# CSE Huffman Decompressor by IllegalArgument
+	return dict_parsed
+
+# CSE Huffman Dictionary Loader by IllegalArgument
+# Dictionaries by Dmitry Sklyarov & IllegalArgument
 # Message Verbosity: All | Error | None
-def cse_huffman_decompress(module_contents, compressed_size, decompressed_size, HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS, verbosity) :
-	CHUNK_SIZE = 0x1000
-	huff_error = False
-	decompressed_array = []
+def cse_huffman_dictionary_load(cse_variant, cse_major, verbosity) :
+	HUFFMAN_SHAPE = []
+	HUFFMAN_SYMBOLS = {}
+	HUFFMAN_UNKNOWNS = {}
+	huffman_dict = os.path.join(mea_dir, 'Huffman.dat')
 	
-	if not HUFFMAN_SHAPE : return module_contents, huff_error # Failed to load required Huffman dictionary
+	# Check if Huffman dictionary version is supported
+	if (cse_variant, cse_major) in [('CSME', 11), ('CSSPS', 4)] : dict_version = 11
+	elif (cse_variant, cse_major) in [('CSME', 12), ('CSME', 13), ('CSME', 14), ('CSME', 15), ('CSSPS', 5)] : dict_version = 12
+	else :
+		# CSTXE & PMC firmware do not use Huffman compression, skip error message
+		if cse_variant != 'CSTXE' and not cse_variant.startswith('PMC') and verbosity in ['all','error'] :
+			if param.me11_mod_bug : input(col_r + '\nNo Huffman dictionary for {0} {1}'.format(cse_variant, cse_major) + col_e)
+			else : print(col_r + '\nNo Huffman dictionary for {0} {1}'.format(cse_variant, cse_major) + col_e)
+		
+		return HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS
 	
-	chunk_count = int(decompressed_size / CHUNK_SIZE)
-	header_size = chunk_count * 0x4
+	# Check if supported Huffman dictionary file exists
+	if not os.path.isfile(huffman_dict) :
+		if verbosity in ['all','error'] :
+			if param.me11_mod_bug : input(col_r + '\nHuffman dictionary file is missing!' + col_e)
+			else : print(col_r + '\nHuffman dictionary file is missing!' + col_e)
+		
+		return HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS
 	
-	module_buffer = bytearray(module_contents)
-	header_buffer = module_buffer[0:header_size]
-	compressed_buffer = module_buffer[header_size:compressed_size]
+	# Parse Huffman dictionaries once per process, from the precompiled cache if it matches Huffman.dat
+	if dict_version not in huffman_dicts :
+		dict_stat = os.stat(huffman_dict)
+		dict_key = (title, 'bytes', dict_stat.st_mtime_ns, dict_stat.st_size) # MEA version, Symbol type, Huffman.dat modification time & size
+		dict_cache = os.path.join(mea_dir, 'Huffman.pkl')
+		
+		try :
+			with open(dict_cache, 'rb') as cache_file : cache_key, cache_data = pickle.load(cache_file)
+		except :
+			cache_key, cache_data = None, {} # Cache is missing or corrupted
+		
+		if cache_key == dict_key and dict_version in cache_data :
+			huffman_dicts.update(cache_data)
+		else :
+			huffman_dicts.update(cse_huffman_dictionary_parse(huffman_dict))
+			cache_temp = dict_cache + '.%d' % os.getpid()
+			
+			# Store parsed dictionaries to cache, ignore failures (i.e. read-only location)
+			try :
+				with open(cache_temp, 'wb') as cache_file : pickle.dump((dict_key, huffman_dicts), cache_file, pickle.HIGHEST_PROTOCOL)
+				os.replace(cache_temp, dict_cache) # Atomic, for concurrent MEA instances
+			except :
+				if os.path.isfile(cache_temp) : os.remove(cache_temp)
 	
-	header_entries = struct.unpack('<{:d}I'.format(chunk_count), header_buffer)
-	start_offsets, flags = zip(*[(x & 0x1FFFFFF, (x >> 25) & 0x7F) for x in header_entries])
-	end_offsets = itertools.chain(start_offsets[1:], [compressed_size - header_size])
+	dict_messages, HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS = huffman_dicts[dict_version]
 	
-	for index, dictionary_type, compressed_position, compressed_limit in zip(range(chunk_count), flags, start_offsets, end_offsets) :
-		if verbosity == 'all' :
-			print(col_r + '\n    ==Processing chunk 0x{:X} at compressed offset 0x{:X} with dictionary 0x{:X}=='.format(index, compressed_position, dictionary_type) + col_e)
-			
+	for message in dict_messages :
+		if verbosity in ['all','error'] :
+			if param.me11_mod_bug : input(col_r + message + col_e)
+			else : print(col_r + message + col_e)
+	
+	return HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS
+	
+# CSE Huffman Decoding Tables, built once per Huffman dictionary
+# Primary tables are indexed by the next bits of the stream, longer codewords continue at secondary tables
+# Each entry resolves to (Codeword Length, Symbol, Unknown) exactly as the HUFFMAN_SHAPE walk of each codeword would
+# Codeword Regex & Symbols allow bulk decoding of all codewords up to the next one which requires special handling
+def cse_huffman_tables(HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS) :
+	if id(HUFFMAN_SYMBOLS) in huffman_tables and huffman_tables[id(HUFFMAN_SYMBOLS)][0] is HUFFMAN_SYMBOLS :
+		return huffman_tables[id(HUFFMAN_SYMBOLS)][1]
+	
+	huff_tables = {}
+	max_len = max(length for length, shape, base in HUFFMAN_SHAPE) # Codewords up to 25 bits (32-bit buffer refilled at <= 24)
+	prim_bits = min(max_len, 11) # Primary table covers codewords up to 11 bits
+	sec_bits = max_len - prim_bits # Secondary tables cover the rest
+	
+	def trie_regex(trie_node) :
+		branches = [bit + trie_regex(trie_node[bit]) for bit in sorted(trie_node, reverse=True)] # Shorter codewords start with 1
+		
+		return branches[0] if len(branches) == 1 else '(?:%s)' % '|'.join(branches)
+	
+	for dictionary_type in HUFFMAN_SYMBOLS :
 		dictionary = HUFFMAN_SYMBOLS[dictionary_type]
 		unknowns = HUFFMAN_UNKNOWNS[dictionary_type]
+		values = [(0, None, KeyError(0))] * (1 << max_len) # Stream values below all codeword lengths are not valid
+		symbols_all = {} # Binary Codeword > Symbol
+		symbols_known = {} # Binary Codeword > Symbol, Unknown Codewords excluded
+		codeword_trie = {}
+		value_low = 1 << max_len
 		
-		decompressed_position, decompressed_limit = index * CHUNK_SIZE, (index + 1) * CHUNK_SIZE
-		
-		bit_buffer = 0
-		available_bits = 0
-		
-		while decompressed_position < decompressed_limit :
-			while available_bits <= 24 and compressed_position < compressed_limit :
-				bit_buffer = bit_buffer | compressed_buffer[compressed_position] << (24 - available_bits)
-				compressed_position = compressed_position + 1
-				available_bits = available_bits + 8
+		# Each length takes the stream values between its shape and the shape of the previous (shorter) length
+		for length, shape, base in HUFFMAN_SHAPE :
+			value_shape = shape >> (32 - max_len)
+			value_step = 1 << (max_len - length)
 			
-			codeword_length, base_codeword = 0, 0
-			for length, shape, base in HUFFMAN_SHAPE :
-				if bit_buffer >= shape :
-					codeword_length, base_codeword = length, base
-					break
+			if value_shape >= value_low : continue # Already taken by shorter codewords
 			
-			if available_bits >= codeword_length :
-				codeword = bit_buffer >> (32 - codeword_length)
-				bit_buffer = (bit_buffer << codeword_length) & 0xFFFFFFFF
-				available_bits = available_bits - codeword_length
+			for codeword in range(value_shape // value_step, (value_low - 1) // value_step + 1) :
+				try :
+					entry = (length, dictionary[length][base - codeword], codeword in unknowns[length])
+				except Exception as error :
+					entry = (length, None, error) # Broken dictionary, raised when the codeword is actually decoded
 				
-				symbol = dictionary[codeword_length][base_codeword - codeword]
-				symbol_length = len(symbol)
+				values[codeword * value_step:(codeword + 1) * value_step] = [entry] * value_step
 				
-				if decompressed_limit - decompressed_position >= symbol_length :
-					if codeword in unknowns[codeword_length] and verbosity in ['all','error'] :
-						print(col_r + '\n    Unknown codeword {: <15s} (dictionary 0x{:X}, codeword length {: >2d}, codeword {: >5s}, symbol length {:d}) at decompressed offset 0x{:X}'.format(
-							('{:0>' + str(codeword_length) + 'b}').format(codeword), dictionary_type, codeword_length, "0x{:X}".format(codeword), symbol_length, decompressed_position) + col_e)
-						huff_error = True
-					decompressed_array.extend(symbol)
-					decompressed_position = decompressed_position + symbol_length
-				else :
-					if verbosity in ['all','error'] :
-						print(col_r + '\n    Skipping overflowing codeword {: <15s} (dictionary 0x{:X}, codeword length {: >2d}, codeword {: >5s}, symbol length {:d}) at decompressed offset 0x{:X}'.format(
-							('{:0>' + str(codeword_length) + 'b}').format(codeword), dictionary_type, codeword_length, '0x{:X}'.format(codeword), symbol_length, decompressed_position) + col_e)
-						huff_error = True
-					filler = itertools.repeat(0x7F, decompressed_limit - decompressed_position)
-					decompressed_array.extend(filler)
-					decompressed_position = decompressed_limit
+				if entry[1] is None : continue
+				
+				codeword_bin = format(codeword, '0%db' % length)
+				symbols_all[codeword_bin] = entry[1]
+				if not entry[2] : symbols_known[codeword_bin] = symbols_all[codeword_bin]
+				
+				trie_node = codeword_trie
+				for bit in codeword_bin : trie_node = trie_node.setdefault(bit, {})
+			
+			value_low = value_shape
+		
+		primary = []
+		
+		for prefix in range(1 << prim_bits) :
+			entry = values[prefix << sec_bits]
+			
+			# Codeword is longer than the primary table bits, the remaining bits are required
+			if entry[0] > prim_bits or entry[0] == 0 : entry = (-1, values[prefix << sec_bits:(prefix + 1) << sec_bits], None)
+			
+			primary.append(entry)
+		
+		# Anything which is not a codeword (stream end, invalid codeword) is matched as the rest of the stream
+		codeword_regex = re.compile('(?:%s)|[01]+' % trie_regex(codeword_trie))
+		
+		huff_tables[dictionary_type] = (primary, codeword_regex, symbols_all, symbols_known)
+	
+	if len(huffman_tables) >= 4 : huffman_tables.clear() # Loaded dictionaries are cached per version, others are not kept
+	
+	huffman_tables[id(HUFFMAN_SYMBOLS)] = (HUFFMAN_SYMBOLS, (huff_tables, max_len, sec_bits))
+	
+	return huff_tables, max_len, sec_bits
+
+# CSE Huffman Chunk Decompressor
+# Chunk Buffer is followed by 4 padding bytes, Chunk Fail is the bit position where the chunk runs past the module
+def cse_huffman_chunk(huff_info, index, dictionary_type, compressed_position, chunk_buffer, chunk_bits, chunk_fail, verbosity) :
+	CHUNK_SIZE = 0x1000
+	huff_error = False
+	chunk_array = bytearray(CHUNK_SIZE)
+	chunk_start = index * CHUNK_SIZE
+	
+	huff_tables, max_len, sec_bits = huff_info
+	sec_mask = (1 << sec_bits) - 1
+	peek_mask = (1 << max_len) - 1
+	peek_shift = 32 - max_len
+	
+	if verbosity == 'all' :
+		print(col_r + '\n    ==Processing chunk 0x{:X} at compressed offset 0x{:X} with dictionary 0x{:X}=='.format(index, compressed_position, dictionary_type) + col_e)
+	
+	primary, codeword_regex, symbols_all, symbols_known = huff_tables[dictionary_type]
+	symbols_bulk = symbols_all if verbosity not in ['all','error'] else symbols_known # Unknown Codewords are reported one by one
+	
+	decompressed_position, decompressed_limit = 0, CHUNK_SIZE # Within chunk
+	
+	chunk_pos = 0 # Bit position within chunk
+	chunk_stream = format(int.from_bytes(chunk_buffer[:-4], 'big'), '0%db' % chunk_bits) if chunk_bits and chunk_fail > chunk_bits else ''
+	
+	while decompressed_position < decompressed_limit :
+		# Bulk decode all codewords which fit, up to the next Unknown, overflowing, invalid or incomplete one
+		if chunk_stream :
+			codewords = codeword_regex.findall(chunk_stream, chunk_pos)
+			symbols = list(map(symbols_bulk.get, codewords))
+			if None in symbols : del symbols[symbols.index(None):]
+			symbol_ends = list(itertools.accumulate(map(len, symbols)))
+			symbol_count = bisect.bisect_right(symbol_ends, decompressed_limit - decompressed_position)
+			
+			if symbol_count :
+				chunk_array[decompressed_position:decompressed_position + symbol_ends[symbol_count - 1]] = b''.join(symbols[:symbol_count])
+				decompressed_position = decompressed_position + symbol_ends[symbol_count - 1]
+				chunk_pos = chunk_pos + sum(map(len, codewords[:symbol_count]))
+				
+				# Unknown Codewords are decoded in bulk when not reported, the chunk is still incomplete
+				if not huff_error and symbols_bulk is not symbols_known and not symbols_known.keys() >= set(codewords[:symbol_count]) : huff_error = True
+				
+				if decompressed_position >= decompressed_limit : break
+		
+		# Decode next codeword via the primary/secondary tables
+		if chunk_pos >= chunk_fail : raise IndexError('bytearray index out of range')
+		
+		peek_byte = chunk_pos >> 3
+		bit_peek = (int.from_bytes(chunk_buffer[peek_byte:peek_byte + 4], 'big') >> (peek_shift - (chunk_pos & 7))) & peek_mask
+		
+		codeword_entry = primary[bit_peek >> sec_bits]
+		if codeword_entry[0] < 0 : codeword_entry = codeword_entry[1][bit_peek & sec_mask]
+		codeword_length, symbol, codeword_unknown = codeword_entry
+		
+		if chunk_bits - chunk_pos >= codeword_length :
+			if symbol is None : raise codeword_unknown # Broken dictionary
+			
+			codeword = bit_peek >> (max_len - codeword_length)
+			chunk_pos = chunk_pos + codeword_length
+			
+			symbol_length = len(symbol)
+			
+			if decompressed_limit - decompressed_position >= symbol_length :
+				if codeword_unknown :
+					if verbosity in ['all','error'] :
+						print(col_r + '\n    Unknown codeword {: <15s} (dictionary 0x{:X}, codeword length {: >2d}, codeword {: >5s}, symbol length {:d}) at decompressed offset 0x{:X}'.format(
+							('{:0>' + str(codeword_length) + 'b}').format(codeword), dictionary_type, codeword_length, "0x{:X}".format(codeword), symbol_length, chunk_start + decompressed_position) + col_e)
+					huff_error = True # Incomplete, regardless of verbosity
+				chunk_array[decompressed_position:decompressed_position + symbol_length] = symbol
+				decompressed_position = decompressed_position + symbol_length
 			else :
 				if verbosity in ['all','error'] :
-					print(col_r + '\n    Reached end of compressed stream early at decompressed offset 0x{:X}'.format(decompressed_position) + col_e)
-					huff_error = True
-				filler = itertools.repeat(0x7F, decompressed_limit - decompressed_position)
-				decompressed_array.extend(filler)
+					print(col_r + '\n    Skipping overflowing codeword {: <15s} (dictionary 0x{:X}, codeword length {: >2d}, codeword {: >5s}, symbol length {:d}) at decompressed offset 0x{:X}'.format(
+						('{:0>' + str(codeword_length) + 'b}').format(codeword), dictionary_type, codeword_length, '0x{:X}'.format(codeword), symbol_length, chunk_start + decompressed_position) + col_e)
+				huff_error = True # Incomplete, regardless of verbosity
+				chunk_array[decompressed_position:] = b'\x7F' * (decompressed_limit - decompressed_position) # Filler
 				decompressed_position = decompressed_limit
-				
-	return bytearray(decompressed_array), huff_error
+		else :
+			if verbosity in ['all','error'] :
+				print(col_r + '\n    Reached end of compressed stream early at decompressed offset 0x{:X}'.format(chunk_start + decompressed_position) + col_e)
+			huff_error = True # Incomplete, regardless of verbosity
+			chunk_array[decompressed_position:] = b'\x7F' * (decompressed_limit - decompressed_position) # Filler
+			decompressed_position = decompressed_limit
+	
+	return chunk_array, huff_error
+
+# CSE Huffman Chunks Decompressor for the process pool, decoding tables are inherited from the parent process
+def cse_huffman_chunks(tables_id, chunks, verbosity) :
+	huff_info = huffman_tables[tables_id][1]
+	
+	return [cse_huffman_chunk(huff_info, *chunk, verbosity) for chunk in chunks]
+
+# Get CSE Huffman Process Pool, created once & reused by all large modules
+# Workers only have the decoding tables which existed when they forked, so a newly loaded dictionary needs a new pool
+def cse_huffman_pool(HUFFMAN_SYMBOLS) :
+	global huffman_pool, huffman_pool_tables
+	
+	if huffman_pool is not None and huffman_pool_tables.get(id(HUFFMAN_SYMBOLS), (None,))[0] is not HUFFMAN_SYMBOLS : cse_huffman_pool_close()
+	
+	if huffman_pool is None :
+		huffman_pool = concurrent.futures.ProcessPoolExecutor(os.cpu_count(), mp_context=multiprocessing.get_context('fork'))
+		huffman_pool_tables = dict(huffman_tables) # Keeps the inherited dictionaries alive, so their ids are not reused
+	
+	return huffman_pool
+
+# Shut down CSE Huffman Process Pool, if created
+def cse_huffman_pool_close() :
+	global huffman_pool, huffman_pool_tables
+	
+	if huffman_pool is not None : huffman_pool.shutdown()
+	
+	huffman_pool, huffman_pool_tables = None, {}
+
+# CSE Huffman Decompressor by IllegalArgument
+# Message Verbosity: All | Error | None
+def cse_huffman_decompress(module_contents, compressed_size, decompressed_size, HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS, verbosity) :
+	CHUNK_SIZE = 0x1000
+	POOL_CHUNKS = 0x40 # Modules with fewer chunks decompress faster than the process pool starts
+	huff_error = False
+	chunk_results = None
+	
+	if not HUFFMAN_SHAPE : return module_contents, huff_error # Failed to load required Huffman dictionary
+	
+	huff_info = cse_huffman_tables(HUFFMAN_SHAPE, HUFFMAN_SYMBOLS, HUFFMAN_UNKNOWNS)
+	
+	chunk_count = int(decompressed_size / CHUNK_SIZE)
+	header_size = chunk_count * 0x4
+	decompressed_array = bytearray(chunk_count * CHUNK_SIZE)
+	
+	module_buffer = bytearray(module_contents)
+	header_buffer = module_buffer[0:header_size]
+	compressed_buffer = module_buffer[header_size:compressed_size]
+	
+	header_entries = struct.unpack('<{:d}I'.format(chunk_count), header_buffer)
+	start_offsets, flags = zip(*[(x & 0x1FFFFFF, (x >> 25) & 0x7F) for x in header_entries])
+	end_offsets = itertools.chain(start_offsets[1:], [compressed_size - header_size])
+	
+	chunks = [] # Index, Dictionary, Offset, Buffer, Bits, Fail Position
+	
+	for index, dictionary_type, compressed_position, compressed_limit in zip(range(chunk_count), flags, start_offsets, end_offsets) :
+		chunk_buffer = bytes(compressed_buffer[compressed_position:compressed_limit]) + b'\x00' * 4 # Bits after the chunk are read as 0
+		chunk_bits = max(compressed_limit - compressed_position, 0) * 8
+		
+		# Compressed chunk goes past the module, fail where the codeword decoder would first read beyond it
+		if compressed_limit > len(compressed_buffer) and compressed_position < compressed_limit :
+			chunk_fail = (len(compressed_buffer) - compressed_position) * 8 - 24
+		else :
+			chunk_fail = chunk_bits + 1
+		
+		chunks.append((index, dictionary_type, compressed_position, chunk_buffer, chunk_bits, chunk_fail))
+	
+	# Spread the chunks of large modules across a process pool, messages are only printed by the serial path
+	if verbosity == 'none' and chunk_count >= POOL_CHUNKS and huffman_pool_fork and (os.cpu_count() or 1) > 1 :
+		pool_batch = -(-chunk_count // (os.cpu_count() * 4)) # Chunks per task, few tasks per worker for balance
+		pool_tasks = [chunks[batch:batch + pool_batch] for batch in range(0, chunk_count, pool_batch)]
+		
+		try :
+			pool = cse_huffman_pool(HUFFMAN_SYMBOLS)
+			chunk_results = list(itertools.chain.from_iterable(pool.map(cse_huffman_chunks,
+								itertools.repeat(id(HUFFMAN_SYMBOLS)), pool_tasks, itertools.repeat(verbosity))))
+		except (OSError, concurrent.futures.process.BrokenProcessPool) :
+			cse_huffman_pool_close()
+			chunk_results = None # Process pool is not available, decompress serially
+	
+	if chunk_results is None : chunk_results = (cse_huffman_chunk(huff_info, *chunk, verbosity) for chunk in chunks)
+	
+	for index, (chunk_array, chunk_error) in enumerate(chunk_results) :
+		decompressed_array[index * CHUNK_SIZE:(index + 1) * CHUNK_SIZE] = chunk_array
+		if chunk_error : huff_error = True
+	
+	return decompressed_array, huff_error
 	
 # Detect CSE Partition Instance Identifier
 def cse_part_inid(buffer, cpd_offset, ext_dictionary) :
@@ -7343,16 +8021,15 @@ def cpd_size_calc(buffer, cpd_offset, align_size) :
 	cpd_hdr_struct, cpd_hdr_size = get_cpd(buffer, cpd_offset)
 	cpd_hdr = get_struct(buffer, cpd_offset, cpd_hdr_struct)
 	cpd_num = cpd_entry_num_fix(buffer, cpd_offset, cpd_hdr.NumModules, cpd_hdr_size)
+	cpd_entries = get_cpd_entries(buffer, cpd_offset, cpd_hdr_size, cpd_num)
 	
 	for entry in range(1, cpd_num, 2) : # Skip 1st .man module, check only .met
-		cpd_entry_hdr = get_struct(buffer, cpd_offset + cpd_hdr_size + entry * 0x18, CPD_Entry)
-		cpd_mod_off,cpd_mod_huff,cpd_mod_res = cpd_entry_hdr.get_flags()
-		
-		cpd_entry_name = cpd_entry_hdr.Name
+		if entry >= len(cpd_entries) : get_struct(buffer, cpd_offset + cpd_hdr_size + entry * 0x18, CPD_Entry) # Out of bounds $CPD Entry
+		cpd_entry_name,cpd_mod_off,cpd_mod_huff,cpd_mod_res,cpd_mod_size,x0 = cpd_entries[entry]
 		
 		if b'.met' not in cpd_entry_name and b'.man' not in cpd_entry_name : # Sanity check
 			cpd_entry_offset = cpd_mod_off
-			cpd_entry_size = cpd_entry_hdr.Size
+			cpd_entry_size = cpd_mod_size
 			
 			# Store last entry (max $CPD offset)
 			if cpd_entry_offset > cpd_offset_last :
@@ -7452,6 +8129,11 @@ def get_rbe_pm_met(rbe_pm_data_d, rbe_pm_met_hashes) :
 	
 # Process ctypes Structure Classes
 def get_struct(input_stream, start_offset, class_name, param_list = None) :
+	# Copy the Structure straight from the input buffer when it fits, without an intermediate slice
+	if not param_list and 0 <= start_offset < file_end :
+		try : return class_name.from_buffer_copy(input_stream, start_offset)
+		except (ValueError, TypeError) : pass # Out of bounds or not a buffer, handled below
+	
 	if param_list is None : param_list = []
 	
 	structure = class_name(*param_list) # Unpack parameter list
@@ -7472,6 +8154,23 @@ def get_struct(input_stream, start_offset, class_name, param_list = None) :
 	
 	return structure
 	
+# Process a Table of fixed size Entries at once, as tuples of the struct format fields
+# Only the Entries within the buffer & image are processed, get_struct reports the rest when reached
+def get_struct_table(input_stream, start_offset, entry_format, entry_count) :
+	entry_struct = struct.Struct(entry_format)
+	entry_size = entry_struct.size
+	entry_fit = min(entry_count, (len(input_stream) - start_offset) // entry_size, (file_end - start_offset + entry_size - 1) // entry_size)
+	
+	if start_offset < 0 or entry_fit <= 0 : return []
+	
+	return list(entry_struct.iter_unpack(memoryview(input_stream)[start_offset:start_offset + entry_fit * entry_size]))
+
+# Get all $CPD Entries as Name, Offset, Huffman, Offset Reserved, Size & Reserved (CPD_Entry)
+def get_cpd_entries(buffer, cpd_offset, cpd_hdr_size, cpd_num) :
+	cpd_entries = get_struct_table(buffer, cpd_offset + cpd_hdr_size, '<12sIII', cpd_num)
+	
+	return [(name.split(b'\x00', 1)[0], attrib & 0x1FFFFFF, attrib >> 25 & 0x1, attrib >> 26, size, res) for name, attrib, size, res in cpd_entries]
+
 # https://stackoverflow.com/a/34301571
 # noinspection PyProtectedMember
 def struct_json(structure) :
@@ -7523,20 +8222,36 @@ def pt_html(pt_obj) :
 # Convert PrettyTable Object to JSON Dictionary
 def pt_json(pt_obj) :
 	return json.dumps(pt_obj.get_json_dict(re_pattern=ansi_escape), indent=4)
+
+# Store Report File text until report_flush, Mode "w" discards any text stored so far
+def report_write(file_path, text, mode='a') :
+	if mode == 'w' or file_path not in report_files : report_files[file_path] = [mode, []]
 	
+	report_files[file_path][1].append(text)
+
+# Write stored Report Files, each one opened once, or keep them at the Analysis Result when in memory
+def report_flush(file_path=None) :
+	for report_path in ([file_path] if file_path else list(report_files)) :
+		if report_path not in report_files : continue
+		
+		report_mode,report_parts = report_files.pop(report_path)
+		report_text = ''.join(report_parts)
+		
+		if param.report_memory :
+			if report_mode == 'w' : mea_result.reports[report_path] = ''
+			mea_result.reports[report_path] = mea_result.reports.get(report_path, '') + report_text
+		else :
+			with open(report_path, report_mode, encoding = 'utf-8') as report_file : report_file.write(report_text)
+	
+# Convert Field/Value PrettyTable Object to Dictionary
+def pt_dict(pt_obj) :
+	return {entry['Field'] : entry['Value'] for pt_entries in pt_obj.get_json_dict(re_pattern=ansi_escape).values() for entry in pt_entries.values()}
+
 # Detect DB Revision
 def mea_hdr_init() :
 	db_rev = col_r + 'Unknown' + col_e
 	
-	try :
-		fw_db = db_open()
-		for line in fw_db :
-			if 'Revision' in line :
-				db_line = line.split()
-				db_rev = col_y + db_line[2] + col_e
-		fw_db.close()
-	except :
-		pass
+	if mea_db.rev : db_rev = col_y + mea_db.rev + col_e
 	
 	return db_rev
 
@@ -7571,11 +8286,20 @@ def show_exception_and_exit(exc_type, exc_value, tb) :
 
 # Execute final actions
 def mea_exit(code=0) :
-	colorama.deinit() # Stop Colorama
+	if not param.library : colorama.deinit() # Stop Colorama, unless the library caller still uses it
 	if param.extr_mea or param.print_msg : sys.exit(code)
 	if not param.skip_pause : input("\nPress enter to exit")
 	sys.exit(code)
 
+# Read input file, memory-mapped so that only the accessed data is loaded & its slices are not copies of the whole file
+def mea_input(in_file) :
+	if param.give_db_name : return in_file.read() # Input file is renamed, which a mapping prevents at Windows
+	
+	try :
+		return mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+	except (ValueError, OSError) :
+		return in_file.read() # Empty or non-mappable input file
+
 # Calculate MD5 hash of data
 def md5(data) :
 	return hashlib.md5(data).hexdigest().upper()
@@ -7618,6 +8342,8 @@ def adler32(data) :
 def copy_on_msg() :
 	copy = False
 	
+	if param.library : return # Input is not copied when MEA is used as a library
+	
 	# Detect if any copy-worthy generated message exists
 	for message in (err_stor + warn_stor + note_stor) :
 		if message[1] : copy = True
@@ -7630,7 +8356,7 @@ def copy_on_msg() :
 		check_dir = os.path.join(mea_dir, '__CHECK__', '')
 		check_name = os.path.join(check_dir, file_name)
 		
-		if not os.path.isdir(check_dir) : os.mkdir(check_dir)
+		os.makedirs(check_dir, exist_ok=True) # May be created by another -jobs worker
 		
 		# Check if same file already exists
 		if os.path.isfile(check_name) :
@@ -7639,35 +8365,21 @@ def copy_on_msg() :
 			
 			check_name += '_%d' % cur_count
 		
-		shutil.copyfile(file_in, check_name)
-
-# Open MEA database
-def db_open() :
-	fw_db = open(db_path, 'r', encoding = 'utf-8')
-	return fw_db
+		with open(check_name, 'wb') as check_file : check_file.write(reading)
 
 # Check DB for latest version
 def check_upd(key) :
-	upd_key_found = False
-	vlp = [0]*4
-	fw_db = db_open()
-	for line in fw_db :
-		if key in line :
-			upd_key_found = True
-			wlp = line.strip().split('__') # whole line parts
-			vlp = wlp[1].strip().split('.') # version line parts
-			for i in range(len(vlp)) :
-				# noinspection PyTypeChecker
-				vlp[i] = int(vlp[i])
-			break
-	fw_db.close()
-	if upd_key_found : return vlp[0],vlp[1],vlp[2],vlp[3]
+	line = mea_db.get_line(key)
+	if line is not None :
+		wlp = line.split('__') # whole line parts
+		vlp = [int(i) for i in wlp[1].strip().split('.')] # version line parts
+		return vlp[0],vlp[1],vlp[2],vlp[3]
 	else : return 0,0,0,0
 
 # Detect Intel Flash Descriptor
 def spi_fd_init() :
 	# Search for Flash Descriptor pattern (PCH/ICH)
-	fd_match = list(re.compile(br'\x5A\xA5\xF0\x0F.{172}\xFF{16}', re.DOTALL).finditer(reading)) # Z¥π. + [0xAC] + 0xFF * 16 detection
+	fd_match = image_marker_all('FD') # Z¥π. + [0xAC] + 0xFF * 16 detection
 	fd_count = len(fd_match)
 	
 	# Detected Flash Descriptor, use first but notify if more exist
@@ -7857,21 +8569,18 @@ def get_cse_db(variant) :
 	sku_stp = 'NaN'
 	sku_pdm = 'UPDM'
 	
-	fw_db = db_open()
-	for line in fw_db :
-		if rsa_sig_hash in line :
-			line_parts = line.strip().split('_')
-			if variant == 'CSME' :
-				db_sku_chk = line_parts[2] # Store the SKU from DB for latter use
-				sku = sku_init + " " + line_parts[2] # Cell 2 is SKU
-				if line_parts[3] not in ('X','XX') : sku_stp = line_parts[3] # Cell 3 is PCH/SoC Stepping
-				if 'YPDM' in line_parts[4] or 'NPDM' in line_parts[4] or 'UPDM' in line_parts[4] : sku_pdm = line_parts[4] # Cell 4 is PDM
-			elif variant == 'CSTXE' :
-				if line_parts[1] not in ('X','XX') : sku_stp = line_parts[1] # Cell 1 is PCH/SoC Stepping
-			elif variant == 'CSSPS' :
-				if line_parts[-1] == 'EXTR' and line_parts[3] not in ('X','XX') : sku_stp = line_parts[3] # Cell 3 is PCH/SoC Stepping
-			break # Break loop at 1st rsa_sig_hash match
-	fw_db.close()
+	line = mea_db.get_line(rsa_sig_hash) # 1st rsa_sig_hash match
+	if line is not None :
+		line_parts = line.split('_')
+		if variant == 'CSME' :
+			db_sku_chk = line_parts[2] # Store the SKU from DB for latter use
+			sku = sku_init + " " + line_parts[2] # Cell 2 is SKU
+			if line_parts[3] not in ('X','XX') : sku_stp = line_parts[3] # Cell 3 is PCH/SoC Stepping
+			if 'YPDM' in line_parts[4] or 'NPDM' in line_parts[4] or 'UPDM' in line_parts[4] : sku_pdm = line_parts[4] # Cell 4 is PDM
+		elif variant == 'CSTXE' :
+			if line_parts[1] not in ('X','XX') : sku_stp = line_parts[1] # Cell 1 is PCH/SoC Stepping
+		elif variant == 'CSSPS' :
+			if line_parts[-1] == 'EXTR' and line_parts[3] not in ('X','XX') : sku_stp = line_parts[3] # Cell 3 is PCH/SoC Stepping
 
 	return db_sku_chk, sku, sku_stp, sku_pdm
 
@@ -7914,13 +8623,8 @@ def get_variant() :
 	var_rsa_db = True
 	
 	# Detect Variant by unique DB RSA Public Key
-	fw_db = db_open()
-	for line in fw_db :
-		if rsa_key_hash in line :
-			line_parts = line.strip().split('_')
-			variant = line_parts[1] # Store the Variant
-			break # Break loop at 1st match
-	fw_db.close()
+	line = mea_db.get_line(rsa_key_hash) # 1st rsa_key_hash match
+	if line is not None : variant = line.split('_')[1] # Store the Variant
 	
 	# Variant DB RSA Public Key not found, manual known correction
 	if variant == 'TBD6' and major == 150 : variant = 'PMCTGP'
@@ -7985,8 +8689,7 @@ def get_variant() :
 			# $MME: ME2-5/SPS1 = 0x50, ME6-10/SPS2-3 = 0x60, TXE1-2 = 0x80
 			variant = 'TXE'
 		
-		elif re.compile(br'\x24\x53\x4B\x55\x03\x00\x00\x00\x2F\xE4\x01\x00').search(reading) or \
-		re.compile(br'\x24\x53\x4B\x55\x03\x00\x00\x00\x08\x00\x00\x00').search(reading) :
+		elif image_marker('SPS $SKU') :
 			variant = 'SPS'
 		
 		else :
@@ -8002,16 +8705,89 @@ def get_variant() :
 	return variant, variant_p, var_rsa_db
 
 # Scan all files of a given directory
+# Without prompts (-mass D), the files are analyzed as they are found, so their total count is unknown
 def mass_scan(f_path) :
-	mass_files = []
-	for root, dirs, files in os.walk(f_path):
-		for name in files :
-			mass_files.append(os.path.join(root, name))
-			
+	if param.mass_arg : return mass_walk(f_path)
+	
+	mass_files = list(mass_walk(f_path))
+	
 	input('\nFound %s file(s)\n\nPress enter to start' % len(mass_files))
 	
 	return mass_files
 
+# Get all files of a directory tree as they are found, in os.walk order (files first, then sub-directories)
+def mass_walk(f_path) :
+	mass_dirs = []
+	
+	try :
+		with os.scandir(f_path) as mass_entries :
+			for entry in mass_entries :
+				try :
+					if entry.is_dir() :
+						if not entry.is_symlink() : mass_dirs.append(entry.path) # Symbolic link folders are not followed
+						continue
+				except OSError :
+					pass # Treated as file, reported at analysis
+				
+				if mass_filter(entry) : yield entry.path
+	except OSError :
+		return # Folder cannot be listed
+	
+	for mass_dir in mass_dirs : yield from mass_walk(mass_dir)
+
+# Check if -mass file passes the Extension, Size & Engine firmware marker filters
+def mass_filter(entry) :
+	file_ext = os.path.splitext(entry.name)[1][1:].lower()
+	
+	if param.mass_ext and file_ext not in param.mass_ext : return False
+	
+	if file_ext in param.mass_noext : return False
+	
+	if param.mass_size != [0, None] :
+		try :
+			file_size = entry.stat().st_size
+		except OSError :
+			return True # Reported at analysis
+		
+		if file_size < param.mass_size[0] or (param.mass_size[1] is not None and file_size > param.mass_size[1]) : return False
+	
+	if param.mass_probe and not mass_probe(entry.path) : return False
+	
+	return True
+
+# Check if file has any Engine firmware marker, read in chunks until the first one is found
+def mass_probe(file_path) :
+	chunk_size = 0x100000
+	
+	try :
+		with open(file_path, 'rb') as probe_file :
+			probe_data = probe_file.read(chunk_size)
+			
+			if probe_data.startswith((b'\x55\x4D\xC9\x4D', b'\xD0\x3F\xDA\x00\xC8\xB9\xB2\x00')) : return True # Fujitsu UMEM, X58 ROMB Test
+			
+			while probe_data :
+				if mass_probe_pat.search(probe_data) : return True
+				
+				probe_next = probe_file.read(chunk_size)
+				if not probe_next : break
+				
+				probe_data = probe_data[-0x100:] + probe_next # Keep chunk end, for markers across chunks
+	except OSError :
+		return True # Reported at analysis
+	
+	return False
+
+# Print input file title table, kept apart at the Result Cache so that it can be rebuilt for another name & count
+def print_title(msg_pt) :
+	if isinstance(sys.stdout, Output_Tee) : sys.stdout.write_title(msg_pt)
+	else : print(msg_pt)
+
+# Get input file title, with its count out of all input files when known
+def mea_title(file_name) :
+	if in_count : return '%s (%d/%d)' % (os.path.basename(file_name)[:45], cur_count, in_count)
+	
+	return '%s (%d)' % (os.path.basename(file_name)[:45], cur_count)
+
 # Colorama ANSI Color/Font Escape Character Sequences Regex
 ansi_escape = re.compile(r'\x1b[^m]*m')
 
@@ -8236,6 +9012,23 @@ pch_dict = {
 			0xE : 'LKF-?', # Lakefield ?
 			}
 	
+# CSE Huffman Dictionaries, per dictionary version
+huffman_dicts = {}
+
+# CSE Huffman Decoding Tables, per loaded dictionary
+huffman_tables = {}
+
+# CSE Huffman Process Pool, workers fork to inherit the decoding tables
+huffman_pool_fork = 'fork' in multiprocessing.get_all_start_methods()
+
+# CSE Huffman Process Pool & the Decoding Tables its workers inherited, created on first use
+huffman_pool = None
+huffman_pool_tables = {}
+atexit.register(cse_huffman_pool_close)
+
+# MFS File Table Dictionaries & (Dictionary, File ID) Paths, loaded on first use
+mfs_ftbl = {}
+
 # CSE Known Bad Partition/Module Hashes
 cse_known_bad_hashes = [
 ('B42458010144CB5708148C31590637372021FCBF21CE079679772FBD2990CF5F','CFB464D442FB477C1642B3C8F60809F764C727509A2112AB921430E2625ECB9B'), # CSME 11.8.50.3399_COR_H_DA_PRD > WCOD 24FD > mu_init
@@ -8247,93 +9040,98 @@ cse_known_bad_hashes = [
 ('IGNORE','IGNORE') # Ignore CSE firmware groups which are always hashed wrongly (CSME 11.8 SLM Extension 0x3, CSSPS 5 Extension 0x16)
 ]
 	
-# Get MEA Parameters from input
-param = MEA_Param(mea_os, sys.argv)
-
-# Actions for MEA but not UEFIStrip
-if not param.extr_mea and not param.print_msg :
-	# Pause after any unexpected python exception
-	sys.excepthook = show_exception_and_exit
-	
-	# Set console/shell window title
-	if mea_os == 'win32' : ctypes.windll.kernel32.SetConsoleTitleW(title)
-	elif mea_os.startswith('linux') or mea_os == 'darwin' : sys.stdout.write('\x1b]2;' + title + '\x07')
-	
 # Get script location
 mea_dir = get_script_dir()
 
-# Enumerate parameter input
-arg_num = len(sys.argv)
-
 # Set dependencies paths
 db_path = os.path.join(mea_dir, 'MEA.dat')
 
 # Check if dependencies exist
 depend_db = os.path.isfile(db_path)
 
+# Load & Index Database, via its precompiled cache when valid
+mea_db = MEA_DB(db_path, os.path.join(mea_dir, 'MEA.pkl'))
+
 # Get Database Revision
 db_rev = mea_hdr_init()
 
-if not param.skip_intro :
-	mea_hdr(db_rev)
-
-	print("\nWelcome to Intel Engine Firmware Analysis Tool\n")
-	
-	if arg_num == 2 :
-		print("Press Enter to skip or input -? to list options\n")
-		print("\nFile:       " + col_g + "%s" % os.path.basename(sys.argv[1]) + col_e)
-	elif arg_num > 2 :
-		print("Press Enter to skip or input -? to list options\n")
-		print("\nFiles:       " + col_y + "Multiple" + col_e)
-	else :
-		print('Input a file name/path or press Enter to list options\n')
-		print("\nFile:       " + col_m + "None" + col_e)
+# MEA Parameters, replaced by the CLI input or the analyze_image options
+param = MEA_Param(mea_os, [])
 
-	input_var = input('\nOption(s):  ')
-	
-	# Anything quoted ("") is taken as one (file paths etc)
-	input_var = re.split(''' (?=(?:[^'"]|'[^']*'|"[^"]*")*$)''', input_var.strip())
-	
-	# Get MEA Parameters based on given Options
-	param = MEA_Param(mea_os, input_var)
-	
-	# Non valid parameters are treated as files
-	if input_var[0] != "" :
-		for i in input_var:
-			if i not in param.val :
-				sys.argv.append(i.strip('"'))
-	
-	# Re-enumerate parameter input
-	arg_num = len(sys.argv)
-	
-	os.system(cl_wipe)
-	
-	mea_hdr(db_rev)
-	
-elif not param.extr_mea and not param.print_msg :
-	mea_hdr(db_rev)
-	
-if (arg_num < 2 and not param.help_scr and not param.mass_scan) or param.help_scr :
-	mea_help()
-
-if param.mass_scan :
-	in_path = input('\nEnter the full folder path : ')
-	source = mass_scan(in_path)
-else :
-	source = sys.argv[1:] # Skip script/executable
-
-# Verify that DB exists
-if not depend_db :
-	print(col_r + '\nError: MEA.dat file is missing!' + col_e)
-	mea_exit(1)
-	
-# Initialize file input
+# Input file count & total count of input files (0 when unknown)
 cur_count = 0
-in_count = len(source)
-for arg in source :
-	if arg in param.val : in_count -= 1
-
-for file_in in source :
+in_count = 0
+
+# MEA Analysis Result of the latest analyzed image
+mea_result = None
+
+# Engine Image Markers, each one is scanned at most once per image
+image_markers = {
+	'$MN2' : re.compile(br'\x86\x80.........\x00\x24\x4D((\x4E\x32)|(\x41\x4E))', re.DOTALL), # .$MN2 or .$MAN
+	'$FPT' : re.compile(br'\x24\x46\x50\x54.\x00\x00\x00', re.DOTALL), # $FPT
+	'$CPD' : re.compile(br'\x24\x43\x50\x44.\x00\x00\x00[\x01\x02]\x01[\x10\x14]', re.DOTALL), # $CPD
+	'BPDT' : re.compile(br'\xAA\x55[\x00\xAA]\x00.\x00[\x01-\x03]\x00', re.DOTALL), # BPDT
+	'FD' : re.compile(br'\x5A\xA5\xF0\x0F.{172}\xFF{16}', re.DOTALL), # Z¥π. + [0xAC] + 0xFF * 16
+	'SPS $SKU' : re.compile(br'\x24\x53\x4B\x55\x03\x00\x00\x00(?:\x2F\xE4\x01\x00|\x08\x00\x00\x00)'), # $SKU of SPS 1
+	'$BIS' : re.compile(br'\x24\x42\x49\x53\x00'), # $BIS.
+	'KRND' : re.compile(br'\x4B\x52\x4E\x44\x00'), # KRND. = FITC, 0x00 adds old ME RGN support
+	'$DAT' : re.compile(br'\x24\x44\x41\x54....................\x49\x46\x52\x50', re.DOTALL), # $DAT + [0x14] + IFRP
+	'NVKR' : re.compile(br'\x4E\x56\x4B\x52\x4B\x52\x49\x44'), # NVKRKRID
+	'NVSH' : re.compile(br'\x4E\x56\x53\x48\x4F\x53\x49\x44'), # NVSHOSID
+	'net.ip' : re.compile(br'\x6E\x65\x74\x2E\x69\x70\xFF\xFF\xFF'), # "net.ip" (2.0-2.2)
+	'EFFS' : re.compile(br'\x45\x46\x46\x53\x4F\x53\x49\x44'), # EFFSOSID
+	'$VER2' : re.compile(br'\x24\x56\x45\x52\x02\x00\x00\x00'), # $VER2... (ROM-Bypass)
+	'$VER3' : re.compile(br'\x24\x56\x45\x52\x03\x00\x00\x00'), # $VER3... (ROM-Bypass)
+	'ROMB' : re.compile(br'\x52\x4F\x4D\x42'), # ROMB (ROM-Bypass)
+	'$MME TPM' : re.compile(br'\x24\x4D\x4D\x45........................\x54\x50\x4D', re.DOTALL), # $MME + [0x18] + TPM
+	'$MME AMT' : re.compile(br'\x24\x4D\x4D\x45........................\x4D\x4F\x46\x46\x4D\x31\x5F\x4F\x56\x4C', re.DOTALL), # $MME + [0x18] + MOFFM1_OVL
+	'NVTP' : re.compile(br'\x4E\x56\x54\x50\x54\x50\x49\x44'), # NVTPTPID
+	'NVCM' : re.compile(br'\x4E\x56\x43\x4D\x41\x4D\x54\x43'), # NVCMAMTC
+	'$MINIFAD' : re.compile(br'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x6D\x3C\x75\x6D'), # Clean $MINIFAD checksum
+	}
+
+# Engine Image Markers of -probe: .$MN2/.$MAN, $FPT, $CPD & FD
+mass_probe_pat = re.compile(b'|'.join(b'(?:%s)' % image_markers[marker].pattern for marker in ['$MN2','$FPT','$CPD','FD']), re.DOTALL)
+
+# Engine Image Marker Index of the image being analyzed, (marker, all) = matches
+image_marker_index = {}
+
+# Get all Engine Image Marker matches of the image being analyzed
+def image_marker_all(marker) :
+	if (marker, True) not in image_marker_index :
+		image_marker_index[(marker, True)] = list(image_markers[marker].finditer(reading))
+	
+	return image_marker_index[(marker, True)]
+
+# Get the first Engine Image Marker match of the image being analyzed
+# A first match lookup stops at the earliest match, unless all matches are already indexed
+def image_marker(marker) :
+	if (marker, True) in image_marker_index :
+		marker_all = image_marker_index[(marker, True)]
+		
+		return marker_all[0] if marker_all else None
+	
+	if (marker, False) not in image_marker_index :
+		image_marker_index[(marker, False)] = image_markers[marker].search(reading)
+	
+	return image_marker_index[(marker, False)]
+
+# CSE Extension Analysis results of the image being analyzed, (call parameters & state) = (result, messages, shown messages)
+ext_anl_cache = {}
+
+# CSE Extension Analysis messages shown by cse_anl_err at the image being analyzed
+cse_anl_shown = []
+
+# Report Files (txt/html/json) of the image being unpacked, File Path > [Mode, Text Parts] until flushed
+report_files = {}
+
+# Analyze Engine firmware image
+# Analysis state is kept at globals, which the helper functions use implicitly
+def mea_analyze(image_name, image_data) :
+	global bpdt_data_all, bpdt_hdr_all, bpdt_part_all, build, cse_lt, cse_lt_exist, cse_lt_off, cse_lt_part_all, cse_lt_size, \
+		end_man_match, err_stor, file_end, file_in, fpt_part_all, hotfix, major, man_pat, mea_result, mfs_found, mfs_size, mfs_start, \
+		minor, mn2_ftpr_hdr, note_stor, pr_man_0, pr_man_1, pr_man_12, pr_man_13, pr_man_2, pr_man_3, pr_man_4, pr_man_5, pr_man_6, \
+		pr_man_7, pt_dcselt, reading, rsa_key_hash, rsa_sig_hash, sku_init, start_man_match, variant, warn_stor, year
 	
 	# Variable Initialization
 	fw_type = ''
@@ -8488,23 +9286,18 @@ for file_in in source :
 	mod_end = 0xFFFFFFFF
 	p_max_size = 0xFFFFFFFF
 	eng_fw_end = 0xFFFFFFFF
-	cur_count += 1
 	
-	if not os.path.isfile(file_in) :
-		if any(p in file_in for p in param.val) : continue # Next input file
-		
-		print(col_r + '\nError: File %s was not found!' % file_in + col_e)
-		
-		if not param.mass_scan : mea_exit(1)
-		else : continue
-	
-	with open(file_in, 'rb') as in_file : reading = in_file.read()
+	file_in, reading = image_name, image_data
 	file_end = len(reading)
+	mea_result = MEA_Result(file_in)
+	image_marker_index.clear() # Markers of the previous image
+	ext_anl_cache.clear() # CSE Extension Analysis results of the previous image
+	cse_anl_shown.clear() # CSE Extension Analysis messages of the previous image
 	
 	# Detect if file has Engine firmware
-	man_pat = re.compile(br'\x86\x80.........\x00\x24\x4D((\x4E\x32)|(\x41\x4E))', re.DOTALL) # .$MN2 or .$MAN detection
+	man_pat = image_markers['$MN2'] # .$MN2 or .$MAN detection
 	
-	for man_range in list(man_pat.finditer(reading)) :
+	for man_range in image_marker_all('$MN2') :
 		(start_man_match, end_man_match) = man_range.span()
 		start_man_match += 0xB # Add 8680.{9} sanity check before .$MN2 or .$MAN
 		
@@ -8610,7 +9403,7 @@ for file_in in source :
 		# Engine Region does not exist
 		else :
 			fuj_version = fuj_umem_ver(0) # Check if ME Region is Fujitsu UMEM compressed (me_fd_start is 0x0, no SPI FD)
-			fw_start_match = (re.compile(br'\x24\x46\x50\x54.\x00\x00\x00', re.DOTALL)).search(reading) # $FPT detection
+			fw_start_match = image_marker('$FPT') # $FPT detection
 			
 			# Image is ME Fujitsu UMEM compressed
 			if fuj_version != 'NaN' :
@@ -8650,8 +9443,8 @@ for file_in in source :
 		if not param.extr_mea and not param.print_msg :
 			print()
 			msg_pt = ext_table([], False, 1)
-			msg_pt.add_row([col_c + '%s (%d/%d)' % (os.path.basename(file_in)[:45], cur_count, in_count) + col_e])
-			print(msg_pt)
+			msg_pt.add_row([col_c + mea_title(file_in) + col_e])
+			print_title(msg_pt)
 		
 		if param.extr_mea :
 			if no_man_text != 'NaN' : print(no_man_text)
@@ -8663,7 +9456,7 @@ for file_in in source :
 			
 		if not param.extr_mea : copy_on_msg() # Close input and copy it in case of messages
 		
-		continue # Next input file
+		return # Next input file
 
 	# Engine firmware found (for > break), Manifest analysis
 	
@@ -8676,10 +9469,10 @@ for file_in in source :
 	# Detect all $FPT and/or BPDT starting offsets (both allowed/needed)
 	if fd_me_rgn_exist :
 		# $FPT detection based on FD with Engine region (limits false positives from IE or CSTXE Engine/ROMB & DevExp1/Init)
-		fpt_matches = list((re.compile(br'\x24\x46\x50\x54.\x00\x00\x00', re.DOTALL)).finditer(reading[me_fd_start:me_fd_start + me_fd_size]))
+		fpt_matches = list(image_markers['$FPT'].finditer(memoryview(reading)[me_fd_start:me_fd_start + me_fd_size]))
 	else :
 		# FD with Engine region not found or multiple FD detected, scan entire file (could lead to false positives)
-		fpt_matches_init = list((re.compile(br'\x24\x46\x50\x54.\x00\x00\x00', re.DOTALL)).finditer(reading))
+		fpt_matches_init = image_marker_all('$FPT')
 		
 		# No Variant known yet but, if possible, get CSE Stage 1 Info for false positive removal via special ext_anl _Stage1 mode
 		man_mod_names,fptemp_info = ext_anl(reading, '$MN2_Stage1', start_man_match, file_end, ['CSME', 0, 0, 0, 0], None, [[],''])
@@ -8750,7 +9543,7 @@ for file_in in source :
 				cse_lt_entry_empty = True if (cse_lt_entry_off in NA or cse_lt_entry_size in NA or cse_lt_entry_data in [b'\x00' * cse_lt_entry_size,b'\xFF' * cse_lt_entry_size]) else False
 				cse_lt_part_all.append([cse_lt_entry_name,cse_lt_entry_spi,cse_lt_entry_size,cse_lt_entry_end,cse_lt_entry_empty])
 
-			pt_dcselt = ext_table([col_y + 'Name' + col_e, col_y + 'Start' + col_e, col_y + 'Size' + col_e, col_y + 'End' + col_e, col_y + 'Empty' + col_e], True, 1)
+			pt_dcselt = Lazy_Table(ext_table, [col_y + 'Name' + col_e, col_y + 'Start' + col_e, col_y + 'Size' + col_e, col_y + 'End' + col_e, col_y + 'Empty' + col_e], True, 1)
 			pt_dcselt.title = col_y + 'CSE Partition Layout Table' + col_e		
 			
 			# Detect CSE LT partition overlaps
@@ -8767,7 +9560,7 @@ for file_in in source :
 			if param.fpt_disp : print('%s\n' % pt_dcselt)
 		
 		# Analyze $FPT header
-		pt_dfpt = ext_table([col_y + 'Name' + col_e, col_y + 'Owner' + col_e, col_y + 'Start' + col_e, col_y + 'Size' + col_e, col_y + 'End' + col_e,
+		pt_dfpt = Lazy_Table(ext_table, [col_y + 'Name' + col_e, col_y + 'Owner' + col_e, col_y + 'Start' + col_e, col_y + 'Size' + col_e, col_y + 'End' + col_e,
 				  col_y + 'Type' + col_e, col_y + 'ID' + col_e, col_y + 'Valid' + col_e, col_y + 'Empty' + col_e], True, 1)
 		pt_dfpt.title = col_y + 'Flash Partition Table' + col_e
 		
@@ -8794,20 +9587,20 @@ for file_in in source :
 			fpt_start = start_fw_start_match
 		
 		fpt_step = start_fw_start_match + 0x20 # 0x20 $FPT entry size
+		fpt_entries = get_struct_table(reading, fpt_step, '<4s4sIIIIII', fpt_part_num) # FPT_Entry
 		
 		for i in range(0, fpt_part_num):
 			cse_in_id = 0
 			cse_in_id_str = '0000'
 			
-			fpt_entry = get_struct(reading, fpt_step, FPT_Entry)
-			
-			p_type,p_dram,p_reserved0,p_bwl0,p_bwl1,p_reserved1,p_valid = fpt_entry.get_flags()
+			if i >= len(fpt_entries) : get_struct(reading, fpt_step, FPT_Entry) # Out of bounds $FPT Entry
+			p_name,p_owner,p_offset,p_size,x0,x1,x2,p_flags = fpt_entries[i]
 			
-			p_name = fpt_entry.Name
-			p_owner = fpt_entry.Owner
-			p_offset = fpt_entry.Offset
-			p_offset_spi = fpt_start + fpt_entry.Offset
-			p_size = fpt_entry.Size
+			p_name = p_name.split(b'\x00', 1)[0]
+			p_owner = p_owner.split(b'\x00', 1)[0]
+			p_type,p_dram,p_reserved0 = p_flags & 0x7F, p_flags >> 7 & 0x1, p_flags >> 8 & 0x7F # FPT_Entry_Flags
+			p_bwl0,p_bwl1,p_reserved1,p_valid = p_flags >> 15 & 0x1, p_flags >> 16 & 0x1, p_flags >> 17 & 0x7F, p_flags >> 24
+			p_offset_spi = fpt_start + p_offset
 			p_valid_print = False if p_valid == 0xFF else True
 			p_type_values = {0: 'Code', 1: 'Data', 2: 'NVRAM', 3: 'Generic', 4: 'EFFS', 5: 'ROM'} # Only 0 & 1 for CSE
 			p_type_print = p_type_values[p_type] if p_type in p_type_values else 'Unknown'
@@ -8908,7 +9701,7 @@ for file_in in source :
 					# Only if partition exists at file (counter-example: sole $FPT etc)
 					# noinspection PyTypeChecker
 					if p_rec_fix[1] + p_rec_fix[2] <= file_end :
-						rec_man_match = man_pat.search(reading[p_rec_fix[1]:p_rec_fix[1] + p_rec_fix[2]])
+						rec_man_match = man_pat.search(memoryview(reading)[p_rec_fix[1]:p_rec_fix[1] + p_rec_fix[2]])
 						
 						if rec_man_match :
 							(start_man_match, end_man_match) = rec_man_match.span()
@@ -8934,11 +9727,11 @@ for file_in in source :
 		# Search Boot Partitions only when CSE LT exists (fast & robust)
 		for part in cse_lt_part_all :
 			if part[0].startswith('Boot') and not part[4] : # Non-Empty CSE LT Boot Partition (skip Data/MFS)
-				bpdt_match = (re.compile(br'\xAA\x55[\x00\xAA]\x00.\x00[\x01-\x03]\x00', re.DOTALL)).search(reading[part[1]:part[3]]) # BPDT detection
+				bpdt_match = image_markers['BPDT'].search(memoryview(reading)[part[1]:part[3]]) # BPDT detection
 				bpdt_matches.append((bpdt_match.start() + part[1], bpdt_match.end() + part[1])) # Store BPDT range, relative to 0x0
 	else :
 		# Search entire image when no CSE LT exists (slower & false positive prone)
-		bpdt_match = list((re.compile(br'\xAA\x55[\x00\xAA]\x00.\x00[\x01-\x03]\x00', re.DOTALL)).finditer(reading)) # BPDT detection
+		bpdt_match = image_marker_all('BPDT') # BPDT detection
 		for match in bpdt_match :
 			if mfs_found and mfs_start <= match.start() < mfs_start + mfs_size : continue # Skip BPDT within MFS (i.e. 008 > fwupdate> fwubpdtinfo)
 			else : bpdt_matches.append(match.span()) # Store all BPDT ranges, already relative to 0x0
@@ -8963,19 +9756,18 @@ for file_in in source :
 		bpdt_step = start_fw_start_match + 0x18 # 0x18 BPDT Header size
 		bpdt_part_num = bpdt_hdr.DescCount
 		
-		pt_dbpdt = ext_table([col_y + 'Name' + col_e, col_y + 'Type' + col_e, col_y + 'Partition' + col_e, col_y + 'Start' + col_e,
+		pt_dbpdt = Lazy_Table(ext_table, [col_y + 'Name' + col_e, col_y + 'Type' + col_e, col_y + 'Partition' + col_e, col_y + 'Start' + col_e,
 				  col_y + 'Size' + col_e, col_y + 'End' + col_e, col_y + 'ID' + col_e, col_y + 'Empty' + col_e], True, 1)
 		pt_dbpdt.title = col_y + 'Boot Partition Descriptor Table' + col_e
 		
+		bpdt_entries = get_struct_table(reading, bpdt_step, '<HHII', bpdt_part_num) # BPDT_Entry
+		
 		for i in range(0, bpdt_part_num):
 			cse_in_id = 0
 			
-			bpdt_entry = get_struct(reading, bpdt_step, BPDT_Entry)
-			
-			p_type = bpdt_entry.Type
-			p_offset = bpdt_entry.Offset
+			if i >= len(bpdt_entries) : get_struct(reading, bpdt_step, BPDT_Entry) # Out of bounds BPDT Entry
+			p_type,x0,p_offset,p_size = bpdt_entries[i]
 			p_offset_spi = start_fw_start_match + p_offset
-			p_size = bpdt_entry.Size
 			
 			if p_offset in (0xFFFFFFFF, 0) or p_size in (0xFFFFFFFF, 0) or reading[p_offset_spi:p_offset_spi + p_size] in (b'', p_size * b'\xFF') : p_empty = True
 			else : p_empty = False
@@ -9027,15 +9819,14 @@ for file_in in source :
 				s_bpdt_step = p_offset_spi + 0x18 # 0x18 S-BPDT Header size
 				s_bpdt_part_num = s_bpdt_hdr.DescCount
 				
+				s_bpdt_entries = get_struct_table(reading, s_bpdt_step, '<HHII', s_bpdt_part_num) # BPDT_Entry
+				
 				for j in range(0, s_bpdt_part_num):
 					cse_in_id = 0
 					
-					s_bpdt_entry = get_struct(reading, s_bpdt_step, BPDT_Entry)
-					
-					s_p_type = s_bpdt_entry.Type
-					s_p_offset = s_bpdt_entry.Offset
+					if j >= len(s_bpdt_entries) : get_struct(reading, s_bpdt_step, BPDT_Entry) # Out of bounds S-BPDT Entry
+					s_p_type,x0,s_p_offset,s_p_size = s_bpdt_entries[j]
 					s_p_offset_spi = start_fw_start_match + s_p_offset
-					s_p_size = s_bpdt_entry.Size
 					
 					if s_p_offset in (0xFFFFFFFF, 0) or s_p_size in (0xFFFFFFFF, 0) or reading[s_p_offset_spi:s_p_offset_spi + s_p_size] in (b'', s_p_size * b'\xFF') :
 						s_p_empty = True
@@ -9098,7 +9889,7 @@ for file_in in source :
 			# Only if partition exists at file (counter-example: sole IFWI etc)
 			# noinspection PyTypeChecker
 			if part[1] + (part[2] - part[1]) <= file_end :
-				rec_man_match = man_pat.search(reading[part[1]:part[1] + (part[2] - part[1])])
+				rec_man_match = man_pat.search(memoryview(reading)[part[1]:part[1] + (part[2] - part[1])])
 				
 				if rec_man_match :
 					(start_man_match, end_man_match) = rec_man_match.span()
@@ -9120,7 +9911,7 @@ for file_in in source :
 								(part[0],part[1],part[2],all_part[0],all_part[1],all_part[2]) + col_e, True])
 	
 		# Ignore Flash Descriptor OEM backup at BPDT > OBBP > NvCommon (HP)
-		if part[0] == 'OBBP' and not part[4] and re.compile(br'\x5A\xA5\xF0\x0F.{172}\xFF{16}', re.DOTALL).search(reading[part[1]:part[2]]) :
+		if part[0] == 'OBBP' and not part[4] and image_markers['FD'].search(memoryview(reading)[part[1]:part[2]]) :
 			fd_count -= 1
 	
 	# Scan $MAN/$MN2 Manifest, for basic info only
@@ -9313,15 +10104,14 @@ for file_in in source :
 					p_end_last_cont = cse_ext_part_size
 				
 				# Calculate partition size by the $CPD entries (TXE3+, 2nd check for ME11+)
+				cpd_entries = get_cpd_entries(reading, p_end_last, cpd_hdr_size, cpd_num)
 				for entry in range(1, cpd_num, 2) : # Skip 1st .man module, check only .met
-					cpd_entry_hdr = get_struct(reading, p_end_last + cpd_hdr_size + entry * 0x18, CPD_Entry)
-					cpd_mod_off,cpd_mod_huff,cpd_mod_res = cpd_entry_hdr.get_flags()
-					
-					cpd_entry_name = cpd_entry_hdr.Name
+					if entry >= len(cpd_entries) : get_struct(reading, p_end_last + cpd_hdr_size + entry * 0x18, CPD_Entry) # Out of bounds $CPD Entry
+					cpd_entry_name,cpd_mod_off,cpd_mod_huff,cpd_mod_res,cpd_mod_size,x0 = cpd_entries[entry]
 					
 					if b'.met' not in cpd_entry_name and b'.man' not in cpd_entry_name : # Sanity check
 						cpd_entry_offset = cpd_mod_off
-						cpd_entry_size = cpd_entry_hdr.Size
+						cpd_entry_size = cpd_mod_size
 						
 						# Store last entry (max $CPD offset)
 						if cpd_entry_offset > cpd_offset_last :
@@ -9374,7 +10164,7 @@ for file_in in source :
 									(part[0].decode('utf-8'),part[1],part[2],all_part[0].decode('utf-8'),all_part[1],all_part[2]) + col_e, True])
 		
 		# Detect CSSPS 4 sometimes uncharted/empty $BIS partition
-		sps4_bis_match = (re.compile(br'\x24\x42\x49\x53\x00')).search(reading) if variant == 'CSSPS' else None
+		sps4_bis_match = image_marker('$BIS') if variant == 'CSSPS' else None
 		
 		# SPI image with FD
 		if fd_me_rgn_exist :
@@ -9424,7 +10214,7 @@ for file_in in source :
 			if (major >= 3 and not fovd_clean('new')) or (major == 2 and not fovd_clean('old')) : fw_type = 'Region, Extracted'
 			else :
 				# Check 2, EFFS/NVKR strings
-				fitc_match = re.compile(br'\x4B\x52\x4E\x44\x00').search(reading) # KRND. detection = FITC, 0x00 adds old ME RGN support
+				fitc_match = image_marker('KRND') # KRND. detection = FITC, 0x00 adds old ME RGN support
 				if fitc_match is not None :
 					if major == 4 : fw_type_fix = True # ME4-Only Fix 3
 					else : fw_type = 'Region, Extracted'
@@ -9461,7 +10251,7 @@ for file_in in source :
 		# Check $FPT Checksum
 		if fpt_version <= 0x20 :
 			fpt_chk_file = '0x%0.2X' % fpt_hdr.HeaderChecksum
-			fpt_chk_sum = sum(reading[fpt_start + fpt_chk_start:fpt_start + fpt_chk_start + fpt_length]) - fpt_chk_byte
+			fpt_chk_sum = sum(memoryview(reading)[fpt_start + fpt_chk_start:fpt_start + fpt_chk_start + fpt_length]) - fpt_chk_byte
 			fpt_chk_calc = '0x%0.2X' % ((0x100 - fpt_chk_sum & 0xFF) & 0xFF)
 		else :
 			fpt_chk_file = '0x%0.8X' % fpt_hdr.HeaderChecksum
@@ -9482,7 +10272,7 @@ for file_in in source :
 			sps3_chk_start = fpt_start + 0x30
 			sps3_chk_end = sps3_chk_start + fpt_part_num * 0x20
 			sps3_chk16_file = '0x%0.4X' % int.from_bytes(reading[sps3_chk_end:sps3_chk_end + 0x2], 'little')
-			sps3_chk16_sum = sum(bytearray(reading[sps3_chk_start:sps3_chk_end])) & 0xFFFF
+			sps3_chk16_sum = sum(memoryview(reading)[sps3_chk_start:sps3_chk_end]) & 0xFFFF
 			sps3_chk16_calc = '0x%0.4X' % (~sps3_chk16_sum & 0xFFFF)
 			if sps3_chk16_calc != sps3_chk16_file:
 				warn_stor.append([col_m + 'Warning: Wrong $FPT SPS3 Checksum %s, expected %s!' % (sps3_chk16_file,sps3_chk16_calc) + col_e, True])
@@ -9508,7 +10298,7 @@ for file_in in source :
 	
 	# Detect PV/PC bit (0 or 1)
 	if (variant == 'ME' and major >= 8) or variant == 'TXE' :
-		pvbit_match = (re.compile(br'\x24\x44\x41\x54....................\x49\x46\x52\x50', re.DOTALL)).search(reading) # $DAT + [0x14] + IFRP detection
+		pvbit_match = image_marker('$DAT') # $DAT + [0x14] + IFRP detection
 		if pvbit_match : pvbit = int.from_bytes(reading[pvbit_match.start() + 0x10:pvbit_match.start() + 0x11], 'little')
 	elif variant in ['CSME','CSTXE','CSSPS'] or variant.startswith('PMC') :
 		pvbit = mn2_flags_pvbit
@@ -9516,7 +10306,7 @@ for file_in in source :
 	if variant == 'ME' : # Management Engine
 		
 		# Detect SKU Attributes
-		sku_match = re.compile(br'\x24\x53\x4B\x55[\x03-\x04]\x00\x00\x00').search(reading[start_man_match:]) # $SKU detection
+		sku_match = re.compile(br'\x24\x53\x4B\x55[\x03-\x04]\x00\x00\x00').search(memoryview(reading)[start_man_match:]) # $SKU detection
 		if sku_match is not None :
 			(start_sku_match, end_sku_match) = sku_match.span()
 			start_sku_match += start_man_match
@@ -9553,7 +10343,7 @@ for file_in in source :
 			# ME2-Only Fix 1 : The usual method to detect EXTR vs RGN does not work for ME2
 			if fw_type_fix :
 				if sku == 'QST' or (sku == 'AMT' and minor >= 5) :
-					nvkr_match = (re.compile(br'\x4E\x56\x4B\x52\x4B\x52\x49\x44')).search(reading) # NVKRKRID detection
+					nvkr_match = image_marker('NVKR') # NVKRKRID detection
 					if nvkr_match is not None :
 						(start_nvkr_match, end_nvkr_match) = nvkr_match.span()
 						nvkr_start = int.from_bytes(reading[end_nvkr_match:end_nvkr_match + 0x4], 'little')
@@ -9575,13 +10365,13 @@ for file_in in source :
 							me2_type_fix = int.from_bytes(reading[qstpat_start:qstpat_end], 'big')
 							me2_type_exp = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 				elif sku == 'AMT' and minor < 5 :
-					nvsh_match = (re.compile(br'\x4E\x56\x53\x48\x4F\x53\x49\x44')).search(reading) # NVSHOSID detection
+					nvsh_match = image_marker('NVSH') # NVSHOSID detection
 					if nvsh_match is not None :
 						(start_nvsh_match, end_nvsh_match) = nvsh_match.span()
 						nvsh_start = int.from_bytes(reading[end_nvsh_match:end_nvsh_match + 0x4], 'little')
 						nvsh_size = int.from_bytes(reading[end_nvsh_match + 0x4:end_nvsh_match + 0x8], 'little')
 						nvsh_data = reading[fpt_start + nvsh_start:fpt_start + nvsh_start + nvsh_size]
-						netip_match = (re.compile(br'\x6E\x65\x74\x2E\x69\x70\xFF\xFF\xFF')).search(reading) # "net.ip" detection (2.0-2.2)
+						netip_match = image_marker('net.ip') # "net.ip" detection (2.0-2.2)
 						if netip_match is not None :
 							(start_netip_match, end_netip_match) = netip_match.span()
 							netip_size = int.from_bytes(reading[end_netip_match + 0x0:end_netip_match + 0x3], 'little')
@@ -9603,8 +10393,7 @@ for file_in in source :
 			
 			# ME2-Only Fix 3 : Detect ROMB RGN/EXTR image correctly (at $FPT v1 ROMB was before $FPT)
 			if rgn_exist and release == 'Pre-Production' :
-				byp_pat = re.compile(br'\x24\x56\x45\x52\x02\x00\x00\x00') # $VER2... detection (ROM-Bypass)
-				byp_match = byp_pat.search(reading)
+				byp_match = image_marker('$VER2') # $VER2... detection (ROM-Bypass)
 				
 				if byp_match is not None :
 					release = 'ROM-Bypass'
@@ -9642,7 +10431,7 @@ for file_in in source :
 				me3_type_fix2a = 0x10 * 0xFF
 				me3_type_fix2b = 0x10 * 0xFF
 				me3_type_fix3 = 0x10 * 0xFF
-				effs_match = (re.compile(br'\x45\x46\x46\x53\x4F\x53\x49\x44')).search(reading) # EFFSOSID detection
+				effs_match = image_marker('EFFS') # EFFSOSID detection
 				if effs_match is not None :
 					(start_effs_match, end_effs_match) = effs_match.span()
 					effs_start = int.from_bytes(reading[end_effs_match:end_effs_match + 0x4], 'little')
@@ -9676,8 +10465,7 @@ for file_in in source :
 			
 			# ME3-Only Fix 3 : Detect Pre-Alpha ($FPT v1) ROMB RGN/EXTR image correctly
 			if rgn_exist and fpt_version == 16 and release == 'Pre-Production' :
-				byp_pat = re.compile(br'\x24\x56\x45\x52\x03\x00\x00\x00') # $VER3... detection (ROM-Bypass)
-				byp_match = byp_pat.search(reading)
+				byp_match = image_marker('$VER3') # $VER3... detection (ROM-Bypass)
 				
 				if byp_match is not None :
 					release = 'ROM-Bypass'
@@ -9707,8 +10495,7 @@ for file_in in source :
 			
 			# ME4-Only Fix 1 : Detect ROMB UPD image correctly
 			if fw_type == "Update" :
-				byp_pat = re.compile(br'\x52\x4F\x4D\x42') # ROMB detection (ROM-Bypass)
-				byp_match = byp_pat.search(reading)
+				byp_match = image_marker('ROMB') # ROMB detection (ROM-Bypass)
 				if byp_match is not None :
 					release = 'ROM-Bypass'
 					rel_db = 'BYP'
@@ -9716,11 +10503,11 @@ for file_in in source :
 			# ME4-Only Fix 2 : Detect SKUs correctly, only for Pre-Alpha firmware
 			if minor == 0 and hotfix == 0 :
 				if fw_type == 'Update' :
-					tpm_tag = (re.compile(br'\x24\x4D\x4D\x45........................\x54\x50\x4D', re.DOTALL)).search(reading) # $MME + [0x18] + TPM
-					amt_tag = (re.compile(br'\x24\x4D\x4D\x45........................\x4D\x4F\x46\x46\x4D\x31\x5F\x4F\x56\x4C', re.DOTALL)).search(reading) # $MME + [0x18] + MOFFM1_OVL
+					tpm_tag = image_marker('$MME TPM') # $MME + [0x18] + TPM
+					amt_tag = image_marker('$MME AMT') # $MME + [0x18] + MOFFM1_OVL
 				else :
-					tpm_tag = (re.compile(br'\x4E\x56\x54\x50\x54\x50\x49\x44')).search(reading) # NVTPTPID partition found at ALL or TPM
-					amt_tag = (re.compile(br'\x4E\x56\x43\x4D\x41\x4D\x54\x43')).search(reading) # NVCMAMTC partition found at ALL or AMT
+					tpm_tag = image_marker('NVTP') # NVTPTPID partition found at ALL or TPM
+					amt_tag = image_marker('NVCM') # NVCMAMTC partition found at ALL or AMT
 				
 				if tpm_tag is not None and amt_tag is not None :
 					sku = 'AMT + TPM' # CA_ICH9_REL_ALL_SKUs_
@@ -9734,7 +10521,7 @@ for file_in in source :
 			
 			# ME4-Only Fix 3 : The usual method to detect EXTR vs RGN does not work for ME4, KRND. not enough
 			if fw_type_fix :
-				effs_match = (re.compile(br'\x45\x46\x46\x53\x4F\x53\x49\x44')).search(reading) # EFFSOSID detection
+				effs_match = image_marker('EFFS') # EFFSOSID detection
 				if effs_match is not None :
 					(start_effs_match, end_effs_match) = effs_match.span()
 					effs_start = int.from_bytes(reading[end_effs_match:end_effs_match + 0x4], 'little')
@@ -9775,8 +10562,7 @@ for file_in in source :
 				
 			# ME5-Only Fix : Detect ROMB UPD image correctly
 			if fw_type == 'Update' :
-				byp_pat = re.compile(br'\x52\x4F\x4D\x42') # ROMB detection (ROM-Bypass)
-				byp_match = byp_pat.search(reading)
+				byp_match = image_marker('ROMB') # ROMB detection (ROM-Bypass)
 				if byp_match is not None :
 					release = 'ROM-Bypass'
 					rel_db = 'BYP'
@@ -9815,7 +10601,7 @@ for file_in in source :
 			
 			# ME6-Only Fix 1 : ME6 Ignition does not work with KRND
 			if 'Ignition' in sku and rgn_exist :
-				ign_pat = (re.compile(br'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x6D\x3C\x75\x6D')).findall(reading) # Clean $MINIFAD checksum
+				ign_pat = image_marker_all('$MINIFAD') # Clean $MINIFAD checksum
 				if len(ign_pat) < 2 : fw_type = "Region, Extracted" # 2 before NFTP & IGRT
 				else : fw_type = "Region, Stock"
 			
@@ -9924,7 +10710,7 @@ for file_in in source :
 		# Firmware Unpacking for all CSME
 		if param.me11_mod_extr :
 			cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start if rgn_exist else -1, fpt_chk_fail, cse_lt_chk_fail)
-			continue # Next input file
+			return # Next input file
 		
 		# Get CSE File System Attributes & Configuration State (invokes mfs_anl, must be before ext_anl)
 		mfs_state,mfs_parsed_idx,intel_cfg_hash_mfs,mfs_info,pch_init_final,vol_ftbl_id,config_rec_size = get_mfs_anl(mfs_state, mfs_parsed_idx, intel_cfg_hash_mfs, mfs_info, pch_init_final)
@@ -10113,7 +10899,7 @@ for file_in in source :
 	elif variant == 'TXE' : # Trusted Execution Engine
 		
 		# Detect SKU Attributes
-		sku_match = re.compile(br'\x24\x53\x4B\x55[\x03-\x04]\x00\x00\x00').search(reading[start_man_match:]) # $SKU detection
+		sku_match = re.compile(br'\x24\x53\x4B\x55[\x03-\x04]\x00\x00\x00').search(memoryview(reading)[start_man_match:]) # $SKU detection
 		if sku_match is not None :
 			(start_sku_match, end_sku_match) = sku_match.span()
 			start_sku_match += start_man_match
@@ -10160,7 +10946,7 @@ for file_in in source :
 		# Firmware Unpacking for all CSTXE
 		if param.me11_mod_extr :
 			cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start if rgn_exist else -1, fpt_chk_fail, cse_lt_chk_fail)
-			continue # Next input file
+			return # Next input file
 		
 		# Get CSE File System Attributes & Configuration State (invokes mfs_anl, must be before ext_anl)
 		mfs_state,mfs_parsed_idx,intel_cfg_hash_mfs,mfs_info,pch_init_final,vol_ftbl_id,config_rec_size = get_mfs_anl(mfs_state, mfs_parsed_idx, intel_cfg_hash_mfs, mfs_info, pch_init_final)
@@ -10225,7 +11011,7 @@ for file_in in source :
 	elif variant == 'SPS' : # Server Platform Services
 		
 		if major == 1 and not rgn_exist :
-			sps1_rec_match = re.compile(br'\x45\x70\x73\x52\x65\x63\x6F\x76\x65\x72\x79').search(reading[start_man_match:]) # EpsRecovery detection
+			sps1_rec_match = re.compile(br'\x45\x70\x73\x52\x65\x63\x6F\x76\x65\x72\x79').search(memoryview(reading)[start_man_match:]) # EpsRecovery detection
 			if sps1_rec_match : fw_type = 'Recovery'
 			else : fw_type = 'Operational'
 		
@@ -10253,7 +11039,7 @@ for file_in in source :
 		# Firmware Unpacking for all CSSPS
 		if param.me11_mod_extr :
 			cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start if rgn_exist else -1, fpt_chk_fail, cse_lt_chk_fail)
-			continue # Next input file
+			return # Next input file
 		
 		# Get CSE File System Attributes & Configuration State (invokes mfs_anl, must be before ext_anl)
 		mfs_state,mfs_parsed_idx,intel_cfg_hash_mfs,mfs_info,pch_init_final,vol_ftbl_id,config_rec_size = get_mfs_anl(mfs_state, mfs_parsed_idx, intel_cfg_hash_mfs, mfs_info, pch_init_final)
@@ -10308,7 +11094,7 @@ for file_in in source :
 		# Firmware Unpacking for all PMC
 		if param.me11_mod_extr :
 			cse_unpack(variant, fpt_part_all, bpdt_part_all, file_end, fpt_start if rgn_exist else -1, fpt_chk_fail, cse_lt_chk_fail)
-			continue # Next input file
+			return # Next input file
 		
 		# Detect CSE Firmware Attributes
 		cpd_offset,cpd_mod_attr,cpd_ext_attr,vcn,ext12_info,ext_print,ext_pname,ext32_info,ext_phval,ext_dnx_val,oem_config,oem_signed,cpd_mn2_info,ext_iunit_val,arb_svn \
@@ -10374,14 +11160,15 @@ for file_in in source :
 		name_db = '%s_%s_%s_%s_%s' % (fw_ver(major,minor,hotfix,build), sku_db, rel_db, type_db, rsa_sig_hash)
 		name_db_p = '%s_%s_%s_%s' % (fw_ver(major,minor,hotfix,build), sku_db, rel_db, type_db)
 	
+	mea_result.variant, mea_result.version, mea_result.name_db = variant_p, fw_ver(major,minor,hotfix,build), name_db
+	
 	if param.db_print_new :
 		with open(os.path.join(mea_dir, 'MEA_DB_NEW.txt'), 'a', encoding = 'utf-8') as db_file : db_file.write(name_db + '\n')
-		continue # Next input file
+		return # Next input file
 	
 	# Search Database for firmware
 	if not variant.startswith('PMC') and not wcod_found : # Not PMC or Partial Update
-		fw_db = db_open()
-		for line in fw_db :
+		for line in mea_db.get_lines(rsa_sig_hash) : # All checks below require rsa_sig_hash (name_db ends with it)
 			# Search the re-created file name without extension at the database
 			if name_db in line : fw_in_db_found = True # Known firmware, nothing new
 			if rsa_sig_hash in line and type_db == 'EXTR' and ('_RGN_' in line or '_EXTR-Y_' in line) :
@@ -10393,13 +11180,14 @@ for file_in in source :
 				rgn_over_extr_found = True # Same RGN/EXTR firmware found at database, UPD disregarded
 			if rsa_sig_hash in line and (variant,type_db,sku_stp) == ('CSSPS','REC','NaN') :
 				fw_in_db_found = True # REC w/o $FPT are not POR for CSSPS, notify only if REC w/ $FPT does not exist
-		fw_db.close()
 	else :
 		can_search_db = False # Do not search DB for PMC or Partial Update
 	
 	if can_search_db and not rgn_over_extr_found and not fw_in_db_found :
 		note_stor.append([col_g + 'Note: This %s firmware was not found at the database, please report it!' % variant_p + col_e, True])
 	
+	mea_result.db_found = fw_in_db_found or rgn_over_extr_found
+	
 	# Check if firmware is updated, Production only
 	if release == 'Production' and not wcod_found : # Does not display if firmware is non-Production or Partial Update
 		if not variant.startswith(('SPS','CSSPS','PMCAPL','PMCBXT','PMCGLK')) : # (CS)SPS and old PMC excluded
@@ -10415,7 +11203,7 @@ for file_in in source :
 		elif os.path.basename(file_in) == name_db_p + '.bin' : pass
 		else : print(col_r + 'Error: A file with the same name already exists!' + col_e)
 		
-		continue # Next input file
+		return # Next input file
 	
 	# UEFI Strip Integration
 	if param.extr_mea :
@@ -10427,7 +11215,7 @@ for file_in in source :
 	elif not param.print_msg :
 		print()
 		msg_pt = ext_table(['Field', 'Value'], False, 1)
-		msg_pt.title = col_c + '%s (%d/%d)' % (os.path.basename(file_in)[:45], cur_count, in_count) + col_e
+		msg_pt.title = col_c + mea_title(file_in) + col_e
 		
 		msg_pt.add_row(['Family', variant_p])
 		msg_pt.add_row(['Version', fw_ver(major,minor,hotfix,build)])
@@ -10487,7 +11275,9 @@ for file_in in source :
 		
 		if variant not in ['SPS','CSSPS'] and upd_rslt != '' : msg_pt.add_row(['Latest', upd_rslt])
 		
-		print(msg_pt)
+		print_title(msg_pt)
+		
+		mea_result.info = pt_dict(msg_pt)
 		
 		if param.write_html :
 			with open('%s.html' % os.path.basename(file_in), 'w') as o : o.write('\n<br/>\n%s' % pt_html(msg_pt))
@@ -10518,6 +11308,8 @@ for file_in in source :
 			
 			print(msg_pmc_pt)
 			
+			mea_result.info_pmc = pt_dict(msg_pmc_pt)
+			
 			if param.write_html :
 				with open('%s.html' % os.path.basename(file_in), 'a') as o : o.write('\n<br/>\n%s' % pt_html(msg_pmc_pt))
 				
@@ -10544,6 +11336,8 @@ for file_in in source :
 		if param.write_json :
 			msg_entries['Entry %0.4d' % msg_idx] = ansi_escape.sub('', str(msg_stor[msg_idx][0]))
 	
+	mea_result.messages = [ansi_escape.sub('', str(msg[0])) for msg in msg_stor]
+	
 	if param.write_json :
 		msg_dict['Messages'] = msg_entries
 		with open('%s.json' % os.path.basename(file_in), 'a') as o : o.write('\n%s' % json.dumps(msg_dict, indent=4))
@@ -10553,5 +11347,349 @@ for file_in in source :
 	
 	# Show MEA help screen only once
 	if param.help_scr : mea_exit(0)
+
+# Get Result Cache path of Engine firmware image, when its analysis only prints (no -unp86, -html, -pdb etc)
+def result_cache_path(image_data) :
+	if not param.res_cache : return None
+	
+	if param.me11_mod_extr or param.me11_mod_bug or param.write_html or param.write_json or param.db_print_new or param.give_db_name \
+	or param.extr_mea or param.print_msg or param.mfs_ftbl or param.help_scr : return None
+	
+	image_hash = hashlib.sha256(image_data).hexdigest().upper()
+	
+	# Other options which change the printed analysis (-dfpt, -ver86) keep separate results
+	image_key = image_hash + ('_DFPT' if param.fpt_disp else '') + ('_VER86' if param.me11_mod_ext else '')
+	
+	return os.path.join(param.res_cache, image_hash[:2], '%s.json' % image_key)
+
+# Load cached analysis result of Engine firmware image, if it was stored by the same MEA version
+# After a DB upgrade, the result is kept when all DB searches of its analysis (RSA Signature/Key Hashes, DB Name,
+# Latest SKU Keys etc) still find the same DB lines, as the analysis depends on the DB only via these searches
+def result_cache_load(cache_path) :
+	try :
+		with open(cache_path, 'r', encoding = 'utf-8') as cache_file : cache_data = json.load(cache_file)
+	except :
+		return None # Result is missing or corrupted
+	
+	if cache_data['key'][0] != title : return None # MEA was upgraded
+	
+	if cache_data['key'][1] != mea_db.rev :
+		for text,db_lines in cache_data['queries'].items() :
+			if mea_db.find_lines(text) != db_lines : return None # DB upgrade affects the result
+		
+		cache_data['key'][1] = mea_db.rev
+		
+		result_cache_write(cache_path, cache_data) # Result is valid for the current DB Revision as well
+	
+	return cache_data
+
+# Store analysis result of Engine firmware image, along with its DB searches
+def result_cache_save(cache_path, cache_title, cache_output, cache_tables, cache_queries) :
+	cache_data = {'key': [title, mea_db.rev], 'title': cache_title, 'output': cache_output, 'tables': cache_tables, 'result': vars(mea_result),
+				  'err_stor': err_stor, 'warn_stor': warn_stor, 'note_stor': note_stor, 'queries': cache_queries}
+	
+	result_cache_write(cache_path, cache_data)
+
+# Write Result Cache file, ignore failures (i.e. read-only location)
+def result_cache_write(cache_path, cache_data) :
+	cache_temp = cache_path + '.%d' % os.getpid()
+	
+	try :
+		os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+		with open(cache_temp, 'w', encoding = 'utf-8') as cache_file : json.dump(cache_data, cache_file)
+		os.replace(cache_temp, cache_path) # Atomic, for concurrent MEA instances
+	except :
+		if os.path.isfile(cache_temp) : os.remove(cache_temp)
+
+# Build title table of cached output, for the current input file name & count
+def result_cache_title(table_data, old_title, new_title) :
+	field_names, header, pt_title, rows = table_data
+	
+	pt = ext_table(field_names, header, 1)
+	if pt_title : pt.title = new_title if pt_title == old_title else pt_title
+	
+	for row in rows : pt.add_row([new_title if cell == old_title else cell for cell in row])
+	
+	return pt
+
+# Analyze Engine firmware image, or show its cached result when -cache has it for the same MEA version & DB answers
+def mea_analyze_cached(image_name, image_data) :
+	global err_stor, file_in, mea_result, note_stor, reading, warn_stor
+	
+	cache_path = result_cache_path(image_data)
+	
+	if not cache_path : return mea_analyze(image_name, image_data)
+	
+	cache_data = result_cache_load(cache_path)
+	cache_title = col_c + mea_title(image_name) + col_e
+	
+	if cache_data :
+		file_in, reading = image_name, image_data
+		err_stor, warn_stor, note_stor = cache_data['err_stor'], cache_data['warn_stor'], cache_data['note_stor']
+		
+		mea_result = MEA_Result(image_name)
+		mea_result.__dict__.update(cache_data['result'])
+		mea_result.name = image_name
+		
+		for piece,table_data in itertools.zip_longest(cache_data['output'], cache_data['tables']) :
+			print(piece, end='')
+			if table_data : print(result_cache_title(table_data, cache_data['title'], cache_title))
+		
+		copy_on_msg() # Copy input in case of messages, as the analysis would
+		
+		return
+	
+	image_output = Output_Tee(sys.stdout)
+	mea_db.queries = {}
+	
+	try :
+		with contextlib.redirect_stdout(image_output) : mea_analyze(image_name, image_data)
+	finally :
+		cache_queries, mea_db.queries = mea_db.queries, None
+	
+	result_cache_save(cache_path, cache_title, image_output.get_pieces(), image_output.tables, cache_queries)
+
+# Analyze Engine firmware image without prompts, printed output is stored at the result
+def mea_analyze_output(image_name, image_data, image_param, image_count, image_total) :
+	global param, cur_count, in_count
+	
+	param = image_param
+	param.skip_intro = True
+	param.skip_pause = True
+	cur_count, in_count = image_count, image_total
+	
+	image_output = io.StringIO()
+	
+	try :
+		with contextlib.redirect_stdout(image_output) : mea_analyze_cached(image_name, image_data)
+	except SystemExit as exit_code :
+		mea_result.exit_code = exit_code.code # MEA exited early (i.e. -ftbl)
+	finally :
+		report_flush() # Store any Report Files of an interrupted CSE Unpacking
+	
+	mea_result.output = image_output.getvalue()
+	
+	return mea_result
+
+# Analyze Engine firmware image data, for use of MEA as a library
+# Options are MEA parameters (i.e. ['-dfpt']), Name is shown at the output and used for any generated files
+# Reports Memory keeps the -unp86 Report Files (txt/html/json) at the result's reports instead of writing them
+def analyze_image(data, options=None, name='image.bin', reports_memory=False) :
+	global param, cur_count, in_count
+	
+	image_data = data if isinstance(data, (bytes, mmap.mmap)) else bytes(data) # Slices must be bytes
+	image_param = MEA_Param(mea_os, options or [])
+	image_param.report_memory = reports_memory
+	image_param.library = True
+	
+	param_prev = param, cur_count, in_count
+	
+	try :
+		image_result = mea_analyze_output(name, image_data, image_param, 1, 1)
+	finally :
+		param, cur_count, in_count = param_prev # Restore the caller's MEA Parameters
+	
+	image_result.output = ansi_escape.sub('', image_result.output)
+	
+	return image_result
+
+# Initialize -jobs worker process
+def mea_job_init() :
+	global huffman_pool, huffman_pool_fork
+	
+	huffman_pool_fork = False # Input files are already spread across processes
+	huffman_pool = None # Inherited from the main process, not usable here
+	
+	# Load Huffman Dictionaries once per worker
+	for dict_variant, dict_major in [('CSME', 11), ('CSME', 12)] : cse_huffman_dictionary_load(dict_variant, dict_major, 'none')
+
+# Analyze Engine firmware file at a -jobs worker process, its output is printed by the main process
+def mea_job(file_in, file_count, file_total, job_param) :
+	try :
+		with open(file_in, 'rb') as in_file : job_data = mea_input(in_file)
+		
+		return mea_analyze_output(file_in, job_data, job_param, file_count, file_total).output
+	except Exception :
+		return col_r + '\nError: ME Analyzer crashed at %s, please report the following:\n\n%s' % (file_in, traceback.format_exc()) + col_e + '\n'
+
+# Get existing input files & their count, in input order
+def mea_input_files(source) :
+	file_count = 0
+	
+	for file_in in source :
+		file_count += 1
+		
+		if not os.path.isfile(file_in) :
+			if any(p in file_in for p in param.val) : continue # Next input file
+			
+			print(col_r + '\nError: File %s was not found!' % file_in + col_e)
+			
+			if not param.mass_scan : mea_exit(1)
+			else : continue
+		
+		yield file_in, file_count
+
+# Analyze Engine firmware file alone at a new -jobs worker process, None if the worker crashes
+def mea_job_alone(file_in, file_count, jobs_param) :
+	pool = concurrent.futures.ProcessPoolExecutor(1, initializer=mea_job_init)
+	
+	try :
+		return pool.submit(mea_job, file_in, file_count, in_count, jobs_param).result()
+	except concurrent.futures.process.BrokenProcessPool :
+		return None
+	finally :
+		pool.shutdown(wait=False)
+
+# Analyze Engine firmware files at -jobs worker processes, outputs are printed in input order
+# Files which were unfinished when a worker crashed are retried one at a time, each at its own worker process,
+# so that only a file which crashes a worker by itself is skipped
+def mea_jobs(jobs_input, jobs_param) :
+	jobs_window = jobs_param.jobs_count * 4 # Files in flight, their outputs are kept until printed
+	jobs_pending = collections.deque()
+	jobs_input = iter(jobs_input) # Streamed -mass input files are found while others are analyzed
+	jobs_next = next(jobs_input, None)
+	
+	pool = concurrent.futures.ProcessPoolExecutor(jobs_param.jobs_count, initializer=mea_job_init)
+	
+	while jobs_next or jobs_pending :
+		while jobs_next and len(jobs_pending) < jobs_window :
+			file_in, file_count = jobs_next
+			jobs_pending.append([file_in, file_count, pool.submit(mea_job, file_in, file_count, in_count, jobs_param)])
+			jobs_next = next(jobs_input, None)
+		
+		file_in, file_count, job_future = jobs_pending.popleft()
+		
+		# Retry of a file which was unfinished when a worker crashed
+		if job_future is None :
+			job_output = mea_job_alone(file_in, file_count, jobs_param)
+			
+			if job_output is None : print(col_r + '\nError: ME Analyzer worker process crashed at %s!' % file_in + col_e)
+			else : print(job_output, end='')
+			
+			continue
+		
+		try :
+			print(job_future.result(), end='')
+		except concurrent.futures.process.BrokenProcessPool :
+			pool.shutdown(wait=False)
+			pool = concurrent.futures.ProcessPoolExecutor(jobs_param.jobs_count, initializer=mea_job_init)
+			
+			jobs_pending.appendleft([file_in, file_count, None])
+			
+			# Retry all unfinished files alone, any of them may have crashed the worker
+			for job in jobs_pending :
+				if job[2] is None or (job[2].done() and not job[2].cancelled() and job[2].exception() is None) : continue # Finished before the crash
+				job[2] = None
+	
+	pool.shutdown()
+
+if __name__ == '__main__' :
+	# Let -jobs worker processes of frozen (PyInstaller) MEA executables start as workers, not as new MEA instances
+	multiprocessing.freeze_support()
+	
+	# Get MEA Parameters from input
+	param = MEA_Param(mea_os, sys.argv)
+	
+	# Enumerate parameter input
+	arg_num = len(sys.argv)
+	
+	# Actions for MEA but not UEFIStrip
+	if not param.extr_mea and not param.print_msg :
+		# Pause after any unexpected python exception
+		sys.excepthook = show_exception_and_exit
+		
+		# Set console/shell window title
+		if mea_os == 'win32' : ctypes.windll.kernel32.SetConsoleTitleW(title)
+		elif mea_os.startswith('linux') or mea_os == 'darwin' : sys.stdout.write('\x1b]2;' + title + '\x07')
+	
+	if not param.skip_intro :
+		mea_hdr(db_rev)
+		
+		print("\nWelcome to Intel Engine Firmware Analysis Tool\n")
+		
+		if arg_num == 2 :
+			print("Press Enter to skip or input -? to list options\n")
+			print("\nFile:       " + col_g + "%s" % os.path.basename(sys.argv[1]) + col_e)
+		elif arg_num > 2 :
+			print("Press Enter to skip or input -? to list options\n")
+			print("\nFiles:       " + col_y + "Multiple" + col_e)
+		else :
+			print('Input a file name/path or press Enter to list options\n')
+			print("\nFile:       " + col_m + "None" + col_e)
+		
+		input_var = input('\nOption(s):  ')
+		
+		# Anything quoted ("") is taken as one (file paths etc)
+		input_var = re.split(''' (?=(?:[^'"]|'[^']*'|"[^"]*")*$)''', input_var.strip())
+		
+		# Get MEA Parameters based on given Options
+		param = MEA_Param(mea_os, input_var)
+		
+		# Non valid parameters are treated as files
+		if input_var[0] != "" :
+			for i in input_var:
+				if i not in param.val :
+					sys.argv.append(i.strip('"'))
+		
+		# Re-enumerate parameter input
+		arg_num = len(sys.argv)
+		
+		os.system(cl_wipe)
+		
+		mea_hdr(db_rev)
+	
+	elif not param.extr_mea and not param.print_msg :
+		mea_hdr(db_rev)
+	
+	if (arg_num < 2 and not param.help_scr and not param.mass_scan) or param.help_scr :
+		mea_help()
+	
+	# Verify that -size bounds are valid
+	if param.mass_size is None :
+		print(col_r + '\nError: Invalid -size bounds %s, expected A:B, A: or :B bytes!' % param.size_arg + col_e)
+		mea_exit(1)
+	
+	if param.mass_scan :
+		in_path = param.mass_arg or input('\nEnter the full folder path : ')
+		source = mass_scan(in_path)
+	else :
+		source = sys.argv[1:] # Skip script/executable
+	
+	# Verify that DB exists
+	if not depend_db :
+		print(col_r + '\nError: MEA.dat file is missing!' + col_e)
+		mea_exit(1)
+	
+	# Initialize file input, the count of a streamed -mass folder (-mass D) is unknown
+	cur_count = 0
+	in_count = 0
+	
+	if isinstance(source, list) :
+		# Option values (-jobs, -store, -cache, -size, -ext, -noext) are not input files
+		for arg in [param.jobs_arg, param.store_arg, param.cache_arg, param.size_arg, param.ext_arg, param.noext_arg] :
+			if arg in source : source.remove(arg)
+		
+		in_count = len(source)
+		for arg in source :
+			if arg in param.val : in_count -= 1
+	
+	# Analyze input files at parallel processes, unless MEA must prompt or stop at the first file
+	jobs_mode = param.jobs_count > 1 and not (param.extr_mea or param.print_msg or param.me11_mod_bug or param.help_scr or param.mfs_ftbl)
+	
+	# Analyze at -jobs worker processes, after all input files are checked (unless streamed)
+	if jobs_mode :
+		jobs_input = mea_input_files(source)
+		if isinstance(source, list) : jobs_input = list(jobs_input)
+		
+		mea_jobs(jobs_input, param)
+	
+	else :
+		for file_in, cur_count in mea_input_files(source) :
+			with open(file_in, 'rb') as in_file : reading = mea_input(in_file)
+			
+			try :
+				mea_analyze_cached(file_in, reading)
+			finally :
+				report_flush() # Store any Report Files of an interrupted CSE Unpacking
 	
-mea_exit(0)
+	mea_exit(0)
\ No newline at end of file